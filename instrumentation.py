@@ -0,0 +1,454 @@
+"""
+WOA7001 Group Project - Shared Instrumentation
+Fixed-Memory Histograms and Phase Timers for the Routing and MST Engines
+
+Every engine owns a MetricsRegistry labelled with its engine name. Values
+(query latency, nodes explored, heap pushes/pops, phase durations) go into
+log-bucketed histograms of fixed size, so a long-running engine never grows
+its statistics, and percentiles are answered by one walk over the buckets.
+
+Recording can be switched off globally with set_enabled(False) or per
+registry with registry.enabled = False; a disabled observe() returns at
+once and a disabled phase() hands back a shared no-op context manager.
+
+Live registries can be exported together as JSON or in the Prometheus text
+exposition format:
+
+    python instrumentation.py            # demo run of both formats
+"""
+
+import json
+import math
+import time
+import weakref
+from typing import Dict, Iterable, List, Optional
+
+
+# Global recording switch, see set_enabled
+ENABLED = True
+
+# Percentiles reported by snapshots and summaries
+SNAPSHOT_PERCENTILES = (50, 90, 99)
+
+
+def set_enabled(enabled: bool):
+    """
+    Switch recording on or off for all registries.
+
+    Args:
+        enabled: False turns observe() and phase() into no-ops
+    """
+    global ENABLED
+    ENABLED = enabled
+
+
+class LogHistogram:
+    """
+    Histogram with logarithmically spaced buckets.
+
+    Bucket 0 holds values below min_value (zero included), the last bucket
+    holds values of max_value and above; in between, each decade is split
+    into buckets_per_decade buckets, so a percentile is off by at most
+    10 ** (1 / buckets_per_decade) - 1 (about 7.5% by default). Count,
+    sum, minimum and maximum are exact. The default range covers both
+    nanosecond timings and counts up to a trillion in 674 buckets.
+    """
+
+    def __init__(self, min_value: float = 1e-9, max_value: float = 1e12,
+                 buckets_per_decade: int = 32):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            min_value: Lower bound of the first log bucket
+            max_value: Upper bound of the last log bucket
+            buckets_per_decade: Resolution of the buckets
+        """
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_decade = buckets_per_decade
+        self._scale = buckets_per_decade / math.log(10)
+        self.num_buckets = int(math.ceil(math.log10(max_value / min_value)
+                                         * buckets_per_decade)) + 2
+        self.counts = [0] * self.num_buckets
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def record(self, value: float):
+        """
+        Add one value.
+
+        Args:
+            value: Observed value (non-negative)
+        """
+        if value < self.min_value:
+            bucket = 0
+        else:
+            bucket = min(int(math.log(value / self.min_value) * self._scale) + 1,
+                         self.num_buckets - 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def upper_bound(self, bucket: int) -> float:
+        """
+        Get the upper bound of a bucket.
+
+        Args:
+            bucket: Bucket index
+
+        Returns:
+            Upper bound (inf for the overflow bucket)
+        """
+        if bucket >= self.num_buckets - 1:
+            return math.inf
+        return self.min_value * 10 ** (bucket / self.buckets_per_decade)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile in O(buckets).
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, clamped to the
+            observed range (0.0 for an empty histogram)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(max(self.upper_bound(bucket), self.min), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """Get the exact mean (0.0 for an empty histogram)."""
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LogHistogram"):
+        """
+        Add the values of a histogram with the same bucket layout.
+
+        Args:
+            other: Histogram to merge in
+        """
+        if (other.min_value, other.max_value, other.buckets_per_decade) != \
+                (self.min_value, self.max_value, self.buckets_per_decade):
+            raise ValueError("Histograms have different bucket layouts")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get count, sum, mean, min, max and the snapshot percentiles.
+
+        Returns:
+            Dictionary of summary values
+        """
+        summary = {"count": self.count, "sum": self.total, "mean": self.mean(),
+                   "min": self.min if self.count else 0.0,
+                   "max": self.max if self.count else 0.0}
+        for q in SNAPSHOT_PERCENTILES:
+            summary[f"p{q}"] = self.percentile(q)
+        return summary
+
+
+class _PhaseTimer:
+    """Context manager recording its duration (seconds) into a histogram."""
+
+    __slots__ = ("registry", "name", "start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.registry.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullPhase:
+    """Shared no-op context manager handed out while recording is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+# Every registry still referenced, for exports without an explicit list
+_REGISTRIES = weakref.WeakSet()
+
+
+class MetricsRegistry:
+    """
+    Named histograms and counters of one engine.
+
+    Histograms are created on first use. Phase timers record seconds into
+    "phase_<name>_seconds" histograms.
+    """
+
+    def __init__(self, engine: str, enabled: bool = True):
+        """
+        Initialize an empty registry.
+
+        Args:
+            engine: Engine name, exported as the "engine" label
+            enabled: Whether this registry records
+        """
+        self.engine = engine
+        self.enabled = enabled
+        self.histograms: Dict[str, LogHistogram] = {}
+        self.counters: Dict[str, float] = {}
+        _REGISTRIES.add(self)
+
+    def histogram(self, name: str) -> LogHistogram:
+        """
+        Get (or create) a histogram.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            LogHistogram
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LogHistogram()
+        return histogram
+
+    def observe(self, name: str, value: float):
+        """
+        Record a value into a histogram (no-op while disabled).
+
+        Args:
+            name: Metric name
+            value: Observed value
+        """
+        if ENABLED and self.enabled:
+            self.histogram(name).record(value)
+
+    def increment(self, name: str, amount: float = 1):
+        """
+        Increase a counter (no-op while disabled).
+
+        Args:
+            name: Counter name
+            amount: Increment
+        """
+        if ENABLED and self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def phase(self, name: str):
+        """
+        Time a block into the "phase_<name>_seconds" histogram.
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Context manager (a shared no-op one while disabled)
+        """
+        if ENABLED and self.enabled:
+            return _PhaseTimer(self, f"phase_{name}_seconds")
+        return _NULL_PHASE
+
+    def record_run(self, seconds: float, phase_times: Optional[Dict[str, float]] = None):
+        """
+        Record one run timed elsewhere (e.g. a solver's find_mst).
+
+        Args:
+            seconds: Total duration, into the "run_seconds" histogram
+            phase_times: Mapping of phase name -> seconds (solver.phase_times)
+        """
+        if ENABLED and self.enabled:
+            self.histogram("run_seconds").record(seconds)
+            for name, phase_seconds in (phase_times or {}).items():
+                self.histogram(f"phase_{name}_seconds").record(phase_seconds)
+
+    def reset(self):
+        """Drop all recorded values."""
+        self.histograms.clear()
+        self.counters.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Get a JSON-ready view of all metrics.
+
+        Returns:
+            {"engine", "histograms": {name: summary}, "counters": {name: value}}
+        """
+        return {"engine": self.engine,
+                "histograms": {name: histogram.snapshot()
+                               for name, histogram in sorted(self.histograms.items())},
+                "counters": dict(sorted(self.counters.items()))}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Export this registry as JSON."""
+        return export_json([self], indent)
+
+    def to_prometheus(self, prefix: str = "woa7001") -> str:
+        """Export this registry in the Prometheus text format."""
+        return export_prometheus([self], prefix)
+
+
+def _merge_by_engine(registries: Optional[Iterable[MetricsRegistry]]) -> List[MetricsRegistry]:
+    """
+    Combine registries of the same engine, so each engine is exported once.
+
+    Args:
+        registries: Registries to combine (default: all live registries)
+
+    Returns:
+        One registry per engine, sorted by engine name
+    """
+    if registries is None:
+        registries = list(_REGISTRIES)
+    merged: Dict[str, MetricsRegistry] = {}
+    for registry in registries:
+        target = merged.get(registry.engine)
+        if target is None:
+            target = merged[registry.engine] = MetricsRegistry.__new__(MetricsRegistry)
+            target.engine, target.enabled = registry.engine, True
+            target.histograms, target.counters = {}, {}
+        for name, histogram in registry.histograms.items():
+            if name not in target.histograms:
+                target.histograms[name] = LogHistogram(histogram.min_value, histogram.max_value,
+                                                       histogram.buckets_per_decade)
+            target.histograms[name].merge(histogram)
+        for name, value in registry.counters.items():
+            target.counters[name] = target.counters.get(name, 0) + value
+    return [merged[engine] for engine in sorted(merged)]
+
+
+def export_json(registries: Optional[Iterable[MetricsRegistry]] = None,
+                indent: Optional[int] = 2) -> str:
+    """
+    Export registries as a JSON list of snapshots, one per engine.
+
+    Args:
+        registries: Registries to export (default: all live registries)
+        indent: JSON indentation
+
+    Returns:
+        JSON text
+    """
+    return json.dumps([registry.snapshot() for registry in _merge_by_engine(registries)],
+                      indent=indent)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+def export_prometheus(registries: Optional[Iterable[MetricsRegistry]] = None,
+                      prefix: str = "woa7001") -> str:
+    """
+    Export registries in the Prometheus text exposition format.
+
+    Histograms become cumulative "_bucket" series (non-empty buckets only,
+    plus +Inf) with "_sum" and "_count". The engine is a
+    label, so engines share metric families; registries of the same engine
+    are combined into one series.
+
+    Args:
+        registries: Registries to export (default: all live registries)
+        prefix: Metric name prefix
+
+    Returns:
+        Exposition text
+    """
+    families: Dict[str, List[str]] = {}
+    types: Dict[str, str] = {}
+    for registry in _merge_by_engine(registries):
+        label = f'engine="{registry.engine}"'
+        for name, histogram in sorted(registry.histograms.items()):
+            family = f"{prefix}_{name}"
+            types[family] = "histogram"
+            lines = families.setdefault(family, [])
+            cumulative = 0
+            for bucket, count in enumerate(histogram.counts[:-1]):
+                if not count:
+                    continue
+                cumulative += count
+                le = _format_value(histogram.upper_bound(bucket))
+                lines.append(f'{family}_bucket{{{label},le="{le}"}} {cumulative}')
+            lines.append(f'{family}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{family}_sum{{{label}}} {_format_value(histogram.total)}")
+            lines.append(f"{family}_count{{{label}}} {histogram.count}")
+        for name, value in sorted(registry.counters.items()):
+            family = f"{prefix}_{name}_total"
+            types[family] = "counter"
+            families.setdefault(family, []).append(f"{family}{{{label}}} {_format_value(value)}")
+
+    output = []
+    for family in sorted(families):
+        output.append(f"# TYPE {family} {types[family]}")
+        output.extend(families[family])
+    return "\n".join(output) + "\n"
+
+
+def main():
+    """
+    Main function: instrument a Kruskal run and a synthetic query stream,
+    then print both export formats.
+    """
+    import random
+
+    from problem3_kruskal import load_delhi_city_data
+
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT")
+    print("Shared Instrumentation")
+    print("=" * 80 + "\n")
+
+    kruskal = load_delhi_city_data()
+    for _ in range(100):
+        kruskal.find_mst()
+
+    queries = MetricsRegistry(engine="synthetic_router")
+    rng = random.Random(0)
+    for _ in range(100000):
+        queries.observe("latency_ms", rng.lognormvariate(0, 1))
+        queries.increment("queries")
+
+    start_time = time.perf_counter()
+    summary = queries.histogram("latency_ms").snapshot()
+    print(f"Percentiles of 100000 latencies in {(time.perf_counter() - start_time) * 1e6:.0f} us "
+          f"({queries.histogram('latency_ms').num_buckets} buckets):")
+    print("  " + ", ".join(f"{key}={value:.3f}" for key, value in summary.items()
+                           if key not in ("count", "sum")))
+
+    print("\nJSON export:")
+    print(export_json([kruskal.metrics]))
+    print("\nPrometheus export:")
+    print(export_prometheus([kruskal.metrics, queries]))
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
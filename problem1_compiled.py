@@ -0,0 +1,176 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 1b: Compiled Greedy First-Fit (indexed constraint model)
+
+Same first-fit order as greedy_schedule (staff -> staff's days -> rooms), but
+the static compatibility checks are compiled into indexes once:
+  specialty -> staff indices, (specialty, day) -> compatible room indices
+  (specialty, day, shift) -> compatible room indices
+Names, room ids, days and shifts are interned to ints and occupancy lives in
+flat byte arrays indexed by (room | staff, day, shift).
+
+Occupancy only ever grows, so anything found busy once stays busy. Each
+specialty keeps a cursor over its (staff, day) pairs and each
+(specialty, day, shift) a cursor over its rooms; neither moves backwards,
+so every pair and room is skipped at most once. Within a pair, the first
+room of greedy_schedule is the lowest-indexed free room among the shifts
+the staff member still has free, which makes first-fit O(1) amortized per
+patient (O(shifts) per call plus cursor moves).
+"""
+
+
+class CompiledScheduleModel:
+    """
+    Interned, indexed form of a staff / room list for first-fit scheduling.
+
+    Built once per (staff, rooms); reset() clears the occupancy so the model
+    can be reused for another patient list.
+    """
+
+    def __init__(self, staff, rooms):
+        self.staff = staff
+        self.rooms = rooms
+
+        # Intern days, shifts, staff names and room ids (occupancy is keyed
+        # by name / room_id in greedy_schedule, so equal keys share a slot)
+        self.day_index = {}
+        for member in staff:
+            for day in member["available_days"]:
+                self.day_index.setdefault(day, len(self.day_index))
+        for r in rooms:
+            for day in r["available_days"]:
+                self.day_index.setdefault(day, len(self.day_index))
+        self.shift_index = {}
+        for r in rooms:
+            self.shift_index.setdefault(r["shift"], len(self.shift_index))
+        self.staff_key = {}
+        for member in staff:
+            self.staff_key.setdefault(member["name"], len(self.staff_key))
+        self.room_key = {}
+        for r in rooms:
+            self.room_key.setdefault(r["room_id"], len(self.room_key))
+
+        self.num_shifts = max(len(self.shift_index), 1)
+        self.slots_per_key = len(self.day_index) * self.num_shifts
+
+        # Per staff member: interned name slot base and day offsets in list order
+        self.staff_base = [self.staff_key[member["name"]] * self.slots_per_key for member in staff]
+        self.staff_days = [[self.day_index[day] for day in member["available_days"]] for member in staff]
+        self.room_base = [self.room_key[r["room_id"]] * self.slots_per_key for r in rooms]
+        self.room_shift = [self.shift_index[r["shift"]] for r in rooms]
+
+        # specialty -> staff indices (input order)
+        self.staff_by_specialty = {}
+        for i, member in enumerate(staff):
+            self.staff_by_specialty.setdefault(member["specialty"], []).append(i)
+
+        # (specialty, day, shift) -> compatible room indices (input order)
+        self.rooms_by_slot = {}
+        for i, r in enumerate(rooms):
+            for specialty in r["supported_specialties"]:
+                for day in r["available_days"]:
+                    key = (specialty, self.day_index[day], self.room_shift[i])
+                    rooms_for_key = self.rooms_by_slot.setdefault(key, [])
+                    if not rooms_for_key or rooms_for_key[-1] != i:
+                        rooms_for_key.append(i)
+
+        self.day_names = list(self.day_index)
+        self.reset()
+
+    def reset(self):
+        # 1 = (room | staff, day, shift) slot is taken
+        self.room_busy = bytearray(len(self.room_key) * self.slots_per_key)
+        self.staff_busy = bytearray(len(self.staff_key) * self.slots_per_key)
+        self.pair_cursors = {}
+        self.room_cursors = {}
+
+    def _pairs(self, specialty):
+        # (staff, day) pairs in greedy_schedule's order
+        for s in self.staff_by_specialty.get(specialty, ()):
+            for day in self.staff_days[s]:
+                yield s, day
+
+    def _first_free_room(self, specialty, day, shift):
+        # Lowest-indexed free room for (specialty, day, shift), or None
+        key = (specialty, day, shift)
+        rooms_for_key = self.rooms_by_slot.get(key)
+        if rooms_for_key is None:
+            return None
+        position = self.room_cursors.get(key, 0)
+        offset = day * self.num_shifts + shift
+        while position < len(rooms_for_key) and self.room_busy[self.room_base[rooms_for_key[position]] + offset]:
+            position += 1
+        self.room_cursors[key] = position
+        return rooms_for_key[position] if position < len(rooms_for_key) else None
+
+    def first_fit(self, specialty):
+        # First free (staff, day, room, room_slot, staff_slot), or None when exhausted
+        cursor = self.pair_cursors.get(specialty)
+        if cursor is None:
+            pairs = self._pairs(specialty)
+            cursor = self.pair_cursors[specialty] = [pairs, next(pairs, None)]
+
+        pairs, pair = cursor
+        while pair is not None:
+            s, day = pair
+            best = None
+            for shift in range(self.num_shifts):
+                if self.staff_busy[self.staff_base[s] + day * self.num_shifts + shift]:
+                    continue
+                r = self._first_free_room(specialty, day, shift)
+                if r is not None and (best is None or r < best):
+                    best = r
+            if best is not None:
+                cursor[1] = pair
+                offset = day * self.num_shifts + self.room_shift[best]
+                return s, day, best, self.room_base[best] + offset, self.staff_base[s] + offset
+            # Nothing free for this pair now means nothing free later either
+            pair = next(pairs, None)
+
+        cursor[1] = None
+        return None
+
+    def book(self, candidate):
+        self.room_busy[candidate[3]] = 1
+        self.staff_busy[candidate[4]] = 1
+
+
+def compiled_greedy_schedule(patients, staff, rooms, model=None):
+    """
+    Schedule patients first-fit with the same result as greedy_schedule.
+
+    Args:
+        patients: Patient dicts (patient_id, name, required_specialty)
+        staff: Staff dicts (staff_id, name, specialty, available_days)
+        rooms: Room dicts (room_id, available_days, shift, supported_specialties)
+        model: CompiledScheduleModel of staff / rooms to reuse (optional)
+
+    Returns:
+        (schedule, unscheduled patient IDs)
+    """
+    if model is None:
+        model = CompiledScheduleModel(staff, rooms)
+    else:
+        model.reset()
+
+    schedule = []
+    unscheduled = []
+
+    for patient in patients:
+        candidate = model.first_fit(patient["required_specialty"])
+        if candidate is None:
+            unscheduled.append(patient["patient_id"])
+            continue
+
+        model.book(candidate)
+        s, day, r = candidate[0], candidate[1], candidate[2]
+        schedule.append({
+            "patient_id": patient["patient_id"],
+            "patient_name": patient["name"],
+            "staff_name": staff[s]["name"],
+            "room_id": rooms[r]["room_id"],
+            "day": model.day_names[day],
+            "shift": rooms[r]["shift"]
+        })
+
+    return schedule, unscheduled
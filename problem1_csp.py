@@ -0,0 +1,340 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 2b: Constraint-Propagating Backtracking (CSP)
+
+Same (success, schedule) API as backtracking_schedule. Variables are
+patients, values are (staff, day, room, shift) slots. Patients needing the
+same specialty have the same domain, so domains are kept per specialty:
+  - MRV: branch on the specialty with the fewest live slots left
+  - forward checking: booking a slot kills every other slot sharing its
+    room or staff (day, shift) resource; a specialty whose remaining
+    patients outnumber its live slots, or the distinct staff / room
+    resources behind them, fails immediately instead of at the leaves;
+    groups of specialties sharing rooms are checked the same way (Hall's
+    condition on room and staff resources)
+  - nogoods: a failed (occupied resources, patients left per specialty)
+    state is remembered (Zobrist hash) and never searched again
+When no full schedule exists, or a node / wall-clock budget stops the
+search, the deepest partial schedule seen is returned, extended first-fit
+with the patients it left out.
+"""
+
+import random
+import time
+
+from problem1_compiled import CompiledScheduleModel
+
+
+class CSPScheduler:
+    """
+    Backtracking search with MRV, forward checking, Hall's-condition pruning
+    and nogood recording; solve() returns (success, schedule).
+    """
+
+    def __init__(self, patients, staff, rooms, max_nodes=None, time_limit=None, seed=0):
+        self.patients = patients
+        self.staff = staff
+        self.rooms = rooms
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+
+        model = CompiledScheduleModel(staff, rooms)
+        self.day_names = model.day_names
+        num_room_resources = len(model.room_key) * model.slots_per_key
+        num_resources = num_room_resources + len(model.staff_key) * model.slots_per_key
+
+        # Specialties of the patients, and their patients in input order
+        self.specialties = []
+        self.spec_index = {}
+        self.spec_patients = []
+        for i, patient in enumerate(patients):
+            spec = self.spec_index.get(patient["required_specialty"])
+            if spec is None:
+                spec = self.spec_index[patient["required_specialty"]] = len(self.specialties)
+                self.specialties.append(patient["required_specialty"])
+                self.spec_patients.append([])
+            self.spec_patients[spec].append(i)
+        num_specs = len(self.specialties)
+
+        # Slots per specialty in greedy_schedule's order, with their two
+        # resources: room (day, shift) and staff (day, shift)
+        self.slot_info = []     # (staff, day, room)
+        self.slot_spec = []
+        self.slot_room_res = []
+        self.slot_staff_res = []
+        self.spec_slots = [[] for _ in range(num_specs)]
+        for spec, specialty in enumerate(self.specialties):
+            for s in model.staff_by_specialty.get(specialty, ()):
+                for day in model.staff_days[s]:
+                    day_rooms = sorted(r for shift in range(model.num_shifts)
+                                       for r in model.rooms_by_slot.get((specialty, day, shift), ()))
+                    for r in day_rooms:
+                        offset = day * model.num_shifts + model.room_shift[r]
+                        self.spec_slots[spec].append(len(self.slot_info))
+                        self.slot_info.append((s, day, r))
+                        self.slot_spec.append(spec)
+                        self.slot_room_res.append(model.room_base[r] + offset)
+                        self.slot_staff_res.append(num_room_resources + model.staff_base[s] + offset)
+
+        # resource -> slots using it; per (specialty, resource) live slot counts
+        self.resource_slots = [[] for _ in range(num_resources)]
+        self.res_live = [dict() for _ in range(num_specs)]
+        for slot in range(len(self.slot_info)):
+            spec = self.slot_spec[slot]
+            for res in (self.slot_room_res[slot], self.slot_staff_res[slot]):
+                self.resource_slots[res].append(slot)
+                self.res_live[spec][res] = self.res_live[spec].get(res, 0) + 1
+        self.num_room_resources = num_room_resources
+
+        rng = random.Random(seed)
+        self.zobrist = [rng.getrandbits(64) for _ in range(num_resources)]
+        self.stats = {"nodes": 0, "backtracks": 0, "nogood_hits": 0, "budget_exhausted": False}
+
+    def solve(self):
+        num_specs = len(self.specialties)
+        slot_spec, slot_room_res, slot_staff_res = self.slot_spec, self.slot_room_res, self.slot_staff_res
+        resource_slots, res_live, spec_slots = self.resource_slots, self.res_live, self.spec_slots
+
+        live = bytearray([1]) * len(self.slot_info)
+        live_count = [len(slots) for slots in spec_slots]
+        staff_res_count = [sum(1 for res in counts if res >= self.num_room_resources) for counts in res_live]
+        room_res_count = [len(counts) - staff_res_count[spec] for spec, counts in enumerate(res_live)]
+        remaining = [len(p) for p in self.spec_patients]
+
+        # Which specialties still have live slots on each resource, and how
+        # many room / staff resources carry each such specialty mask
+        res_mask = {}
+        for spec, counts in enumerate(res_live):
+            for res in counts:
+                res_mask[res] = res_mask.get(res, 0) | 1 << spec
+        mask_count = [{}, {}]
+        for res, mask in res_mask.items():
+            kind = mask_count[res >= self.num_room_resources]
+            kind[mask] = kind.get(mask, 0) + 1
+
+        trail = []          # slots killed, undone in reverse
+        assignment = []     # slot per assigned patient, in assignment order
+        best = []
+        failed = set()
+        state_hash = 0
+        deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+
+        def feasible(spec):
+            need = remaining[spec]
+            return need <= live_count[spec] and need <= staff_res_count[spec] and need <= room_res_count[spec]
+
+        def hall_ok():
+            # Every group of specialties needs as many distinct room and staff
+            # resources as it has patients left (all groups while there are
+            # few specialties, otherwise just the group of all of them)
+            active = [spec for spec in range(num_specs) if remaining[spec]]
+            if len(active) <= 5:
+                groups = range(1, 1 << len(active))
+            else:
+                groups = [(1 << len(active)) - 1]
+            for kind in mask_count:
+                masks = [(mask, count) for mask, count in kind.items() if count]
+                for group in groups:
+                    group_mask = need = 0
+                    for i, spec in enumerate(active):
+                        if group >> i & 1:
+                            group_mask |= 1 << spec
+                            need += remaining[spec]
+                    if need > sum(count for mask, count in masks if mask & group_mask):
+                        return False
+            return True
+
+        def move_mask(res, old_mask, new_mask):
+            kind = mask_count[res >= self.num_room_resources]
+            kind[old_mask] -= 1
+            kind[new_mask] = kind.get(new_mask, 0) + 1
+            res_mask[res] = new_mask
+
+        def kill(slot):
+            live[slot] = 0
+            trail.append(slot)
+            spec = slot_spec[slot]
+            live_count[spec] -= 1
+            counts = res_live[spec]
+            for res in (slot_room_res[slot], slot_staff_res[slot]):
+                counts[res] -= 1
+                if counts[res] == 0:
+                    if res >= self.num_room_resources:
+                        staff_res_count[spec] -= 1
+                    else:
+                        room_res_count[spec] -= 1
+                    move_mask(res, res_mask[res], res_mask[res] & ~(1 << spec))
+
+        def revive(mark):
+            while len(trail) > mark:
+                slot = trail.pop()
+                live[slot] = 1
+                spec = slot_spec[slot]
+                live_count[spec] += 1
+                counts = res_live[spec]
+                for res in (slot_room_res[slot], slot_staff_res[slot]):
+                    if counts[res] == 0:
+                        if res >= self.num_room_resources:
+                            staff_res_count[spec] += 1
+                        else:
+                            room_res_count[spec] += 1
+                        move_mask(res, res_mask[res], res_mask[res] | 1 << spec)
+                    counts[res] += 1
+
+        def choose():
+            # MRV over specialties that still have patients
+            best_spec = None
+            for spec in range(num_specs):
+                if remaining[spec] and (best_spec is None or live_count[spec] < live_count[best_spec]):
+                    best_spec = spec
+            return best_spec
+
+        def new_frame():
+            spec = choose()
+            if spec is None:
+                return None
+            key = (state_hash, tuple(remaining))
+            return [spec, 0, len(trail), key]
+
+        frames = []
+        success = False
+        if all(feasible(spec) for spec in range(num_specs)) and hall_ok():
+            root = new_frame()
+            if root is None:
+                success = True
+            else:
+                frames.append(root)
+
+        while frames and not success:
+            frame = frames[-1]
+            spec, position, mark, key = frame
+            slots = spec_slots[spec]
+
+            if self.max_nodes is not None and self.stats["nodes"] >= self.max_nodes or \
+                    deadline is not None and time.perf_counter() > deadline:
+                self.stats["budget_exhausted"] = True
+                break
+
+            descended = False
+            if key not in failed:
+                while position < len(slots):
+                    slot = slots[position]
+                    position += 1
+                    if not live[slot]:
+                        continue
+
+                    # Book the slot, then forward check
+                    self.stats["nodes"] += 1
+                    frame[1] = position
+                    remaining[spec] -= 1
+                    assignment.append(slot)
+                    room_res, staff_res = slot_room_res[slot], slot_staff_res[slot]
+                    state_hash ^= self.zobrist[room_res] ^ self.zobrist[staff_res]
+                    touched = set()
+                    for res in (room_res, staff_res):
+                        for other in resource_slots[res]:
+                            if live[other]:
+                                kill(other)
+                                touched.add(slot_spec[other])
+
+                    if all(feasible(other) for other in touched) and hall_ok():
+                        child = new_frame()
+                        if child is None:
+                            success = True
+                        else:
+                            frames.append(child)
+                        descended = True
+                        break
+
+                    # Wipeout: undo and try the next slot
+                    revive(mark)
+                    assignment.pop()
+                    remaining[spec] += 1
+                    state_hash ^= self.zobrist[room_res] ^ self.zobrist[staff_res]
+            else:
+                self.stats["nogood_hits"] += 1
+
+            if descended:
+                continue
+
+            # Frame exhausted: remember the state, keep the deepest partial, backtrack
+            failed.add(key)
+            self.stats["backtracks"] += 1
+            if len(assignment) > len(best):
+                best = assignment[:]
+            frames.pop()
+            if frames:
+                parent_slot = assignment.pop()
+                parent_spec, _, parent_mark, _ = frames[-1]
+                revive(parent_mark)
+                remaining[parent_spec] += 1
+                state_hash ^= self.zobrist[slot_room_res[parent_slot]] ^ self.zobrist[slot_staff_res[parent_slot]]
+
+        if success:
+            return True, self._to_schedule(assignment)
+        if len(assignment) > len(best):
+            best = assignment
+        return False, self._to_schedule(self._complete_first_fit(best))
+
+    def _complete_first_fit(self, assignment):
+        # Extend a partial assignment first-fit with the patients it left out
+        taken = set()
+        for slot in assignment:
+            taken.add(self.slot_room_res[slot])
+            taken.add(self.slot_staff_res[slot])
+        left = [len(p) for p in self.spec_patients]
+        for slot in assignment:
+            left[self.slot_spec[slot]] -= 1
+
+        completed = list(assignment)
+        for spec, slots in enumerate(self.spec_slots):
+            for slot in slots:
+                if not left[spec]:
+                    break
+                room_res, staff_res = self.slot_room_res[slot], self.slot_staff_res[slot]
+                if room_res in taken or staff_res in taken:
+                    continue
+                taken.add(room_res)
+                taken.add(staff_res)
+                completed.append(slot)
+                left[spec] -= 1
+        return completed
+
+    def _to_schedule(self, slots):
+        # Patients of a specialty take its slots in input order
+        taken = [0] * len(self.specialties)
+        booked = []
+        for slot in slots:
+            spec = self.slot_spec[slot]
+            booked.append((self.spec_patients[spec][taken[spec]], slot))
+            taken[spec] += 1
+        booked.sort()
+
+        schedule = []
+        for patient_index, slot in booked:
+            patient = self.patients[patient_index]
+            s, day, r = self.slot_info[slot]
+            schedule.append({
+                "patient_id": patient["patient_id"],
+                "patient_name": patient["name"],
+                "staff_name": self.staff[s]["name"],
+                "room_id": self.rooms[r]["room_id"],
+                "day": self.day_names[day],
+                "shift": self.rooms[r]["shift"]
+            })
+        return schedule
+
+
+def csp_backtracking_schedule(patients, staff, rooms, max_nodes=None, time_limit=None):
+    """
+    Constraint-propagating drop-in for backtracking_schedule.
+
+    Args:
+        patients, staff, rooms: As for backtracking_schedule
+        max_nodes: Search node budget (None: unlimited)
+        time_limit: Wall-clock budget in seconds (None: unlimited)
+
+    Returns:
+        (success, schedule); without success, the best partial schedule
+    """
+    return CSPScheduler(patients, staff, rooms, max_nodes, time_limit).solve()
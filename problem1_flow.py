@@ -0,0 +1,236 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 3: Optimal Scheduling via Min-Cost Max-Flow
+
+Scheduling is an assignment of patients to (staff, day, shift, room) slots,
+but a plain patient -> slot matching can double-book a staff member or a
+room, since every slot uses both a staff (day, shift) and a room
+(day, shift). Patients needing the same specialty are interchangeable, and
+so are the staff of a specialty and the rooms of a type inside one
+(day, shift) cell. The compatibility graph therefore collapses to a small
+flow network:
+
+  source -> specialty                   cap = patients (one edge per priority, cost = -priority)
+  specialty -> (day, shift, specialty)  cap = staff of the specialty working that day
+  (day, shift, specialty) -> (day, shift, room type)  if the room type supports the specialty
+  (day, shift, room type) -> sink       cap = rooms of the type open that day on that shift
+
+A room type is the set of specialties a room supports on that day and
+shift; a room_id listed in several room entries counts once, supporting
+the specialties of all of them (as in greedy_schedule).
+
+A min-cost max-flow schedules as many patients as possible (optimal, unlike
+first-fit) and, among those, maximises the total "priority" (optional patient
+field, default 0). Flows are then expanded back into concrete staff and rooms.
+
+Staff capacity is counted per (day, specialty), so optimality assumes each
+staff name belongs to one specialty. A name listed under two specialties
+gets capacity in both; flow it cannot realise is dropped on expansion and
+the patients left over are placed first-fit into the staff / rooms still
+free, so the schedule stays valid but may no longer be optimal.
+"""
+
+from collections import deque
+
+
+class MinCostFlow:
+    """
+    Min-cost max-flow by successive shortest paths (SPFA, negative costs allowed).
+    """
+
+    def __init__(self):
+        self.graph = []     # node -> [edge index]
+        self.edges = []     # [to, residual capacity, cost]; edge i ^ 1 is its reverse
+
+    def add_node(self):
+        self.graph.append([])
+        return len(self.graph) - 1
+
+    def add_edge(self, u, v, capacity, cost=0):
+        self.graph[u].append(len(self.edges))
+        self.edges.append([v, capacity, cost])
+        self.graph[v].append(len(self.edges))
+        self.edges.append([u, 0, -cost])
+        return len(self.edges) - 2
+
+    def flow_on(self, edge):
+        return self.edges[edge ^ 1][1]
+
+    def solve(self, source, sink):
+        # Successive shortest paths (Bellman-Ford / SPFA: costs may be negative)
+        total_flow = total_cost = 0
+        num_nodes = len(self.graph)
+        while True:
+            dist = [float("inf")] * num_nodes
+            parent_edge = [-1] * num_nodes
+            in_queue = [False] * num_nodes
+            dist[source] = 0
+            queue = deque([source])
+            while queue:
+                u = queue.popleft()
+                in_queue[u] = False
+                for e in self.graph[u]:
+                    v, capacity, cost = self.edges[e]
+                    if capacity > 0 and dist[u] + cost < dist[v]:
+                        dist[v] = dist[u] + cost
+                        parent_edge[v] = e
+                        if not in_queue[v]:
+                            in_queue[v] = True
+                            queue.append(v)
+            if dist[sink] == float("inf"):
+                return total_flow, total_cost
+
+            # Push the bottleneck along the path
+            push = float("inf")
+            v = sink
+            while v != source:
+                e = parent_edge[v]
+                push = min(push, self.edges[e][1])
+                v = self.edges[e ^ 1][0]
+            v = sink
+            while v != source:
+                e = parent_edge[v]
+                self.edges[e][1] -= push
+                self.edges[e ^ 1][1] += push
+                v = self.edges[e ^ 1][0]
+            total_flow += push
+            total_cost += push * dist[sink]
+
+
+def flow_schedule(patients, staff, rooms):
+    """
+    Schedule as many patients as possible, highest priority first.
+
+    The result is optimal when every staff name belongs to a single
+    specialty (see the module docstring).
+
+    Args:
+        patients: Patient dicts; an optional "priority" field (default 0)
+            decides who is left out when not everyone fits
+        staff, rooms: As for greedy_schedule
+
+    Returns:
+        (schedule, unscheduled patient IDs)
+    """
+    network = MinCostFlow()
+    source, sink = network.add_node(), network.add_node()
+
+    # Patients per specialty, highest priority first (then input order)
+    spec_patients = {}
+    for i, patient in enumerate(patients):
+        spec_patients.setdefault(patient["required_specialty"], []).append(i)
+    spec_node = {}
+    for specialty, members in spec_patients.items():
+        members.sort(key=lambda i: (-patients[i].get("priority", 0), i))
+        spec_node[specialty] = network.add_node()
+        priorities = {}
+        for i in members:
+            priority = patients[i].get("priority", 0)
+            priorities[priority] = priorities.get(priority, 0) + 1
+        for priority, count in priorities.items():
+            network.add_edge(source, spec_node[specialty], count, -priority)
+
+    # Staff names per (day, specialty) and room ids per (day, shift, room type),
+    # in input order; bookings are keyed by name / room_id as in greedy_schedule
+    days, shifts = [], []
+    staff_pool = {}
+    for member in staff:
+        for day in member["available_days"]:
+            if day not in days:
+                days.append(day)
+            names = staff_pool.setdefault((day, member["specialty"]), [])
+            if member["name"] not in names:
+                names.append(member["name"])
+    room_support = {}   # (room_id, day, shift) -> specialties of all its entries
+    for r in rooms:
+        if r["shift"] not in shifts:
+            shifts.append(r["shift"])
+        for day in r["available_days"]:
+            support = room_support.setdefault((r["room_id"], day, r["shift"]), [])
+            support.extend(specialty for specialty in r["supported_specialties"] if specialty not in support)
+    room_pool = {}
+    for (room_id, day, shift), support in room_support.items():
+        room_pool.setdefault((day, shift, tuple(support)), []).append(room_id)
+
+    # One (day, shift) cell at a time: specialty -> room type edges
+    cell_edges = []     # (edge, day, shift, specialty, room type)
+    staff_node = {}
+    for (day, shift, room_type), room_ids in room_pool.items():
+        type_node = network.add_node()
+        network.add_edge(type_node, sink, len(room_ids))
+        for specialty in room_type:
+            names = staff_pool.get((day, specialty))
+            if specialty not in spec_node or not names:
+                continue
+            key = (day, shift, specialty)
+            if key not in staff_node:
+                staff_node[key] = network.add_node()
+                network.add_edge(spec_node[specialty], staff_node[key], len(names))
+            edge = network.add_edge(staff_node[key], type_node, len(room_ids))
+            cell_edges.append((edge, day, shift, specialty, room_type))
+
+    network.solve(source, sink)
+
+    # Expand flows into concrete (staff, room) pairs
+    day_order = {day: i for i, day in enumerate(days)}
+    shift_order = {shift: i for i, shift in enumerate(shifts)}
+    booked_staff, booked_rooms = set(), set()
+    slots = {specialty: [] for specialty in spec_patients}
+    dropped = False
+    for edge, day, shift, specialty, room_type in cell_edges:
+        amount = network.flow_on(edge)
+        names = iter(staff_pool[(day, specialty)])
+        room_ids = iter(room_pool[(day, shift, room_type)])
+        for _ in range(amount):
+            # Skips only matter when a name is listed under more than one specialty
+            name = next((n for n in names if (n, day, shift) not in booked_staff), None)
+            room_id = next((r for r in room_ids if (r, day, shift) not in booked_rooms), None)
+            if name is None or room_id is None:
+                dropped = True
+                break
+            booked_staff.add((name, day, shift))
+            booked_rooms.add((room_id, day, shift))
+            slots[specialty].append((day_order[day], shift_order[shift], room_id, name, day, shift))
+
+    # Highest-priority patients of each specialty take its earliest slots
+    assigned = {}
+    for specialty, members in spec_patients.items():
+        for i, slot in zip(members, sorted(slots[specialty], key=lambda s: s[:2])):
+            assigned[i] = slot
+
+    # Flow dropped above (a name shared by two specialties): place the
+    # patients left over first-fit into whatever staff / rooms are free
+    if dropped:
+        cells = sorted(room_pool, key=lambda cell: (day_order.get(cell[0], len(days)), shift_order[cell[1]]))
+        for specialty, members in spec_patients.items():
+            for i in members[len(slots[specialty]):]:
+                for day, shift, room_type in cells:
+                    if specialty not in room_type:
+                        continue
+                    name = next((n for n in staff_pool.get((day, specialty), ())
+                                 if (n, day, shift) not in booked_staff), None)
+                    room_id = next((r for r in room_pool[(day, shift, room_type)]
+                                    if (r, day, shift) not in booked_rooms), None)
+                    if name is not None and room_id is not None:
+                        booked_staff.add((name, day, shift))
+                        booked_rooms.add((room_id, day, shift))
+                        assigned[i] = (day_order[day], shift_order[shift], room_id, name, day, shift)
+                        break
+
+    schedule = []
+    unscheduled = []
+    for i, patient in enumerate(patients):
+        if i not in assigned:
+            unscheduled.append(patient["patient_id"])
+            continue
+        _, _, room_id, name, day, shift = assigned[i]
+        schedule.append({
+            "patient_id": patient["patient_id"],
+            "patient_name": patient["name"],
+            "staff_name": name,
+            "room_id": room_id,
+            "day": day,
+            "shift": shift
+        })
+
+    return schedule, unscheduled
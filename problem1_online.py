@@ -0,0 +1,337 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 4: Incremental Online Scheduler
+
+Keeps the occupancy indexes between events instead of rebuilding them:
+  free_staff[(specialty, day, shift)]  free staff (day, shift) resources
+  free_rooms[(specialty, day, shift)]  free rooms supporting the specialty
+  busy_rooms[(specialty, day, shift)]  booked rooms supporting the specialty,
+                                       grouped by the holder's specialty
+A patient can be booked in any cell where both free sets are non-empty, so
+admit() checks at most days x shifts cells and pops one staff and one room
+(O(1) set operations, independent of the number of live bookings).
+
+Local repair instead of a global re-solve:
+  - admit() with no free cell tries a bounded chain of moves: a booked
+    patient of another specialty holding a room the newcomer could use is
+    moved to a free cell of its own (at most max_displaced moves, at most
+    repair_budget holder groups examined)
+  - patients that still do not fit wait; cancel() and
+    add_staff_availability() place waiting patients of the specialties
+    whose resources were freed
+"""
+
+from collections import OrderedDict
+
+
+class OnlineScheduler:
+    """
+    Stateful scheduler handling admissions, cancellations and new staff
+    availability one event at a time.
+
+    Args:
+        staff, rooms: As for greedy_schedule (staff dicts are updated by
+            add_staff_availability)
+        max_displaced: Longest chain of moved patients per admission
+        repair_budget: Holder groups examined per admission
+    """
+
+    def __init__(self, staff, rooms, max_displaced=2, repair_budget=32):
+        self.max_displaced = max_displaced
+        self.repair_budget = repair_budget
+        self.staff_by_id = {member["staff_id"]: member for member in staff}
+
+        self.days = []
+        for item in list(staff) + list(rooms):
+            for day in item["available_days"]:
+                if day not in self.days:
+                    self.days.append(day)
+        self.shifts = []
+        for r in rooms:
+            if r["shift"] not in self.shifts:
+                self.shifts.append(r["shift"])
+
+        # Resources are interned to ints: staff (name, day, shift) and
+        # rooms (room_id, day, shift), as in greedy_schedule's occupancy keys
+        self.staff_res_id = {}
+        self.staff_res_key = []
+        self.staff_res_specs = []
+        self.room_res_id = {}
+        self.room_res_key = []
+        self.room_res_specs = []
+        self.free_staff = {}
+        self.free_rooms = {}
+        self.busy_staff = set()
+        self.busy_rooms = {}
+        self.cells = {}     # specialty -> [(day, shift)] in day / shift order
+
+        for member in staff:
+            for day in member["available_days"]:
+                self._add_staff_day(member, day)
+        for r in rooms:
+            for day in r["available_days"]:
+                key = (r["room_id"], day, r["shift"])
+                res = self.room_res_id.get(key)
+                if res is None:
+                    res = self.room_res_id[key] = len(self.room_res_key)
+                    self.room_res_key.append(key)
+                    self.room_res_specs.append([])
+                for specialty in r["supported_specialties"]:
+                    if specialty not in self.room_res_specs[res]:
+                        self.room_res_specs[res].append(specialty)
+                        self._cell_set(self.free_rooms, specialty, day, r["shift"]).add(res)
+                        self.busy_rooms[(specialty, day, r["shift"])] = {}
+
+        self.bookings = {}      # patient_id -> [patient, (day, shift), staff_res, room_res]
+        self.room_holder = {}   # room_res -> patient_id
+        self.waiting = {}       # specialty -> OrderedDict of patient_id -> patient, in arrival order
+        self.waiting_ids = {}   # waiting patient_id -> specialty
+        self.stats = {"admitted": 0, "waitlisted": 0, "cancelled": 0, "moves": 0, "placed_from_waitlist": 0}
+
+    def _cell_set(self, index, specialty, day, shift):
+        key = (specialty, day, shift)
+        cell_set = index.get(key)
+        if cell_set is None:
+            cell_set = index[key] = set()
+            cells = self.cells.setdefault(specialty, [])
+            if (day, shift) not in cells:
+                cells.append((day, shift))
+                cells.sort(key=lambda cell: (self.days.index(cell[0]), self.shifts.index(cell[1])))
+        return cell_set
+
+    def _add_staff_day(self, member, day):
+        # Staff resources for every shift of the day; returns the new ones
+        if day not in self.days:
+            self.days.append(day)
+        added = []
+        for shift in self.shifts:
+            key = (member["name"], day, shift)
+            res = self.staff_res_id.get(key)
+            if res is None:
+                res = self.staff_res_id[key] = len(self.staff_res_key)
+                self.staff_res_key.append(key)
+                self.staff_res_specs.append([])
+            if member["specialty"] in self.staff_res_specs[res]:
+                continue
+            self.staff_res_specs[res].append(member["specialty"])
+            free = self._cell_set(self.free_staff, member["specialty"], day, shift)
+            if res not in self.busy_staff:
+                free.add(res)
+            added.append(res)
+        return added
+
+    def _ready_cell(self, specialty):
+        # First (day, shift) with a free staff member and a free room
+        for day, shift in self.cells.get(specialty, ()):
+            key = (specialty, day, shift)
+            if self.free_staff.get(key) and self.free_rooms.get(key):
+                return day, shift
+        return None
+
+    # ------------------------------------------------------------------
+    # Booking primitives
+    # ------------------------------------------------------------------
+
+    def _take(self, staff_res, room_res, holder_specialty):
+        _, day, shift = self.room_res_key[room_res]
+        self.busy_staff.add(staff_res)
+        for specialty in self.staff_res_specs[staff_res]:
+            self.free_staff[(specialty, day, shift)].discard(staff_res)
+        for specialty in self.room_res_specs[room_res]:
+            self.free_rooms[(specialty, day, shift)].discard(room_res)
+            self.busy_rooms[(specialty, day, shift)].setdefault(holder_specialty, set()).add(room_res)
+
+    def _release(self, staff_res, room_res, holder_specialty):
+        _, day, shift = self.room_res_key[room_res]
+        self.busy_staff.discard(staff_res)
+        for specialty in self.staff_res_specs[staff_res]:
+            self.free_staff[(specialty, day, shift)].add(staff_res)
+        for specialty in self.room_res_specs[room_res]:
+            self.busy_rooms[(specialty, day, shift)][holder_specialty].discard(room_res)
+            self.free_rooms[(specialty, day, shift)].add(room_res)
+
+    def _hold_staff(self, staff_res, held):
+        # Take a free staff resource out of (held=True) or back into its free sets
+        _, day, shift = self.staff_res_key[staff_res]
+        for specialty in self.staff_res_specs[staff_res]:
+            free = self.free_staff[(specialty, day, shift)]
+            if held:
+                free.discard(staff_res)
+            else:
+                free.add(staff_res)
+
+    def _book(self, patient, cell, room_res=None, staff_res=None):
+        specialty = patient["required_specialty"]
+        key = (specialty,) + cell
+        # set.pop() rather than next(iter()): iterating a set that has had
+        # many removals walks its dummy slots, pop() resumes where it stopped
+        if staff_res is None:
+            staff_res = self.free_staff[key].pop()
+        if room_res is None:
+            room_res = self.free_rooms[key].pop()
+        self._take(staff_res, room_res, specialty)
+        self.bookings[patient["patient_id"]] = [patient, cell, staff_res, room_res]
+        self.room_holder[room_res] = patient["patient_id"]
+        return self._booking_row(patient["patient_id"])
+
+    def _unbook(self, patient_id):
+        patient, cell, staff_res, room_res = self.bookings.pop(patient_id)
+        del self.room_holder[room_res]
+        self._release(staff_res, room_res, patient["required_specialty"])
+        return patient, staff_res, room_res
+
+    def _booking_row(self, patient_id):
+        patient, (day, shift), staff_res, room_res = self.bookings[patient_id]
+        return {
+            "patient_id": patient["patient_id"],
+            "patient_name": patient["name"],
+            "staff_name": self.staff_res_key[staff_res][0],
+            "room_id": self.room_res_key[room_res][0],
+            "day": day,
+            "shift": shift
+        }
+
+    # ------------------------------------------------------------------
+    # Local repair
+    # ------------------------------------------------------------------
+
+    def _plan(self, specialty, depth, used_specialties, budget, failed):
+        # (moves, cell, room, staff) placing one patient of the specialty after
+        # the moves [(patient_id, cell, room, staff)] have been applied, or
+        # None; room / staff None means "any free one of the cell"
+        cell = self._ready_cell(specialty)
+        if cell is not None:
+            return [], cell, None, None
+        if depth == 0 or (specialty, depth, used_specialties) in failed:
+            return None
+
+        for day, shift in self.cells.get(specialty, ()):
+            key = (specialty, day, shift)
+            if not self.free_staff.get(key):
+                continue
+            # A free staff member but no free room: displace a room holder of
+            # another specialty (any one of them, they are interchangeable)
+            for holder_specialty, held in self.busy_rooms.get(key, {}).items():
+                if not held or holder_specialty in used_specialties:
+                    continue
+                if budget[0] <= 0:
+                    return None
+                budget[0] -= 1
+                # Reserve the staff member while planning the holder's move: a
+                # name listed under both specialties must not be handed to both
+                staff_res = self.free_staff[key].pop()
+                self._hold_staff(staff_res, True)
+                sub_plan = self._plan(holder_specialty, depth - 1, used_specialties | {holder_specialty},
+                                      budget, failed)
+                self._hold_staff(staff_res, False)
+                if sub_plan is not None:
+                    room_res = held.pop()
+                    held.add(room_res)
+                    moves, holder_cell, holder_room, holder_staff = sub_plan
+                    moves = moves + [(self.room_holder[room_res], holder_cell, holder_room, holder_staff)]
+                    return moves, (day, shift), room_res, staff_res
+        failed.add((specialty, depth, used_specialties))
+        return None
+
+    def _place(self, patient, depth):
+        specialty = patient["required_specialty"]
+        plan = self._plan(specialty, depth, frozenset([specialty]), [self.repair_budget], set())
+        if plan is None:
+            return None
+        moves, cell, room_res, staff_res = plan
+        # Staff chosen by the plan stay reserved until their booking, so the
+        # moves' own free-set pops cannot take them
+        for res in [move[3] for move in moves] + [staff_res]:
+            if res is not None:
+                self._hold_staff(res, True)
+        changes = []
+        for patient_id, move_cell, move_room, move_staff in moves:
+            # Book the new slot first so the old room is not handed out again
+            moved = self.bookings[patient_id]
+            old_staff, old_room = moved[2], moved[3]
+            del self.room_holder[old_room]
+            changes.append(self._book(moved[0], move_cell, move_room, move_staff))
+            self._release(old_staff, old_room, moved[0]["required_specialty"])
+            self.stats["moves"] += 1
+        changes.append(self._book(patient, cell, room_res, staff_res))
+        return changes
+
+    def _drain_waiting(self, specialties):
+        # Place waiting patients of the specialties whose resources were freed
+        placed = []
+        for specialty in specialties:
+            queue = self.waiting.get(specialty)
+            while queue:
+                cell = self._ready_cell(specialty)
+                if cell is None:
+                    break
+                patient_id, patient = queue.popitem(last=False)
+                del self.waiting_ids[patient_id]
+                placed.append(self._book(patient, cell))
+                self.stats["placed_from_waitlist"] += 1
+        return placed
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    # Every event returns the bookings it created or changed (schedule rows);
+    # an admitted patient's own booking comes last, after any moved patients
+
+    def admit(self, patient):
+        # [] when the patient is waitlisted
+        if patient["patient_id"] in self.bookings or patient["patient_id"] in self.waiting_ids:
+            raise ValueError(f"patient {patient['patient_id']} is already admitted")
+        changes = self._place(patient, self.max_displaced)
+        if changes is None:
+            specialty = patient["required_specialty"]
+            self.waiting.setdefault(specialty, OrderedDict())[patient["patient_id"]] = patient
+            self.waiting_ids[patient["patient_id"]] = specialty
+            self.stats["waitlisted"] += 1
+            return []
+        self.stats["admitted"] += 1
+        return changes
+
+    def cancel(self, patient_id):
+        # Waiting patients are booked into the freed staff / room
+        if patient_id in self.waiting_ids:
+            del self.waiting[self.waiting_ids.pop(patient_id)][patient_id]
+            self.stats["cancelled"] += 1
+            return []
+        if patient_id not in self.bookings:
+            raise KeyError(patient_id)
+        _, staff_res, room_res = self._unbook(patient_id)
+        self.stats["cancelled"] += 1
+        return self._drain_waiting(self.staff_res_specs[staff_res] + self.room_res_specs[room_res])
+
+    def add_staff_availability(self, staff_id, day):
+        # Waiting patients of the staff member's specialty are booked first
+        member = self.staff_by_id[staff_id]
+        if day not in member["available_days"]:
+            member["available_days"].append(day)
+        if not self._add_staff_day(member, day):
+            return []
+        return self._drain_waiting([member["specialty"]])
+
+    def apply(self, event):
+        # Events: ("admit", patient), ("cancel", patient_id) or
+        # ("add_staff_availability", staff_id, day); returns the changes
+        kind = event[0]
+        if kind == "admit":
+            return self.admit(event[1])
+        if kind == "cancel":
+            return self.cancel(event[1])
+        if kind == "add_staff_availability":
+            return self.add_staff_availability(event[1], event[2])
+        raise ValueError(f"unknown event {kind!r}")
+
+    def process(self, events):
+        # Yields (event, changes) for each event, see apply
+        for event in events:
+            yield event, self.apply(event)
+
+    def get_schedule(self):
+        return [self._booking_row(patient_id) for patient_id in self.bookings]
+
+    def get_unscheduled(self):
+        return [patient_id for queue in self.waiting.values() for patient_id in queue]
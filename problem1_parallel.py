@@ -0,0 +1,249 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 2c: Parallel Portfolio Backtracking (process pool)
+
+The backtracking tree of backtracking_schedule is split into work units
+(path, start): "the first len(path) patients take these candidates, try the
+next patient's candidates from index start on". The top split_depth levels
+seed the queue; a unit that runs past node_limit nodes hands its unexplored
+siblings back as new units (shallowest first), so idle workers steal the
+remaining parts of unbalanced subtrees. The first feasible schedule sets a
+shared stop event and cancels every other unit.
+
+With portfolio=True several variable / value orderings race on the same
+pool:
+  variable order: "input" (as backtracking_schedule) or "mrv" (patients of
+                  the specialty with the fewest candidate slots first)
+  value order:    "forward" (staff -> day -> room), "reverse" or "shuffled"
+"""
+
+import itertools
+import random
+import time
+from collections import deque
+
+from problem1_compiled import CompiledScheduleModel
+
+
+PORTFOLIO_ORDERINGS = [("input", "forward"), ("mrv", "forward"), ("input", "reverse"), ("mrv", "shuffled")]
+
+# Worker process state (set by _init_search_worker)
+_search_worker = {}
+
+
+class BacktrackingSearchSpace:
+    """
+    Candidate slots of backtracking_schedule per specialty and the
+    orderings / work units searched by the worker processes.
+    """
+
+    def __init__(self, patients, staff, rooms):
+        self.patients = patients
+        self.model = CompiledScheduleModel(staff, rooms)
+        self.orderings = {}
+
+        # Candidate (staff, day, room, room_slot, staff_slot) per specialty,
+        # in backtracking_schedule's order
+        model = self.model
+        self.candidates = {}
+        for patient in patients:
+            specialty = patient["required_specialty"]
+            if specialty in self.candidates:
+                continue
+            candidates = self.candidates[specialty] = []
+            for s in model.staff_by_specialty.get(specialty, ()):
+                for day in model.staff_days[s]:
+                    day_rooms = sorted(r for shift in range(model.num_shifts)
+                                       for r in model.rooms_by_slot.get((specialty, day, shift), ()))
+                    for r in day_rooms:
+                        offset = day * model.num_shifts + model.room_shift[r]
+                        candidates.append((s, day, r, model.room_base[r] + offset, model.staff_base[s] + offset))
+
+    def ordering(self, variable_order, value_order, seed=0):
+        # (patient index per depth, candidate list per depth), cached
+        key = (variable_order, value_order, seed)
+        if key not in self.orderings:
+            order = list(range(len(self.patients)))
+            if variable_order == "mrv":
+                order.sort(key=lambda i: len(self.candidates[self.patients[i]["required_specialty"]]))
+
+            by_specialty = {}
+            rng = random.Random(seed)
+            for specialty, candidates in self.candidates.items():
+                candidates = list(candidates)
+                if value_order == "reverse":
+                    candidates.reverse()
+                elif value_order == "shuffled":
+                    rng.shuffle(candidates)
+                by_specialty[specialty] = candidates
+
+            self.orderings[key] = (order, [by_specialty[self.patients[i]["required_specialty"]] for i in order])
+        return self.orderings[key]
+
+    def search(self, config, path, start, node_limit=None, stop_event=None):
+        # Explore one work unit. Returns ("found", path), ("done", nodes) or
+        # ("split", units, nodes) when node_limit runs out first
+        order, candidates = self.ordering(*config)
+        room_busy = bytearray(len(self.model.room_busy))
+        staff_busy = bytearray(len(self.model.staff_busy))
+        for depth, j in enumerate(path):
+            candidate = candidates[depth][j]
+            if room_busy[candidate[3]] or staff_busy[candidate[4]]:
+                return "done", 0
+            room_busy[candidate[3]] = staff_busy[candidate[4]] = 1
+
+        base = len(path)
+        chosen = list(path)
+        position = [0] * base + [start]
+        depth = base
+        nodes = 0
+        while True:
+            if depth == len(order):
+                return "found", chosen
+            if node_limit is not None and nodes >= node_limit:
+                # Hand back the unexplored siblings, shallowest first
+                units = [(tuple(chosen[:d]), position[d]) for d in range(base, depth + 1)]
+                return "split", units, nodes
+
+            options = candidates[depth]
+            j = position[depth]
+            while j < len(options) and (room_busy[options[j][3]] or staff_busy[options[j][4]]):
+                j += 1
+
+            if j < len(options):
+                # Descend
+                nodes += 1
+                room_busy[options[j][3]] = staff_busy[options[j][4]] = 1
+                chosen.append(j)
+                position[depth] = j + 1
+                depth += 1
+                if len(position) == depth:
+                    position.append(0)
+                else:
+                    position[depth] = 0
+
+                if nodes & 1023 == 0 and stop_event is not None and stop_event.is_set():
+                    return "done", nodes
+                continue
+
+            # Exhausted this level: backtrack
+            if depth == base:
+                return "done", nodes
+            depth -= 1
+            candidate = candidates[depth][chosen.pop()]
+            room_busy[candidate[3]] = staff_busy[candidate[4]] = 0
+
+    def split(self, config, split_depth):
+        # Work units for every feasible assignment of the first split_depth patients
+        order, candidates = self.ordering(*config)
+        units = [((), 0)]
+        for depth in range(min(split_depth, len(order))):
+            next_units = []
+            for path, _ in units:
+                used = set()
+                for d, j in enumerate(path):
+                    used.add(("room", candidates[d][j][3]))
+                    used.add(("staff", candidates[d][j][4]))
+                for j, candidate in enumerate(candidates[depth]):
+                    if ("room", candidate[3]) not in used and ("staff", candidate[4]) not in used:
+                        next_units.append((path + (j,), 0))
+            units = next_units
+        return units
+
+    def to_schedule(self, config, path):
+        order, candidates = self.ordering(*config)
+        booked = sorted((order[depth], candidates[depth][j]) for depth, j in enumerate(path))
+        schedule = []
+        for i, (s, day, r, _, _) in booked:
+            schedule.append({
+                "patient_id": self.patients[i]["patient_id"],
+                "patient_name": self.patients[i]["name"],
+                "staff_name": self.model.staff[s]["name"],
+                "room_id": self.model.rooms[r]["room_id"],
+                "day": self.model.day_names[day],
+                "shift": self.model.rooms[r]["shift"]
+            })
+        return schedule
+
+
+def _init_search_worker(stop_event, patients, staff, rooms):
+    _search_worker["stop_event"] = stop_event
+    _search_worker["space"] = BacktrackingSearchSpace(patients, staff, rooms)
+
+
+def _run_search_unit(config, path, start, node_limit):
+    return _search_worker["space"].search(config, path, start, node_limit, _search_worker["stop_event"])
+
+
+def parallel_backtracking_schedule(patients, staff, rooms, num_workers=None, split_depth=2,
+                                   node_limit=20000, portfolio=False, time_limit=None, stats=None):
+    """
+    Backtracking search split into work units over a process pool.
+
+    Args:
+        patients, staff, rooms: As for backtracking_schedule
+        num_workers: Worker processes (default: CPU count)
+        split_depth: Patients assigned in the initial work units
+        node_limit: Nodes a unit explores before handing back its siblings
+        portfolio: Race the PORTFOLIO_ORDERINGS instead of input / forward only
+        time_limit: Wall-clock budget in seconds (None: unlimited)
+        stats: Dict filled with units, splits, nodes and the winning ordering
+
+    Returns:
+        (success, schedule); any feasible schedule, not necessarily the one
+        backtracking_schedule finds
+    """
+    # The pool machinery is imported on first use, it is most of this
+    # module's import time
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    num_workers = num_workers or multiprocessing.cpu_count()
+    configs = [(variable_order, value_order, 0) for variable_order, value_order in
+               (PORTFOLIO_ORDERINGS if portfolio else PORTFOLIO_ORDERINGS[:1])]
+    space = BacktrackingSearchSpace(patients, staff, rooms)
+    if stats is None:
+        stats = {}
+    stats.update({"units": 0, "splits": 0, "nodes": 0, "winner": None})
+
+    # Seed the queue round-robin across the orderings
+    seeded = [[(config, path, start) for path, start in space.split(config, split_depth)] for config in configs]
+    queue = deque(unit for group in itertools.zip_longest(*seeded) for unit in group if unit is not None)
+
+    stop_event = multiprocessing.Event()
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    found = None
+    executor = ProcessPoolExecutor(num_workers, initializer=_init_search_worker,
+                                   initargs=(stop_event, patients, staff, rooms))
+    try:
+        running = {}
+        while queue or running:
+            while queue and len(running) < 2 * num_workers:
+                config, path, start = queue.popleft()
+                running[executor.submit(_run_search_unit, config, path, start, node_limit)] = config
+                stats["units"] += 1
+
+            timeout = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break  # time limit
+            for future in done:
+                config = running.pop(future)
+                result = future.result()
+                if result[0] == "found":
+                    found = (config, result[1])
+                    break
+                stats["nodes"] += result[-1]
+                if result[0] == "split":
+                    stats["splits"] += 1
+                    queue.extend((config, path, start) for path, start in result[1])
+            if found:
+                break
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if found is None:
+        return False, []
+    stats["winner"] = found[0][:2]
+    return True, space.to_schedule(*found)
@@ -0,0 +1,417 @@
+"""
+WOA7001 Group Project - Problem 1: Hospital Scheduling
+Algorithm 1: Greedy First-Fit and Algorithm 2: Backtracking
+
+Patients are booked into (staff, day, shift, room) slots: the staff member
+has the patient's specialty and works that day, the room supports the
+specialty and is open that day, and neither is booked twice in one
+(day, shift). The other schedulers live in their own modules:
+
+    problem1_compiled.py   compiled greedy first-fit (indexed model)
+    problem1_csp.py        constraint-propagating backtracking
+    problem1_flow.py       optimal scheduling via min-cost max-flow
+    problem1_parallel.py   parallel portfolio backtracking
+    problem1_online.py     incremental online scheduler
+
+None of them import pandas or NumPy; schedule_dataframe() imports pandas
+when a DataFrame is actually requested.
+
+Usage:
+    python problem1_scheduling.py schedule hospital.json --algorithm flow
+    python problem1_scheduling.py schedule hospital.json --format table
+    python problem1_scheduling.py online hospital.json events.jsonl
+    python problem1_scheduling.py startup-check --target-ms 50
+
+hospital.json holds {"patients": [...], "staff": [...], "rooms": [...]} as
+in Table 1; rooms without supported_specialties get them from room_type.
+"""
+
+import json
+import random
+import sys
+import time
+
+from startup_check import IMPORT_TARGET_MS, check_import_budget
+
+
+# Specialties each room type can host
+ROOM_TYPE_TO_SPECIALTIES = {
+    "Surgical Room": ["Surgery", "Cardiology"],
+    "Pediatrics": ["Pediatrics"],
+    "ICU": ["Cardiology", "Surgery"]
+}
+
+# Scheduler name -> (module, function, result kind); "partial" schedulers
+# return (schedule, unscheduled), "complete" ones (success, schedule)
+SCHEDULERS = {
+    "greedy": ("problem1_scheduling", "greedy_schedule", "partial"),
+    "backtracking": ("problem1_scheduling", "backtracking_schedule", "complete"),
+    "compiled": ("problem1_compiled", "compiled_greedy_schedule", "partial"),
+    "csp": ("problem1_csp", "csp_backtracking_schedule", "complete"),
+    "flow": ("problem1_flow", "flow_schedule", "partial"),
+    "parallel": ("problem1_parallel", "parallel_backtracking_schedule", "complete"),
+}
+
+# Modules that must import without pandas / NumPy (see startup-check)
+LIGHT_MODULES = ("problem1_scheduling", "problem1_compiled", "problem1_csp", "problem1_flow",
+                 "problem1_parallel", "problem1_online")
+
+SCHEDULE_COLUMNS = ["patient_id", "patient_name", "staff_name", "room_id", "day", "shift"]
+
+
+def assign_supported_specialties(rooms):
+    """Fill in supported_specialties of rooms that lack it, from room_type."""
+    for room in rooms:
+        if "supported_specialties" not in room:
+            room["supported_specialties"] = ROOM_TYPE_TO_SPECIALTIES.get(room.get("room_type"), [])
+    return rooms
+
+
+def greedy_schedule(patients, staff, rooms):
+    """
+    Schedule patients first-fit: staff -> staff's days -> rooms.
+
+    Args:
+        patients: Patient dicts (patient_id, name, required_specialty)
+        staff: Staff dicts (staff_id, name, specialty, available_days)
+        rooms: Room dicts (room_id, available_days, shift, supported_specialties)
+
+    Returns:
+        (schedule, unscheduled patient IDs)
+    """
+    schedule = []
+    unscheduled = []
+
+    # Track occupied rooms: (room_id, day)
+    room_occupancy = set()
+    staff_occupancy = set()
+
+    for patient in patients:
+        assigned = False
+
+        for s in staff:
+            if s["specialty"] != patient["required_specialty"]:
+                continue
+            for day in s["available_days"]:
+
+                for r in rooms:
+                    if patient["required_specialty"] not in r["supported_specialties"]:
+                        continue
+
+                    if day not in r["available_days"]:
+                        continue
+
+                    if (r["room_id"], day, r["shift"]) in room_occupancy:
+                        continue
+
+                    if (s["name"], day, r["shift"]) in staff_occupancy:
+                        continue
+
+
+                    # Assign
+                    schedule.append({
+                        "patient_id": patient["patient_id"],
+                        "patient_name": patient["name"],
+                        "staff_name": s["name"],
+                        "room_id": r["room_id"],
+                        "day": day,
+                        "shift": r["shift"]
+                    })
+
+                    room_occupancy.add((r["room_id"], day, r["shift"]))
+                    staff_occupancy.add((s["name"], day, r["shift"]))
+
+                    assigned = True
+                    break
+
+                if assigned:
+                    break
+            if assigned:
+                break
+
+        if not assigned:
+            unscheduled.append(patient["patient_id"])
+
+    return schedule, unscheduled
+
+
+def backtracking_schedule(patients, staff, rooms):
+    """
+    Search for a schedule that books every patient.
+
+    Args:
+        patients, staff, rooms: As for greedy_schedule
+
+    Returns:
+        (success, schedule); the schedule is empty without success
+    """
+    schedule = []
+    room_occupancy = set()
+    staff_occupancy = set()
+
+    def backtrack(index):
+        if index == len(patients):
+            return True  # All patients scheduled successfully
+
+        patient = patients[index]
+
+        for s in staff:
+            if s["specialty"] != patient["required_specialty"]:
+                continue
+
+            for day in s["available_days"]:
+                for r in rooms:
+                    # Use supported_specialties mapping
+                    if patient["required_specialty"] not in r["supported_specialties"]:
+                        continue
+
+                    if day not in r["available_days"]:
+                        continue
+
+                    if (r["room_id"], day, r["shift"]) in room_occupancy:
+                        continue
+
+                    if (s["name"], day, r["shift"]) in staff_occupancy:
+                        continue
+
+                    # Tentative assignment
+                    schedule.append({
+                        "patient_id": patient["patient_id"],
+                        "patient_name": patient["name"],
+                        "staff_name": s["name"],
+                        "room_id": r["room_id"],
+                        "day": day,
+                        "shift": r["shift"]
+                    })
+                    room_occupancy.add((r["room_id"], day, r["shift"]))
+                    staff_occupancy.add((s["name"], day, r["shift"]))
+
+                    # Recursive call
+                    if backtrack(index + 1):
+                        return True
+
+                    # Backtrack
+                    schedule.pop()
+                    room_occupancy.remove((r["room_id"], day, r["shift"]))
+                    staff_occupancy.remove((s["name"], day, r["shift"]))
+
+        return False  # No feasible assignment
+
+    success = backtrack(0)
+    return success, schedule
+
+
+def make_synthetic_hospital(num_patients, num_staff, num_rooms, seed=0):
+    """
+    Random hospital for the scaling benchmarks.
+
+    Specialties include Anesthetist, which no room type supports.
+
+    Returns:
+        (patients, staff, rooms)
+    """
+    rng = random.Random(seed)
+    week = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    specialties = ["Cardiology", "Surgery", "Anesthetist", "Pediatrics"]
+    room_types = list(ROOM_TYPE_TO_SPECIALTIES)
+
+    def some_days():
+        return [day for day in week if rng.random() < 0.6] or [rng.choice(week)]
+
+    syn_staff = [{
+        "staff_id": i + 1,
+        "name": f"Staff {i + 1}",
+        "specialty": rng.choice(specialties),
+        "available_days": some_days()
+    } for i in range(num_staff)]
+
+    syn_rooms = []
+    for i in range(num_rooms):
+        room_type = rng.choice(room_types)
+        syn_rooms.append({
+            "room_id": 1000 + i,
+            "room_type": room_type,
+            "available_days": some_days(),
+            "shift": rng.choice(["Morning", "Afternoon", "Night"]),
+            "supported_specialties": ROOM_TYPE_TO_SPECIALTIES[room_type]
+        })
+
+    syn_patients = [{
+        "patient_id": f"S{i:06d}",
+        "name": f"Patient {i}",
+        "required_specialty": rng.choice(specialties)
+    } for i in range(num_patients)]
+
+    return syn_patients, syn_staff, syn_rooms
+
+
+def surgery_heavy_instance(k, num_days):
+    """
+    Infeasible Surgery-heavy list: cardiologists and surgeons share k
+    surgical rooms over num_days days, with one patient more than room
+    slots. backtracking_schedule only fails at the leaves.
+
+    Returns:
+        (patients, staff, rooms)
+    """
+    week = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"][:num_days]
+    heavy_staff = [{"staff_id": i + 1, "name": f"Cardiologist {i + 1}", "specialty": "Cardiology",
+                    "available_days": week} for i in range(k)]
+    heavy_staff += [{"staff_id": k + i + 1, "name": f"Surgeon {i + 1}", "specialty": "Surgery",
+                     "available_days": week} for i in range(k)]
+    heavy_rooms = [{"room_id": 200 + i, "room_type": "Surgical Room", "available_days": week,
+                    "shift": "Morning", "supported_specialties": ROOM_TYPE_TO_SPECIALTIES["Surgical Room"]}
+                   for i in range(k)]
+    room_slots = k * num_days
+    heavy_patients = [{"patient_id": f"C{i:03d}", "name": f"Cardiology Patient {i}",
+                       "required_specialty": "Cardiology"} for i in range(room_slots // 2)]
+    heavy_patients += [{"patient_id": f"S{i:03d}", "name": f"Surgery Patient {i}",
+                        "required_specialty": "Surgery"} for i in range(room_slots - room_slots // 2 + 1)]
+    return heavy_patients, heavy_staff, heavy_rooms
+
+
+def load_hospital(path):
+    """
+    Read patients, staff and rooms from a JSON file.
+
+    Args:
+        path: File with "patients", "staff" and "rooms" lists
+
+    Returns:
+        (patients, staff, rooms)
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["patients"], data["staff"], assign_supported_specialties(data["rooms"])
+
+
+def run_scheduler(name, patients, staff, rooms):
+    """
+    Run a scheduler by name, importing its module on first use.
+
+    Returns:
+        (schedule, unscheduled patient IDs) whichever the scheduler's API
+    """
+    import importlib
+
+    module, function, kind = SCHEDULERS[name]
+    result = getattr(importlib.import_module(module), function)(patients, staff, rooms)
+    if kind == "partial":
+        return result
+    booked = {row["patient_id"] for row in result[1]}
+    return result[1], [patient["patient_id"] for patient in patients if patient["patient_id"] not in booked]
+
+
+def format_schedule_table(schedule):
+    """Plain-text table of schedule rows (no pandas)."""
+    rows = [[str(row[column]) for column in SCHEDULE_COLUMNS] for row in schedule]
+    widths = [max([len(column)] + [len(row[i]) for row in rows]) for i, column in enumerate(SCHEDULE_COLUMNS)]
+    lines = [" ".join(column.rjust(width) for column, width in zip(SCHEDULE_COLUMNS, widths))]
+    lines += [" ".join(value.rjust(width) for value, width in zip(row, widths)) for row in rows]
+    return "\n".join(lines)
+
+
+def schedule_dataframe(schedule):
+    """Schedule rows as a pandas DataFrame (pandas is imported here)."""
+    import pandas as pd
+
+    return pd.DataFrame(schedule, columns=SCHEDULE_COLUMNS)
+
+
+def _print_schedule(schedule, unscheduled, output_format, elapsed):
+    if output_format == "json":
+        print(json.dumps({"schedule": schedule, "unscheduled": unscheduled,
+                          "execution_time_s": elapsed}, indent=2))
+        return
+    if output_format == "dataframe":
+        print(schedule_dataframe(schedule).to_string(index=False))
+    elif schedule:
+        print(format_schedule_table(schedule))
+    else:
+        print("No patients were scheduled.")
+    print("\nUnscheduled patients:", unscheduled)
+    print(f"\nAlgorithm execution time: {elapsed:.6f} seconds")
+
+
+def _read_events(lines):
+    # JSON lines: {"event": "admit", "patient": {...}}, {"event": "cancel",
+    # "patient_id": ...} or {"event": "add_staff_availability", "staff_id": ..., "day": ...}
+    for line in lines:
+        if not line.strip():
+            continue
+        event = json.loads(line)
+        kind = event["event"]
+        if kind == "admit":
+            yield kind, event["patient"]
+        elif kind == "cancel":
+            yield kind, event["patient_id"]
+        else:
+            yield kind, event["staff_id"], event["day"]
+
+
+def _event_fields(event):
+    if event[0] == "admit":
+        return {"event": "admit", "patient_id": event[1]["patient_id"]}
+    if event[0] == "cancel":
+        return {"event": "cancel", "patient_id": event[1]}
+    return {"event": event[0], "staff_id": event[1], "day": event[2]}
+
+
+def main(argv=None):
+    """Command line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="WOA7001 hospital scheduling")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schedule = commands.add_parser("schedule", help="schedule the patients of a hospital file")
+    schedule.add_argument("hospital", help="JSON file with patients, staff and rooms")
+    schedule.add_argument("--algorithm", choices=sorted(SCHEDULERS), default="compiled")
+    schedule.add_argument("--format", choices=("json", "table", "dataframe"), default="json",
+                          help="dataframe prints through pandas")
+
+    online = commands.add_parser("online", help="stream events through an OnlineScheduler")
+    online.add_argument("hospital", help="JSON file with staff and rooms (patients are admitted first)")
+    online.add_argument("events", help="JSON lines file of events, or - for stdin")
+
+    startup = commands.add_parser("startup-check",
+                                  help="measure cold-start import time of the scheduling modules")
+    startup.add_argument("--target-ms", type=float, default=IMPORT_TARGET_MS)
+    startup.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == "startup-check":
+        return 0 if check_import_budget(LIGHT_MODULES, args.target_ms, args.runs) else 1
+
+    patients, staff, rooms = load_hospital(args.hospital)
+    if args.command == "schedule":
+        start_time = time.perf_counter()
+        result, unscheduled = run_scheduler(args.algorithm, patients, staff, rooms)
+        _print_schedule(result, unscheduled, args.format, time.perf_counter() - start_time)
+        return 0
+
+    from itertools import chain
+
+    from problem1_online import OnlineScheduler
+
+    scheduler = OnlineScheduler(staff, rooms)
+    stream = sys.stdin if args.events == "-" else open(args.events, encoding="utf-8")
+    try:
+        events = chain((("admit", patient) for patient in patients), _read_events(stream))
+        for event in events:
+            # A bad event (e.g. cancelling an unknown patient) is reported and skipped
+            try:
+                fields = dict(_event_fields(event), changes=scheduler.apply(event))
+            except (KeyError, ValueError) as error:
+                message = f"unknown id {error.args[0]!r}" if isinstance(error, KeyError) else str(error)
+                fields = dict(_event_fields(event), error=message)
+            print(json.dumps(fields), flush=True)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(json.dumps({"stats": scheduler.stats, "unscheduled": scheduler.get_unscheduled()}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,398 @@
+"""
+WOA7001 Group Project - Problem 2: Network Routing
+Compact CSR Network Graph
+
+A frozen, integer-indexed CSR form of NetworkGraph built with vectorized
+NumPy operations, plus A* and load-balancing routers that run directly on
+the arrays. A 1M-link topology takes about 30 MB.
+"""
+
+import heapq
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from problem2_routing import (DynamicLoadBalancerComparative, EdgeInfo, MultiFactorAStarRouter,
+                              NetworkGraph, create_random_network)
+
+
+# Same attribute values (and defaults) as NetworkGraph._create_edge
+QUALITY_VALUES = {'Excellent': 1.0, 'Good': 2.0, 'Fair': 3.0, 'Poor': 4.0}
+TRAFFIC_VALUES = {'High': 2.0, 'Medium': 1.5, 'Low': 1.0}
+
+
+class CompactNetworkGraph:
+    """
+    Frozen, integer-indexed CSR form of a NetworkGraph
+
+    Node i has ID node_ids[i]; nodes maps IDs back to indices (so
+    `node_id in graph.nodes` works as on NetworkGraph). The links listed by
+    node i are neighbors[indptr[i]:indptr[i + 1]], sorted by index, with
+    parallel quality / traffic_factor / cost arrays. All arrays are
+    read-only; a 1M-link topology takes about 30 MB.
+    """
+
+    def __init__(self, node_ids: List[str], node_quality: np.ndarray, node_traffic: np.ndarray,
+                 src: np.ndarray, dst: np.ndarray, names: Optional[List[str]] = None):
+        """
+        Build the CSR arrays (the vectorized build_edges)
+
+        Args:
+            node_ids: Node ID of every index
+            node_quality, node_traffic: Numeric link_quality / traffic_load per node
+            src, dst: Links as index arrays (src lists dst), each link
+                listed in both directions as NetworkGraph.build_edges does
+            names: Router names (default: the node IDs)
+        """
+        self.node_ids = list(node_ids)
+        self.nodes = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.names = list(names) if names is not None else self.node_ids
+        num_nodes = len(self.node_ids)
+
+        # Sort links by (src, dst) and drop duplicates and self-links
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        keys = np.unique(src[src != dst] * num_nodes + dst[src != dst])
+        src, dst = keys // num_nodes, keys % num_nodes
+
+        self.indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=self.indptr[1:])
+        self.neighbors = dst.astype(np.int32)
+        self.quality = (node_quality[src] + node_quality[dst]) / 2
+        self.traffic_factor = (node_traffic[src] + node_traffic[dst]) / 2
+        self.cost = self.quality * self.traffic_factor
+
+        for array in (self.indptr, self.neighbors, self.quality, self.traffic_factor, self.cost):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_graph(cls, graph: NetworkGraph) -> "CompactNetworkGraph":
+        """
+        Convert a NetworkGraph; indices follow sorted node IDs, so heap
+        ties between nodes break the same way as on string IDs
+        """
+        node_ids = sorted(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        nodes = [graph.nodes[node_id] for node_id in node_ids]
+        node_quality = np.array([QUALITY_VALUES.get(node.link_quality, 2.5) for node in nodes])
+        node_traffic = np.array([TRAFFIC_VALUES.get(node.traffic_load, 1.5) for node in nodes])
+
+        # Both directions of every link, as NetworkGraph.build_edges creates
+        # them (duplicates are dropped by the constructor)
+        src, dst = [], []
+        for i, node in enumerate(nodes):
+            for neighbor in node.connections:
+                if neighbor in index:
+                    src.extend((i, index[neighbor]))
+                    dst.extend((index[neighbor], i))
+        return cls(node_ids, node_quality, node_traffic, np.array(src, dtype=np.int64),
+                   np.array(dst, dtype=np.int64), [node.name for node in nodes])
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.neighbors)
+
+    def add_listener(self, callback) -> None:
+        """No-op: a frozen graph never changes edge costs"""
+
+    def memory_bytes(self) -> int:
+        """Bytes held by the CSR arrays (the ID map not included)"""
+        return sum(array.nbytes for array in
+                   (self.indptr, self.neighbors, self.quality, self.traffic_factor, self.cost))
+
+    def edge_position(self, i: int, j: int) -> int:
+        """Position of link i -> j in the CSR arrays, or -1"""
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        position = lo + int(np.searchsorted(self.neighbors[lo:hi], j))
+        return position if position < hi and self.neighbors[position] == j else -1
+
+    def get_edge(self, node1: str, node2: str) -> Optional[EdgeInfo]:
+        """EdgeInfo of a listed link, like NetworkGraph.get_edge"""
+        if node1 not in self.nodes or node2 not in self.nodes:
+            return None
+        position = self.edge_position(self.nodes[node1], self.nodes[node2])
+        if position < 0:
+            return None
+        return EdgeInfo(quality=float(self.quality[position]),
+                        traffic_factor=float(self.traffic_factor[position]),
+                        cost=float(self.cost[position]))
+
+
+class CompactAStarRouter(MultiFactorAStarRouter):
+    """
+    Multi-Factor A* on a CompactNetworkGraph
+
+    Same search (and statistics) as MultiFactorAStarRouter, but relaxations
+    index flat arrays instead of hashing string IDs and edge tuples, and
+    open-set membership is a per-node flag instead of a heap scan. The
+    heuristic is evaluated once per query, as it is a constant estimate.
+    """
+
+    def __init__(self, graph: CompactNetworkGraph):
+        super().__init__(graph)
+        # memoryviews index like lists and return plain Python numbers
+        self._indptr = memoryview(graph.indptr)
+        self._neighbors = memoryview(graph.neighbors)
+        self._cost = memoryview(graph.cost)
+
+    def find_path(self, start: str, end: str,
+                  quality_weight: float = 0.7,
+                  traffic_weight: float = 0.3) -> Tuple[List[str], float, Dict]:
+        """
+        Find path using Multi-Factor A* on the CSR arrays
+
+        Returns:
+            (path, total_cost, performance_stats)
+        """
+        start_time = time.perf_counter()
+
+        if start not in self.graph.nodes or end not in self.graph.nodes:
+            return [], float('inf'), {}
+
+        source, target = self.graph.nodes[start], self.graph.nodes[end]
+        indptr, neighbors, cost = self._indptr, self._neighbors, self._cost
+        h = self.heuristic(start, end)
+        num_nodes = self.graph.num_nodes
+
+        open_set = [(0, source)]
+        in_open = [False] * num_nodes
+        in_open[source] = True
+        came_from = [-1] * num_nodes
+        g_score = [float('inf')] * num_nodes
+        g_score[source] = 0
+        nodes_explored = 0
+        heap_pushes = 1
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            in_open[current] = False
+            nodes_explored += 1
+
+            if current == target:
+                path = [current]
+                while came_from[path[-1]] >= 0:
+                    path.append(came_from[path[-1]])
+                path = [self.graph.node_ids[i] for i in reversed(path)]
+
+                execution_time = (time.perf_counter() - start_time) * 1000
+
+                # Update performance statistics
+                self._record_search(execution_time, nodes_explored, heap_pushes, nodes_explored)
+
+                path_cost = self._calculate_path_cost(path)
+                path_metrics = self._calculate_path_metrics(path)
+
+                return path, path_cost, {
+                    'execution_time_ms': execution_time,
+                    'nodes_explored': nodes_explored,
+                    'path_length': len(path) - 1,
+                    'path_cost': path_cost,
+                    'metrics': path_metrics
+                }
+
+            current_g = g_score[current]
+            for position in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[position]
+                tentative_g_score = current_g + cost[position]
+
+                if tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    if not in_open[neighbor]:
+                        in_open[neighbor] = True
+                        heapq.heappush(open_set, (tentative_g_score + h, neighbor))
+                        heap_pushes += 1
+
+        # No path found
+        execution_time = (time.perf_counter() - start_time) * 1000
+        return [], float('inf'), {
+            'execution_time_ms': execution_time,
+            'nodes_explored': nodes_explored,
+            'path_length': 0,
+            'path_cost': float('inf'),
+            'metrics': {}
+        }
+
+
+class CompactLoadBalancer(DynamicLoadBalancerComparative):
+    """
+    Load balancer whose Yen's K-shortest-path searches run on the CSR
+    arrays with integer node indices; paths are returned as node IDs
+    """
+
+    def __init__(self, graph: CompactNetworkGraph, k_paths: int = 3,
+                 cache_size: int = 10000, cache_ttl: Optional[float] = None):
+        super().__init__(graph, k_paths, cache_size, cache_ttl)
+        self._indptr = memoryview(graph.indptr)
+        self._neighbors = memoryview(graph.neighbors)
+        self._cost = memoryview(graph.cost)
+
+    def _yen_k_shortest_paths(self, start: str, end: str, k: int) -> Tuple[List[List[str]], int]:
+        """Yen's algorithm on node indices"""
+        paths, nodes_explored = super()._yen_k_shortest_paths(
+            self.graph.nodes[start], self.graph.nodes[end], k)
+        return [[self.graph.node_ids[i] for i in path] for path in paths], nodes_explored
+
+    def _edge_cost(self, node1: int, node2: int) -> float:
+        """Static cost of one edge, by node index"""
+        return self._cost[self.graph.edge_position(node1, node2)]
+
+    def _shortest_path_tree_to(self, end: int) -> Tuple[Dict[int, float], Dict[int, int], int]:
+        """
+        Dijkstra from the destination over the CSR arrays (every link is
+        listed in both directions with the same cost, so a node's own links
+        serve as its in-links)
+
+        Returns:
+            (cost_to_end, next_node_towards_end, nodes_settled)
+        """
+        indptr, neighbors, cost = self._indptr, self._neighbors, self._cost
+        distance = [float('inf')] * self.graph.num_nodes
+        distance[end] = 0.0
+        next_node = {}
+        settled = 0
+        pq = [(0.0, end)]
+
+        while pq:
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > distance[current]:
+                continue
+            settled += 1
+            for position in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[position]
+                new_dist = current_dist + cost[position]
+                if new_dist < distance[neighbor]:
+                    distance[neighbor] = new_dist
+                    next_node[neighbor] = current
+                    heapq.heappush(pq, (new_dist, neighbor))
+
+        cost_to_end = {end: 0.0}
+        cost_to_end.update((node, distance[node]) for node in next_node)
+        return cost_to_end, next_node, settled
+
+    def _spur_search(self, start: int, end: int, heuristic: Dict[int, float],
+                     removed_nodes: Set[int], removed_edges: Set[Tuple[int, int]]
+                     ) -> Tuple[Optional[List[int]], float, int]:
+        """
+        A* from the spur node over the CSR arrays
+
+        Returns:
+            (path or None, path_cost, nodes_settled)
+        """
+        indptr, neighbors, cost = self._indptr, self._neighbors, self._cost
+        g_score = {start: 0.0}
+        previous = {start: None}
+        closed = set()
+        pq = [(heuristic.get(start, float('inf')), start)]
+
+        while pq:
+            _, current = heapq.heappop(pq)
+            if current in closed:
+                continue
+            closed.add(current)
+
+            if current == end:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = previous[current]
+                path.reverse()
+                return path, g_score[end], len(closed)
+
+            current_g = g_score[current]
+            for position in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[position]
+                if (neighbor in removed_nodes or neighbor in closed
+                        or (current, neighbor) in removed_edges
+                        or neighbor not in heuristic):
+                    continue
+                tentative = current_g + cost[position]
+                if tentative < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = tentative
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (tentative + heuristic[neighbor], neighbor))
+
+        return None, float('inf'), len(closed)
+
+
+def create_compact_random_network(num_nodes: int, avg_degree: int = 4,
+                                  seed: int = 0) -> CompactNetworkGraph:
+    """
+    Create a connected random network directly in CSR form
+
+    Same construction as create_random_network (random spanning tree plus
+    random links, listed by both ends), vectorized with NumPy.
+    """
+    rng = np.random.default_rng(seed)
+    child = np.arange(1, num_nodes)
+    parent = (rng.random(num_nodes - 1) * child).astype(np.int64)
+    extra = max(0, num_nodes * avg_degree // 2 - (num_nodes - 1))
+    a = rng.integers(0, num_nodes, extra)
+    b = rng.integers(0, num_nodes, extra)
+
+    src = np.concatenate([child, parent, a, b])
+    dst = np.concatenate([parent, child, b, a])
+    node_quality = rng.choice([1.0, 2.0, 3.0, 4.0], num_nodes)
+    node_traffic = rng.choice([2.0, 1.5, 1.0], num_nodes)
+    node_ids = [f"{i:07d}" for i in range(num_nodes)]
+    return CompactNetworkGraph(node_ids, node_quality, node_traffic, src, dst)
+
+
+def run_compact_graph_demo(num_nodes: int = 10000, large_nodes: int = 250000):
+    """
+    Compare memory and router speed of NetworkGraph and its CSR form, then
+    build a 1M-link topology directly in CSR form
+    """
+    import tracemalloc
+
+    print("=" * 70)
+    print("Compact CSR Network Graph")
+    print("=" * 70)
+
+    tracemalloc.start()
+    graph = create_random_network(num_nodes, seed=1)
+    graph_bytes = tracemalloc.get_traced_memory()[0]
+    compact = CompactNetworkGraph.from_graph(graph)
+    tracemalloc.stop()
+
+    num_links = sum(len(node.connections) for node in graph.nodes.values())
+    print(f"\n{num_nodes} routers, {num_links} links")
+    print(f"NetworkGraph: {graph_bytes / 2**20:.1f} MB (nodes, edge dict, EdgeInfo objects)")
+    print(f"CSR arrays:   {compact.memory_bytes() / 2**20:.1f} MB")
+
+    rng = random.Random(0)
+    queries = [tuple(rng.sample(list(graph.nodes), 2)) for _ in range(5)]
+    print(f"\n{'Router':<28} {'Avg time (ms)':<15} {'Same costs':<10}")
+    print("-" * 70)
+    for name, search, compact_search in [
+            ('Multi-Factor A*', MultiFactorAStarRouter(graph).find_path,
+             CompactAStarRouter(compact).find_path),
+            ('Load Balancing (K=3)', DynamicLoadBalancerComparative(graph).find_static_best_path,
+             CompactLoadBalancer(compact).find_static_best_path)]:
+        results = []
+        for run in (search, compact_search):
+            start = time.perf_counter()
+            costs = [run(s, t)[1] for s, t in queries]
+            results.append(((time.perf_counter() - start) * 1000 / len(queries), costs))
+        same = all(abs(a - b) < 1e-9 for a, b in zip(results[0][1], results[1][1]))
+        print(f"{name + ' (dict)':<28} {results[0][0]:<15.2f}")
+        print(f"{name + ' (CSR)':<28} {results[1][0]:<15.2f} {str(same):<10}")
+
+    start = time.perf_counter()
+    large = create_compact_random_network(large_nodes, seed=2)
+    build_s = time.perf_counter() - start
+    print(f"\n{large_nodes} routers, {large.num_edges} links built in {build_s:.2f} s: "
+          f"{large.memory_bytes() / 2**20:.1f} MB of CSR arrays")
+    path, cost, stats = CompactAStarRouter(large).find_path(large.node_ids[0], large.node_ids[-1])
+    print(f"A* {large.node_ids[0]} -> {large.node_ids[-1]}: {stats['path_length']} hops, "
+          f"cost {cost:.2f}, {stats['execution_time_ms']:.0f} ms")
+
+
+if __name__ == "__main__":
+    run_compact_graph_demo()
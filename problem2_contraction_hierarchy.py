@@ -0,0 +1,460 @@
+"""
+WOA7001 Group Project - Problem 2: Network Routing
+Contraction Hierarchy: Preprocessed Point-to-Point Routing
+
+Nodes are contracted in order of importance, adding shortcut edges where
+no witness path exists; a query is a bidirectional Dijkstra that only
+climbs the hierarchy, so it settles a small, nearly size-independent set
+of nodes. Hierarchies are stored as CSR NumPy arrays and can be saved to
+and loaded from .npz files keyed by a graph signature.
+"""
+
+import hashlib
+import heapq
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from problem2_routing import (MultiFactorAStarRouter, NetworkGraph, NetworkNode,
+                              create_sample_network)
+
+
+def graph_signature(graph: NetworkGraph) -> str:
+    """SHA-256 over the node IDs and edge costs, to match persisted hierarchies"""
+    digest = hashlib.sha256()
+    for (node1, node2), edge in sorted(graph.edges.items()):
+        if node1 < node2:
+            digest.update(f"{node1},{node2},{edge.cost!r};".encode())
+    digest.update(",".join(sorted(graph.nodes)).encode())
+    return digest.hexdigest()
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy over EdgeInfo.cost
+
+    Preprocessing contracts nodes one by one in order of importance (edge
+    difference + contracted neighbours). Contracting v adds a shortcut u-w
+    for a pair of its neighbours unless a witness path u ~> w avoiding v is
+    at most as short. A query is a bidirectional Dijkstra that only relaxes
+    edges towards higher-ranked nodes, so it settles a small, nearly
+    size-independent set of nodes; shortcuts are unpacked into the path.
+    """
+
+    def __init__(self, witness_limit: int = 60):
+        self.witness_limit = witness_limit
+        self.node_ids: List[str] = []
+        self.node_index: Dict[str, int] = {}
+        self.rank = np.empty(0, dtype=np.int32)
+        # Upward graph in CSR form: edges from each node to higher-ranked nodes
+        self.up_indptr = np.zeros(1, dtype=np.int64)
+        self.up_target = np.empty(0, dtype=np.int32)
+        self.up_cost = np.empty(0)
+        self.up_middle = np.empty(0, dtype=np.int32)
+        self.signature = ""
+        self._up: List[List[Tuple[int, float]]] = []
+        self._middle: Dict[Tuple[int, int], int] = {}
+        self.preprocess_stats = {'preprocess_time_ms': 0.0, 'shortcuts': 0}
+
+    # ---------- Preprocessing ----------
+
+    def build(self, graph: NetworkGraph) -> 'ContractionHierarchy':
+        """Contract all nodes of the graph and build the upward search graph"""
+        start_time = time.perf_counter()
+        self.node_ids = list(graph.nodes)
+        self.node_index = {node_id: idx for idx, node_id in enumerate(self.node_ids)}
+        num_nodes = len(self.node_ids)
+
+        # Remaining graph: neighbour -> (cost, middle node or -1)
+        remaining: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(num_nodes)]
+        for (node1, node2), edge in graph.edges.items():
+            if node1 in self.node_index and node2 in self.node_index and node1 != node2:
+                u, w = self.node_index[node1], self.node_index[node2]
+                if w not in remaining[u] or edge.cost < remaining[u][w][0]:
+                    remaining[u][w] = (edge.cost, -1)
+
+        contracted_neighbors = [0] * num_nodes
+        level = [0] * num_nodes
+        rank = [0] * num_nodes
+        upward: List[List[Tuple[int, float, int]]] = [[] for _ in range(num_nodes)]
+
+        def priority(node: int) -> Tuple[int, List[Tuple[int, int, float]]]:
+            shortcuts = self._shortcuts(remaining, node)
+            return (len(shortcuts) - len(remaining[node])
+                    + contracted_neighbors[node] + level[node]), shortcuts
+
+        queue = [(priority(node)[0], node) for node in range(num_nodes)]
+        heapq.heapify(queue)
+        num_shortcuts = 0
+
+        for order in range(num_nodes):
+            # Lazy updates: re-evaluate the top node before contracting it
+            while True:
+                _, node = heapq.heappop(queue)
+                new_priority, shortcuts = priority(node)
+                if not queue or new_priority <= queue[0][0]:
+                    break
+                heapq.heappush(queue, (new_priority, node))
+
+            rank[node] = order
+            for neighbor, (cost, middle) in remaining[node].items():
+                upward[node].append((neighbor, cost, middle))
+            for u, w, cost in shortcuts:
+                if w not in remaining[u] or cost < remaining[u][w][0]:
+                    remaining[u][w] = (cost, node)
+                    remaining[w][u] = (cost, node)
+                    num_shortcuts += 1
+            for neighbor in remaining[node]:
+                del remaining[neighbor][node]
+                contracted_neighbors[neighbor] += 1
+                level[neighbor] = max(level[neighbor], level[node] + 1)
+            remaining[node] = {}
+
+        self.rank = np.array(rank, dtype=np.int32)
+        counts = [len(edges) for edges in upward]
+        self.up_indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.up_indptr[1:])
+        flat = [edge for edges in upward for edge in edges]
+        self.up_target = np.array([edge[0] for edge in flat], dtype=np.int32)
+        self.up_cost = np.array([edge[1] for edge in flat], dtype=np.float64)
+        self.up_middle = np.array([edge[2] for edge in flat], dtype=np.int32)
+        self.signature = graph_signature(graph)
+        self._prepare()
+
+        self.preprocess_stats['preprocess_time_ms'] = (time.perf_counter() - start_time) * 1000
+        self.preprocess_stats['shortcuts'] = num_shortcuts
+        return self
+
+    def _shortcuts(self, remaining: List[Dict[int, Tuple[float, int]]],
+                   node: int) -> List[Tuple[int, int, float]]:
+        """Shortcuts (u, w, cost) needed if node were contracted now"""
+        neighbors = list(remaining[node].items())
+        if len(neighbors) < 2:
+            return []
+        max_out = max(cost for _, (cost, _) in neighbors)
+        shortcuts = []
+
+        for i, (u, (cost_u, _)) in enumerate(neighbors[:-1]):
+            targets = {w: cost_u + cost_w for w, (cost_w, _) in neighbors[i + 1:]}
+            limit = cost_u + max_out
+
+            # Witness search from u that skips node, bounded in cost and size;
+            # it ends early once every target is settled
+            distance = {u: 0.0}
+            pq = [(0.0, u)]
+            settled = 0
+            unsettled = len(targets)
+            while pq and settled < self.witness_limit:
+                current_dist, current = heapq.heappop(pq)
+                if current_dist > distance[current]:
+                    continue
+                if current_dist > limit:
+                    break
+                settled += 1
+                if current in targets:
+                    unsettled -= 1
+                    if unsettled == 0:
+                        break
+                for neighbor, (cost, _) in remaining[current].items():
+                    if neighbor == node:
+                        continue
+                    new_dist = current_dist + cost
+                    if new_dist < distance.get(neighbor, float('inf')):
+                        distance[neighbor] = new_dist
+                        heapq.heappush(pq, (new_dist, neighbor))
+
+            for w, via_cost in targets.items():
+                if distance.get(w, float('inf')) > via_cost:
+                    shortcuts.append((u, w, via_cost))
+
+        return shortcuts
+
+    def _prepare(self) -> None:
+        """Python-level upward lists and shortcut middles for fast queries"""
+        indptr = self.up_indptr.tolist()
+        targets = self.up_target.tolist()
+        costs = self.up_cost.tolist()
+        middles = self.up_middle.tolist()
+        self._up = [list(zip(targets[indptr[node]:indptr[node + 1]],
+                             costs[indptr[node]:indptr[node + 1]]))
+                    for node in range(len(self.node_ids))]
+        self._middle = {}
+        for node in range(len(self.node_ids)):
+            for position in range(indptr[node], indptr[node + 1]):
+                if middles[position] >= 0:
+                    self._middle[(node, targets[position])] = middles[position]
+
+    # ---------- Persistence ----------
+
+    def save(self, path: str) -> None:
+        """Write the hierarchy to a .npz file"""
+        np.savez(path, node_ids=np.array(self.node_ids), rank=self.rank,
+                 up_indptr=self.up_indptr, up_target=self.up_target,
+                 up_cost=self.up_cost, up_middle=self.up_middle,
+                 signature=self.signature)
+
+    @classmethod
+    def load(cls, path: str, graph: Optional[NetworkGraph] = None) -> 'ContractionHierarchy':
+        """
+        Read a hierarchy written by save
+
+        If a graph is given, the hierarchy must have been built from the same
+        nodes and edge costs, otherwise ValueError is raised.
+        """
+        hierarchy = cls()
+        with np.load(path) as archive:
+            hierarchy.node_ids = archive['node_ids'].tolist()
+            hierarchy.rank = archive['rank']
+            hierarchy.up_indptr = archive['up_indptr']
+            hierarchy.up_target = archive['up_target']
+            hierarchy.up_cost = archive['up_cost']
+            hierarchy.up_middle = archive['up_middle']
+            hierarchy.signature = str(archive['signature'])
+        if graph is not None and graph_signature(graph) != hierarchy.signature:
+            raise ValueError(f"Contraction hierarchy {path} was built for a different graph")
+        hierarchy.node_index = {node_id: idx for idx, node_id in enumerate(hierarchy.node_ids)}
+        hierarchy._prepare()
+        return hierarchy
+
+    # ---------- Queries ----------
+
+    def query(self, start: str, end: str) -> Tuple[List[str], float, int]:
+        """
+        Bidirectional upward Dijkstra
+
+        Returns:
+            (path, cost, nodes_settled); ([], inf, n) if unreachable
+        """
+        s, t = self.node_index[start], self.node_index[end]
+        if s == t:
+            return [start], 0.0, 1
+
+        up = self._up
+        distance = ({s: 0.0}, {t: 0.0})
+        parent = ({s: -1}, {t: -1})
+        queues = ([(0.0, s)], [(0.0, t)])
+        best, meeting = float('inf'), -1
+        settled = 0
+
+        while queues[0] or queues[1]:
+            # Expand the side with the smaller key; stop once neither can improve
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            current_dist, current = heapq.heappop(queues[side])
+            if current_dist >= best:
+                break
+            if current_dist > distance[side][current]:
+                continue
+            settled += 1
+
+            other = distance[1 - side].get(current)
+            if other is not None and current_dist + other < best:
+                best, meeting = current_dist + other, current
+
+            # Stall on demand: a higher neighbour may reach current cheaper
+            stalled = False
+            for neighbor, cost in up[current]:
+                known = distance[side].get(neighbor)
+                if known is not None and known + cost < current_dist:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+
+            for neighbor, cost in up[current]:
+                new_dist = current_dist + cost
+                if new_dist < distance[side].get(neighbor, float('inf')):
+                    distance[side][neighbor] = new_dist
+                    parent[side][neighbor] = current
+                    heapq.heappush(queues[side], (new_dist, neighbor))
+
+        if meeting < 0:
+            return [], float('inf'), settled
+
+        # Upward halves of the path, then unpack every shortcut
+        forward = []
+        node = meeting
+        while node >= 0:
+            forward.append(node)
+            node = parent[0][node]
+        forward.reverse()
+        node = parent[1][meeting]
+        while node >= 0:
+            forward.append(node)
+            node = parent[1][node]
+
+        path = [forward[0]]
+        for a, b in zip(forward, forward[1:]):
+            self._unpack(a, b, path)
+        return [self.node_ids[node] for node in path], best, settled
+
+    def _unpack(self, a: int, b: int, path: List[int]) -> None:
+        """Append the original nodes of the CH edge a-b (after a) to path"""
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            key = (a, b) if self.rank[a] < self.rank[b] else (b, a)
+            middle = self._middle.get(key, -1)
+            if middle < 0:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+
+class ContractionHierarchyRouter(MultiFactorAStarRouter):
+    """
+    Multi-Factor A* router answering from a contraction hierarchy
+
+    Same (path, total_cost, performance_stats) contract as find_path;
+    nodes_explored counts the nodes settled by both search directions.
+    """
+
+    def __init__(self, graph: NetworkGraph, hierarchy: Optional[ContractionHierarchy] = None):
+        super().__init__(graph)
+        self.hierarchy = hierarchy if hierarchy is not None else ContractionHierarchy().build(graph)
+
+    def find_path(self, start: str, end: str,
+                  quality_weight: float = 0.7,
+                  traffic_weight: float = 0.3) -> Tuple[List[str], float, Dict]:
+        start_time = time.perf_counter()
+
+        if start not in self.graph.nodes or end not in self.graph.nodes:
+            return [], float('inf'), {}
+
+        path, path_cost, nodes_explored = self.hierarchy.query(start, end)
+        execution_time = (time.perf_counter() - start_time) * 1000
+
+        if not path:
+            return [], float('inf'), {
+                'execution_time_ms': execution_time,
+                'nodes_explored': nodes_explored,
+                'path_length': 0,
+                'path_cost': float('inf'),
+                'metrics': {}
+            }
+
+        self._record_search(execution_time, nodes_explored)
+
+        return path, path_cost, {
+            'execution_time_ms': execution_time,
+            'nodes_explored': nodes_explored,
+            'path_length': len(path) - 1,
+            'path_cost': path_cost,
+            'metrics': self._calculate_path_metrics(path)
+        }
+
+
+def create_geometric_network(num_nodes: int, neighbors: int = 3, seed: int = 0) -> NetworkGraph:
+    """
+    Create a connected router network with geographic locality
+
+    Routers get random positions and link to their nearest routers, like a
+    wide-area backbone. A chain through the routers in a serpentine cell
+    order keeps the network connected.
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.random((num_nodes, 2))
+    cells = max(1, int(np.sqrt(num_nodes / 4)))
+    cell = np.minimum((points * cells).astype(np.int64), cells - 1)
+
+    links = defaultdict(set)
+    serpentine = np.where(cell[:, 0] % 2 == 0, points[:, 1], -points[:, 1])
+    order = np.lexsort((serpentine, cell[:, 0])).tolist()
+    for a, b in zip(order[:-1], order[1:]):
+        links[a].add(b)
+        links[b].add(a)
+
+    buckets = defaultdict(list)
+    for i, (cx, cy) in enumerate(cell.tolist()):
+        buckets[(cx, cy)].append(i)
+    for i, (cx, cy) in enumerate(cell.tolist()):
+        nearby = np.array([j for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                           for j in buckets.get((cx + dx, cy + dy), []) if j != i], dtype=np.int64)
+        if len(nearby) == 0:
+            continue
+        squared = ((points[nearby] - points[i]) ** 2).sum(axis=1)
+        for j in nearby[np.argsort(squared)[:neighbors]].tolist():
+            links[i].add(j)
+            links[j].add(i)
+
+    traffic = rng.choice(['High', 'Medium', 'Low'], num_nodes).tolist()
+    quality = rng.choice(['Excellent', 'Good', 'Fair', 'Poor'], num_nodes).tolist()
+    node_ids = [f"{i:06d}" for i in range(num_nodes)]
+    graph = NetworkGraph()
+    for i in range(num_nodes):
+        graph.add_node(NetworkNode(
+            node_id=node_ids[i],
+            name=f"Router-{i}",
+            connected_nodes=[node_ids[j] for j in sorted(links[i])],
+            traffic_load=traffic[i],
+            link_quality=quality[i]
+        ))
+    graph.build_edges()
+    return graph
+
+
+def run_contraction_hierarchy_demo(sizes=(1000, 10000)):
+    """
+    Preprocess, persist and query contraction hierarchies of growing networks
+
+    Pass sizes=(1000, 10000, 100000) for the 100k-router run (preprocessing
+    then takes a couple of minutes in pure Python).
+    """
+    import tempfile
+
+    print("=" * 70)
+    print("Contraction Hierarchy: Preprocessed Point-to-Point Routing")
+    print("=" * 70)
+
+    graph = create_sample_network()
+    ch_router = ContractionHierarchyRouter(graph)
+    print(f"\n{'Test Case':<12} {'CH path':<34} {'Cost':<8}")
+    print("-" * 70)
+    for start, end in [('001', '004'), ('002', '004'), ('001', '003'), ('004', '002')]:
+        path, cost, _ = ch_router.find_path(start, end)
+        path_names = ' → '.join(graph.nodes[node].name for node in path)
+        print(f"{start}->{end:<7} {path_names:<34} {cost:<8.2f}")
+
+    print(f"\n{'Routers':<9} {'Shortcuts':<10} {'Build (s)':<10} {'Load (ms)':<10} "
+          f"{'CH (ms)':<9} {'Settled':<8} {'A* (ms)':<9} {'Explored':<9}")
+    print("-" * 70)
+    for num_nodes in sizes:
+        graph = create_geometric_network(num_nodes, seed=num_nodes)
+        hierarchy = ContractionHierarchy().build(graph)
+        stats = hierarchy.preprocess_stats
+
+        # Round trip through the file format the routers load from
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hierarchy.npz')
+            hierarchy.save(path)
+            start = time.perf_counter()
+            hierarchy = ContractionHierarchy.load(path, graph)
+            load_ms = (time.perf_counter() - start) * 1000
+
+        ch_router = ContractionHierarchyRouter(graph, hierarchy)
+        a_star_router = MultiFactorAStarRouter(graph)
+        rng = random.Random(0)
+        node_ids = list(graph.nodes)
+        queries = [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(200)]
+
+        start = time.perf_counter()
+        settled = sum(ch_router.find_path(s, t)[2]['nodes_explored'] for s, t in queries)
+        ch_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        a_star_queries = queries[:10]
+        start = time.perf_counter()
+        explored = sum(a_star_router.find_path(s, t)[2]['nodes_explored'] for s, t in a_star_queries)
+        a_star_ms = (time.perf_counter() - start) * 1000 / len(a_star_queries)
+
+        print(f"{num_nodes:<9} {stats['shortcuts']:<10} "
+              f"{stats['preprocess_time_ms'] / 1000:<10.2f} {load_ms:<10.1f} "
+              f"{ch_ms:<9.3f} {settled / len(queries):<8.1f} "
+              f"{a_star_ms:<9.3f} {explored / len(a_star_queries):<9.1f}")
+
+
+if __name__ == "__main__":
+    run_contraction_hierarchy_demo()
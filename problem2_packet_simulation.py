@@ -0,0 +1,232 @@
+"""
+WOA7001 Group Project - Problem 2: Network Routing
+Vectorized Packet Simulation
+
+NumPy version of DynamicLoadBalancerComparative.simulate_dynamic_routing:
+candidate paths of many flows form a sparse path x node incidence matrix,
+node traffic is an array, and all flows advance one packet per tick.
+"""
+
+import random
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem2_contraction_hierarchy import create_geometric_network
+from problem2_routing import DynamicLoadBalancerComparative, create_sample_network
+
+
+class PacketSimulationEngine:
+    """
+    Vectorized version of the dynamic load balancing simulation
+
+    Same load model as DynamicLoadBalancerComparative.simulate_dynamic_routing:
+    a path's load is the mean of 1.0 + 0.1 * traffic over its nodes, each
+    packet takes the least loaded candidate path and adds one unit of traffic
+    to its nodes, and every decay_interval packets all traffic drops by one.
+
+    Candidate paths of all flows form a sparse path x node incidence matrix
+    (coordinate form), and node traffic is a NumPy array. Flows advance in
+    ticks of one packet per flow, all decided at once. Within a flow, path
+    loads are updated exactly through the path overlap counts; traffic from
+    other flows is applied when the node array is resynced at each decay.
+    With a single flow the result is that of the per-packet loop in exact
+    arithmetic (the loop's float sums can break exact load ties differently).
+    """
+
+    def __init__(self, load_balancer: DynamicLoadBalancerComparative):
+        self.load_balancer = load_balancer
+        self.graph = load_balancer.graph
+        self.node_ids = list(self.graph.nodes)
+        self.node_index = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.metrics = MetricsRegistry(engine=type(self).__name__)
+
+    def _build_incidence(self, flow_paths: List[List[List[str]]]) -> Dict:
+        """
+        Build the incidence entries and per-flow overlap counts
+
+        Path p of flow f has slot f * K + p, where K is the largest number of
+        candidate paths of any flow; unused slots get no entries.
+        """
+        num_flows = len(flow_paths)
+        k = max(1, max(len(paths) for paths in flow_paths))
+
+        slots, nodes = [], []
+        lengths = np.zeros(num_flows * k)
+        for f, paths in enumerate(flow_paths):
+            for p, path in enumerate(paths):
+                slots.extend([f * k + p] * len(path))
+                nodes.extend(self.node_index[node] for node in path)
+                lengths[f * k + p] = len(path)
+        slots = np.array(slots, dtype=np.int64)
+        nodes = np.array(nodes, dtype=np.int64)
+
+        # overlap[f, a, b] = number of nodes paths a and b of flow f share:
+        # one bitmask per (flow, node) of the flow's paths through the node
+        keys, inverse = np.unique((slots // k) * len(self.node_ids) + nodes, return_inverse=True)
+        masks = np.zeros(len(keys), dtype=np.int64)
+        np.bitwise_or.at(masks, inverse, 1 << (slots % k))
+        bits = (masks[:, None] >> np.arange(k)) & 1
+        overlap = np.zeros((num_flows, k, k))
+        np.add.at(overlap, keys // len(self.node_ids), bits[:, :, None] * bits[:, None, :])
+
+        return {'k': k, 'slots': slots, 'nodes': nodes,
+                'lengths': lengths.reshape(num_flows, k), 'overlap': overlap}
+
+    def simulate(self, flows: List[Tuple[str, str]], num_packets=20,
+                 decay_interval: int = 5) -> Dict:
+        """
+        Route packets for many (start, end) flows concurrently
+
+        Args:
+            flows: (start, end) pairs
+            num_packets: Packets per flow, an int or one count per flow
+            decay_interval: Ticks between traffic decay steps
+
+        Returns:
+            Per-flow paths, path_counts, path_loads and load_balance_score
+        """
+        start_time = time.perf_counter()
+        with self.metrics.phase('k_paths'):
+            flow_paths = [self.load_balancer._find_k_paths_with_count(start, end)[0]
+                          for start, end in flows]
+        num_flows = len(flows)
+        packets = np.broadcast_to(np.asarray(num_packets, dtype=np.int64), (num_flows,))
+        packets = np.where([len(paths) > 0 for paths in flow_paths], packets, 0)
+
+        with self.metrics.phase('incidence'):
+            incidence = self._build_incidence(flow_paths) if num_flows else None
+        if not num_flows or not packets.any():
+            return {'success': False, 'reason': 'No paths available'}
+        k, slots, nodes = incidence['k'], incidence['slots'], incidence['nodes']
+        lengths, overlap = incidence['lengths'], incidence['overlap']
+        unused = lengths == 0
+        lengths[unused] = 1
+
+        # Shared node traffic, seeded from (and written back to) the balancer
+        traffic = np.zeros(len(self.node_ids), dtype=np.int64)
+        for node, count in self.load_balancer.node_traffic.items():
+            traffic[self.node_index[node]] = count
+
+        def path_traffic():
+            # A @ traffic: summed node traffic of every path slot
+            totals = np.bincount(slots, weights=traffic[nodes], minlength=num_flows * k)
+            totals = totals.reshape(num_flows, k)
+            totals[unused] = np.inf
+            return totals
+
+        path_counts = np.zeros((num_flows, k), dtype=np.int64)
+        path_loads = np.zeros((num_flows, k))
+        pending = np.zeros((num_flows, k))
+        totals = path_traffic()
+        varying = bool((packets != packets.max()).any())
+        active = np.arange(num_flows)
+
+        for tick in range(int(packets.max())):
+            if varying:
+                active = np.flatnonzero(packets > tick)
+            # Mean traffic per node; integer ratios keep exact ties exact
+            mean_traffic = totals[active] / lengths[active]
+            selected = mean_traffic.argmin(axis=1)
+            loads = 1.0 + 0.1 * mean_traffic
+
+            path_counts[active, selected] += 1
+            pending[active, selected] += 1
+            path_loads[active, selected] = loads[np.arange(len(active)), selected]
+            totals[active] += overlap[active, :, selected]
+
+            if tick % decay_interval == 0:
+                # A^T @ pending: traffic added by this window's packets
+                traffic += np.bincount(nodes, weights=pending.ravel()[slots],
+                                       minlength=len(traffic)).astype(np.int64)
+                np.maximum(traffic - 1, 0, out=traffic)
+                pending[:] = 0
+                totals = path_traffic()
+
+        traffic += np.bincount(nodes, weights=pending.ravel()[slots],
+                               minlength=len(traffic)).astype(np.int64)
+        # Replace the whole state: nodes that decayed to zero must not keep
+        # their seeded traffic
+        self.load_balancer.node_traffic.clear()
+        for i in np.flatnonzero(traffic):
+            self.load_balancer.node_traffic[self.node_ids[i]] = int(traffic[i])
+
+        # Load balance score: 1 / (1 + variance of the non-zero path counts)
+        used = path_counts > 0
+        num_used = used.sum(axis=1)
+        mean = path_counts.sum(axis=1) / np.maximum(num_used, 1)
+        variance = (np.where(used, path_counts - mean[:, None], 0) ** 2).sum(axis=1)
+        variance /= np.maximum(num_used, 1)
+        num_paths = np.array([len(paths) for paths in flow_paths])
+        load_balance_score = np.where((num_paths > 1) & (num_used > 0), 1.0 / (1.0 + variance), 0.0)
+
+        elapsed = time.perf_counter() - start_time
+        self.metrics.observe('latency_ms', elapsed * 1000)
+        self.metrics.increment('flows', num_flows)
+        self.metrics.increment('packets', int(path_counts.sum()))
+        return {
+            'success': True,
+            'flows': list(flows),
+            'paths': flow_paths,
+            'path_counts': path_counts,
+            'path_loads': path_loads,
+            'load_balance_score': load_balance_score,
+            'total_packets': int(path_counts.sum()),
+            'execution_time_ms': elapsed * 1000,
+            'packets_per_second': path_counts.sum() / elapsed if elapsed > 0 else 0.0
+        }
+
+
+def run_packet_simulation_demo(num_flows: int = 1000, packets_per_flow: int = 1000):
+    """
+    Check the engine against the per-packet loop, then time a large run
+    """
+    import contextlib
+    import io
+
+    print("=" * 70)
+    print("Vectorized Packet Simulation")
+    print("=" * 70)
+
+    # Single flow: identical to the per-packet loop
+    graph = create_sample_network()
+    for start, end in [('001', '004'), ('002', '004')]:
+        reference = DynamicLoadBalancerComparative(graph, k_paths=3)
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = reference.simulate_dynamic_routing(start, end, num_packets=200)
+        engine = PacketSimulationEngine(DynamicLoadBalancerComparative(graph, k_paths=3))
+        result = engine.simulate([(start, end)], num_packets=200)
+        counts = result['path_counts'][0, :len(result['paths'][0])].tolist()
+        print(f"\n{start}->{end}: loop {expected['path_counts']} "
+              f"(score {expected['load_balance_score']:.3f}), "
+              f"engine {counts} (score {result['load_balance_score'][0]:.3f})")
+
+    # Many concurrent flows on a larger network
+    graph = create_geometric_network(2000, seed=1)
+    rng = random.Random(0)
+    node_ids = list(graph.nodes)
+    flows = [tuple(rng.sample(node_ids, 2)) for _ in range(num_flows)]
+
+    engine = PacketSimulationEngine(DynamicLoadBalancerComparative(graph, k_paths=3))
+    engine.simulate(flows, num_packets=1)  # fill the path cache
+    engine.load_balancer.node_traffic.clear()
+    result = engine.simulate(flows, num_packets=packets_per_flow)
+    print(f"\n{num_flows} flows x {packets_per_flow} packets: "
+          f"{result['total_packets']} packets in {result['execution_time_ms'] / 1000:.2f} s "
+          f"({result['packets_per_second']:,.0f} packets/s)")
+    print(f"Mean load balance score: {result['load_balance_score'].mean():.3f}")
+
+    sample = flows[:20]
+    reference = DynamicLoadBalancerComparative(graph, k_paths=3)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for s, t in sample:
+            reference.simulate_dynamic_routing(s, t, num_packets=packets_per_flow)
+    loop_rate = len(sample) * packets_per_flow / (time.perf_counter() - start)
+    print(f"Per-packet loop: {loop_rate:,.0f} packets/s")
+
+
+if __name__ == "__main__":
+    run_packet_simulation_demo()
@@ -0,0 +1,373 @@
+"""
+WOA7001 Group Project - Problem 2: Network Routing
+Route Query Service: Asyncio JSON Line Protocol
+
+Serves find_path / find_static_best_path queries over TCP, one JSON object
+per line. Queries arriving within a short window are coalesced (duplicates
+answered once, same-source queries batched) and answered by a pool of
+worker processes that build their routers once. Request latency goes into
+the service's MetricsRegistry; NumPy is only imported by the load generator.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from instrumentation import MetricsRegistry
+from problem2_routing import DynamicLoadBalancerComparative, MultiFactorAStarRouter, NetworkGraph
+
+
+SERVICE_METHODS = ('find_path', 'find_static_best_path')
+
+# Routers of the graph being served, built once per worker
+_SERVICE_ROUTERS: Dict[str, object] = {}
+
+
+def _init_service_worker(graph: NetworkGraph, k_paths: int) -> None:
+    """Worker initializer: build the routers once per process"""
+    global _SERVICE_ROUTERS
+    _SERVICE_ROUTERS = {
+        'find_path': MultiFactorAStarRouter(graph),
+        'find_static_best_path': DynamicLoadBalancerComparative(graph, k_paths=k_paths)
+    }
+
+
+def _run_query_batch(method: str, start: str, ends: List[str]) -> List[Dict]:
+    """
+    Answer all queries of one source in a single worker call
+
+    Returns:
+        One JSON-ready result per end node (infinite costs become None)
+    """
+    router = getattr(_SERVICE_ROUTERS[method], method)
+    results = []
+    for end in ends:
+        path, cost, stats = router(start, end)
+        results.append({
+            'path': path,
+            'cost': cost if cost != float('inf') else None,
+            'nodes_explored': stats.get('nodes_explored', 0),
+            'execution_time_ms': stats.get('execution_time_ms', 0.0)
+        })
+    return results
+
+
+class RouteQueryService:
+    """
+    Asyncio route-query service over the routing engines
+
+    Clients send one JSON object per line, e.g.
+        {"id": 7, "method": "find_path", "start": "001", "end": "004"}
+    and get one JSON line back per request, tagged with the same id (replies
+    to pipelined requests can arrive out of order). {"method": "stats"}
+    returns the service counters.
+
+    Queries arriving within batch_window_ms are coalesced: identical
+    queries share one search, and queries of the same method and source go
+    to the worker pool as one job. Searches run in worker processes (or
+    threads where fork is unavailable), so the event loop never blocks.
+    """
+
+    def __init__(self, graph: NetworkGraph, k_paths: int = 3,
+                 batch_window_ms: float = 2.0, num_workers: Optional[int] = None):
+        self.graph = graph
+        self.k_paths = k_paths
+        self.batch_window = batch_window_ms / 1000
+        self.num_workers = num_workers or os.cpu_count() or 1
+
+        self.executor = None
+        self.server = None
+        self._pending: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._batch: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._flush_handle = None
+        self._clients = set()
+
+        # Service counters; request latency in a fixed-size histogram
+        self.metrics = MetricsRegistry(engine=type(self).__name__)
+        self.service_stats = {
+            'requests': 0,
+            'completed': 0,
+            'errors': 0,
+            'coalesced': 0,
+            'batches': 0,
+            'worker_jobs': 0
+        }
+        self.started_at = time.perf_counter()
+
+    def _start_executor(self) -> None:
+        """Start the worker pool (forked processes when available)"""
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self.executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                                mp_context=multiprocessing.get_context('fork'),
+                                                initializer=_init_service_worker,
+                                                initargs=(self.graph, self.k_paths))
+        else:
+            _init_service_worker(self.graph, self.k_paths)
+            self.executor = ThreadPoolExecutor(max_workers=self.num_workers)
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0,
+                    path: Optional[str] = None) -> None:
+        """
+        Start listening on a Unix socket (path) or a localhost TCP port
+
+        Port 0 picks a free port; see self.address for the bound address.
+        """
+        self._start_executor()
+        self.started_at = time.perf_counter()
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_client, path=path)
+        else:
+            self.server = await asyncio.start_server(self._handle_client, host, port)
+
+    @property
+    def address(self):
+        """Bound address: (host, port) for TCP, the path for a Unix socket"""
+        return self.server.sockets[0].getsockname()
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled"""
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop the server, its open connections and the worker pool"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for client in list(self._clients):
+            client.cancel()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Query coalescing
+    # ------------------------------------------------------------------
+
+    async def query(self, method: str, start: str, end: str) -> Dict:
+        """Answer one query, sharing work with queries in the same window"""
+        if method not in SERVICE_METHODS:
+            raise ValueError(f"Unknown method: {method}")
+        if start not in self.graph.nodes or end not in self.graph.nodes:
+            raise ValueError(f"Unknown node: {start if start not in self.graph.nodes else end}")
+
+        key = (method, start, end)
+        future = self._pending.get(key)
+        if future is not None:
+            self.service_stats['coalesced'] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[key] = future
+            self._batch[(method, start)].append(end)
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.batch_window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Send the queries of the closing window to the worker pool"""
+        self._flush_handle = None
+        batch, self._batch = self._batch, defaultdict(list)
+        self.service_stats['batches'] += 1
+        loop = asyncio.get_running_loop()
+        for (method, start), ends in batch.items():
+            self.service_stats['worker_jobs'] += 1
+            job = loop.run_in_executor(self.executor, _run_query_batch, method, start, ends)
+            job.add_done_callback(
+                lambda done, method=method, start=start, ends=ends:
+                self._resolve(method, start, ends, done))
+
+    def _resolve(self, method: str, start: str, ends: List[str], done: asyncio.Future) -> None:
+        """Hand a finished job's results to every waiting query"""
+        error = done.exception()
+        for i, end in enumerate(ends):
+            future = self._pending.pop((method, start, end))
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(done.result()[i])
+
+    # ------------------------------------------------------------------
+    # Line protocol
+    # ------------------------------------------------------------------
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Read request lines and answer each one concurrently"""
+        self._clients.add(asyncio.current_task())
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(self._answer(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.discard(asyncio.current_task())
+            writer.close()
+
+    async def _answer(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """Answer one request line"""
+        arrived = time.perf_counter()
+        self.service_stats['requests'] += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get('id')
+            if request.get('method') == 'stats':
+                response = self.get_stats()
+            else:
+                response = await self.query(request.get('method'),
+                                            str(request.get('start')), str(request.get('end')))
+            response = dict(response, id=request_id)
+            self.service_stats['completed'] += 1
+            self.metrics.observe('latency_ms', (time.perf_counter() - arrived) * 1000)
+        except Exception as error:
+            self.service_stats['errors'] += 1
+            response = {'id': request_id, 'error': str(error)}
+
+        writer.write(json.dumps(response).encode() + b'\n')
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    def get_stats(self) -> Dict:
+        """Latency percentiles (ms), throughput (requests/s) and counters"""
+        latency = self.metrics.histogram('latency_ms').snapshot()
+        elapsed = time.perf_counter() - self.started_at
+        return dict(self.service_stats,
+                    p50_latency_ms=latency['p50'],
+                    p99_latency_ms=latency['p99'],
+                    throughput_rps=self.service_stats['completed'] / elapsed if elapsed > 0 else 0.0)
+
+
+# ==================== Load Generator ====================
+
+async def run_load_generator(queries: List[Tuple[str, str, str]], host: str = '127.0.0.1',
+                             port: int = 0, path: Optional[str] = None,
+                             connections: int = 4, in_flight: int = 16) -> Dict:
+    """
+    Replay queries against a running service and measure client latency
+
+    Args:
+        queries: (method, start, end) triples, spread over the connections
+        host, port, path: Service address (path selects a Unix socket)
+        connections: Concurrent client connections
+        in_flight: Pipelined requests per connection
+
+    Returns:
+        Client-side p50/p99 latency (ms), throughput and error count
+    """
+    latencies = []
+    errors = 0
+
+    async def client(share: List[Tuple[str, str, str]]) -> None:
+        nonlocal errors
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        sent_at = {}
+        next_query = 0
+        while next_query < len(share) or sent_at:
+            while next_query < len(share) and len(sent_at) < in_flight:
+                method, start, end = share[next_query]
+                writer.write(json.dumps({'id': next_query, 'method': method,
+                                         'start': start, 'end': end}).encode() + b'\n')
+                sent_at[next_query] = time.perf_counter()
+                next_query += 1
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append((time.perf_counter() - sent_at.pop(response['id'])) * 1000)
+            errors += 'error' in response
+        writer.close()
+        await writer.wait_closed()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client(queries[i::connections]) for i in range(connections)))
+    elapsed = time.perf_counter() - start_time
+
+    import numpy as np
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'p50_latency_ms': float(np.percentile(latencies, 50)) if latencies else 0.0,
+        'p99_latency_ms': float(np.percentile(latencies, 99)) if latencies else 0.0,
+        'throughput_rps': len(latencies) / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def _run_async(coroutine):
+    """Run a coroutine to completion, also inside Jupyter's running loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=asyncio.run(coroutine)))
+    thread.start()
+    thread.join()
+    return result['value']
+
+
+def run_route_service_demo(num_nodes: int = 1000, num_queries: int = 2000):
+    """
+    Serve a random network over localhost TCP and drive it with the load
+    generator; repeated and same-source queries exercise the coalescing
+    """
+    print("=" * 70)
+    print("Route Query Service: Asyncio JSON Line Protocol")
+    print("=" * 70)
+
+    from problem2_contraction_hierarchy import create_geometric_network
+
+    graph = create_geometric_network(num_nodes, seed=num_nodes)
+    rng = random.Random(0)
+    node_ids = list(graph.nodes)
+    sources = rng.sample(node_ids, 20)
+    hot_pairs = [(rng.choice(sources), rng.choice(node_ids)) for _ in range(200)]
+    queries = [(rng.choice(SERVICE_METHODS),) + rng.choice(hot_pairs) for _ in range(num_queries)]
+
+    async def demo():
+        service = RouteQueryService(graph)
+        await service.start()
+        host, port = service.address[:2]
+        print(f"\nListening on {host}:{port} with {service.num_workers} worker(s)")
+        try:
+            client = await run_load_generator(queries, host, port)
+        finally:
+            await service.close()
+        return client, service.get_stats()
+
+    client, server = _run_async(demo())
+
+    print(f"\n{'Side':<8} {'Requests':<10} {'Errors':<8} {'p50 (ms)':<10} "
+          f"{'p99 (ms)':<10} {'Throughput (req/s)':<18}")
+    print("-" * 70)
+    print(f"{'Client':<8} {client['requests']:<10} {client['errors']:<8} "
+          f"{client['p50_latency_ms']:<10.2f} {client['p99_latency_ms']:<10.2f} "
+          f"{client['throughput_rps']:<18.0f}")
+    print(f"{'Server':<8} {server['completed']:<10} {server['errors']:<8} "
+          f"{server['p50_latency_ms']:<10.2f} {server['p99_latency_ms']:<10.2f} "
+          f"{server['throughput_rps']:<18.0f}")
+    print(f"\nCoalesced duplicates: {server['coalesced']}, "
+          f"windows: {server['batches']}, worker jobs: {server['worker_jobs']}")
+
+
+if __name__ == "__main__":
+    run_route_service_demo()
@@ -0,0 +1,1204 @@
+"""
+WOA7001 Network Routing Algorithm Implementation - Comparative Version
+Filename: problem2_routing.py
+
+This version ensures both algorithms output comparable metrics for fair comparison
+
+The array-based engines live in their own modules and import NumPy; this
+module (graph, A*, load balancing, network generators) does not, so it
+starts quickly in short-lived processes:
+
+    problem2_routing_table.py           precomputed shortest-path trees
+    problem2_contraction_hierarchy.py   contraction hierarchy
+    problem2_compact_graph.py           CSR graph and routers
+    problem2_packet_simulation.py       vectorized packet simulation
+    problem2_route_service.py           asyncio query service
+    problem2_incremental_routing.py     LPA* flow routing
+
+Usage:
+    python problem2_routing.py                                # comparative analysis
+    python problem2_routing.py route network.json 001 004 --method ch
+    python problem2_routing.py route network.json --queries pairs.txt --format table
+    python problem2_routing.py startup-check --target-ms 50
+"""
+
+import heapq
+import json
+import random
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Set
+from collections import defaultdict, OrderedDict
+from statistics import fmean, pvariance
+import time
+
+from instrumentation import MetricsRegistry
+from startup_check import IMPORT_TARGET_MS, check_import_budget
+
+# ==================== Data Structure Definitions ====================
+
+@dataclass
+class NetworkNode:
+    """Network Node Structure"""
+    node_id: str
+    name: str
+    connected_nodes: List[str]
+    traffic_load: str
+    link_quality: str
+
+    def __post_init__(self):
+        self.connections = set(self.connected_nodes)
+
+@dataclass
+class EdgeInfo:
+    """Edge Information Structure"""
+    quality: float        # Link quality value
+    traffic_factor: float # Traffic load factor
+    cost: float           # Comprehensive cost
+
+class NetworkGraph:
+    """Network Graph Representation"""
+
+    def __init__(self):
+        self.nodes: Dict[str, NetworkNode] = {}
+        self.edges: Dict[Tuple[str, str], EdgeInfo] = {}
+        self.listeners = []  # called with the edges changed by update_node
+
+    def add_node(self, node: NetworkNode) -> None:
+        """Add node to graph"""
+        self.nodes[node.node_id] = node
+
+    def build_edges(self) -> None:
+        """
+        Construct bidirectional edges
+
+        A link listed by only one of its nodes is added to the other node's
+        connections too, so connections are both out- and in-links (reverse
+        searches and update_node rely on this).
+        """
+        for node_id, node in self.nodes.items():
+            for neighbor_id in node.connections:
+                if neighbor_id in self.nodes:
+                    self.nodes[neighbor_id].connections.add(node_id)
+                    self._create_edge(node_id, neighbor_id)
+
+    def _create_edge(self, node1: str, node2: str) -> None:
+        """Create edge between two nodes"""
+        node1_obj = self.nodes[node1]
+        node2_obj = self.nodes[node2]
+
+        # Map link quality to numerical values
+        quality_map = {'Excellent': 1.0, 'Good': 2.0, 'Fair': 3.0, 'Poor': 4.0}
+        quality1 = quality_map.get(node1_obj.link_quality, 2.5)
+        quality2 = quality_map.get(node2_obj.link_quality, 2.5)
+        avg_quality = (quality1 + quality2) / 2
+
+        # Map traffic load to numerical factors
+        traffic_map = {'High': 2.0, 'Medium': 1.5, 'Low': 1.0}
+        traffic1 = traffic_map.get(node1_obj.traffic_load, 1.5)
+        traffic2 = traffic_map.get(node2_obj.traffic_load, 1.5)
+        avg_traffic = (traffic1 + traffic2) / 2
+
+        # Calculate comprehensive cost (same as A* algorithm)
+        cost = avg_quality * avg_traffic
+
+        edge_info = EdgeInfo(
+            quality=avg_quality,
+            traffic_factor=avg_traffic,
+            cost=cost
+        )
+
+        # Store bidirectional edges
+        self.edges[(node1, node2)] = edge_info
+        self.edges[(node2, node1)] = edge_info
+
+    def get_edge(self, node1: str, node2: str) -> Optional[EdgeInfo]:
+        """Retrieve edge information"""
+        return self.edges.get((node1, node2))
+
+    def add_listener(self, callback) -> None:
+        """Register callback(changed_edges) for update_node changes"""
+        self.listeners.append(callback)
+
+    def update_node(self, node_id: str, traffic_load: Optional[str] = None,
+                    link_quality: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        Change a node's traffic load and/or link quality
+
+        The node's edges are rebuilt and every listener is called with the
+        edges whose cost changed.
+
+        Returns:
+            Changed edges as (node1, node2, old_cost), one per node pair
+        """
+        node = self.nodes[node_id]
+        if traffic_load is not None:
+            node.traffic_load = traffic_load
+        if link_quality is not None:
+            node.link_quality = link_quality
+
+        changed = []
+        for neighbor in node.connections:
+            edge = self.get_edge(node_id, neighbor)
+            if edge:
+                self._create_edge(node_id, neighbor)
+                if self.get_edge(node_id, neighbor).cost != edge.cost:
+                    changed.append((node_id, neighbor, edge.cost))
+
+        if changed:
+            for callback in self.listeners:
+                callback(changed)
+        return changed
+
+# ==================== Algorithm 1: Multi-Factor A* ====================
+
+class MultiFactorAStarRouter:
+    """Multi-Factor A* Routing Algorithm"""
+
+    def __init__(self, graph: NetworkGraph):
+        self.graph = graph
+        self.performance_stats = {
+            'paths_found': 0,
+            'total_operations': 0
+        }
+        # Fixed-size latency / search-effort histograms
+        self.metrics = MetricsRegistry(engine=type(self).__name__)
+
+    def heuristic(self, node: str, target: str) -> float:
+        """
+        Heuristic function for A* algorithm
+        Returns conservative estimate of cost from node to target
+        """
+        return 2.0
+
+    def find_path(self, start: str, end: str,
+                  quality_weight: float = 0.7,
+                  traffic_weight: float = 0.3) -> Tuple[List[str], float, Dict]:
+        """
+        Find path using Multi-Factor A* algorithm
+
+        Returns:
+            (path, total_cost, performance_stats)
+        """
+        start_time = time.perf_counter()
+
+        if start not in self.graph.nodes or end not in self.graph.nodes:
+            return [], float('inf'), {}
+
+        # Initialize A* data structures
+        open_set = []
+        heapq.heappush(open_set, (0, start))
+        heap_pushes = 1
+        heap_pops = 0
+
+        came_from = {}
+
+        g_score = {node_id: float('inf') for node_id in self.graph.nodes}
+        g_score[start] = 0
+
+        f_score = {node_id: float('inf') for node_id in self.graph.nodes}
+        f_score[start] = self.heuristic(start, end)
+
+        nodes_explored = 0
+
+        while open_set:
+            _, current = heapq.heappop(open_set)
+            heap_pops += 1
+            nodes_explored += 1
+
+            if current == end:
+                # Reconstruct path
+                path = []
+                while current in came_from:
+                    path.append(current)
+                    current = came_from[current]
+                path.append(start)
+                path.reverse()
+
+                execution_time = (time.perf_counter() - start_time) * 1000
+
+                # Update performance statistics
+                self._record_search(execution_time, nodes_explored, heap_pushes, heap_pops)
+
+                # Calculate path cost using same method as load balancing
+                path_cost = self._calculate_path_cost(path)
+                path_metrics = self._calculate_path_metrics(path)
+
+                return path, path_cost, {
+                    'execution_time_ms': execution_time,
+                    'nodes_explored': nodes_explored,
+                    'path_length': len(path) - 1,
+                    'path_cost': path_cost,
+                    'metrics': path_metrics
+                }
+
+            current_node = self.graph.nodes[current]
+
+            for neighbor in current_node.connections:
+                if neighbor not in self.graph.nodes:
+                    continue
+
+                edge = self.graph.get_edge(current, neighbor)
+                if not edge:
+                    continue
+
+                # Calculate edge cost (same as load balancing algorithm)
+                edge_cost = edge.cost
+
+                tentative_g_score = g_score[current] + edge_cost
+
+                if tentative_g_score < g_score[neighbor]:
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    f_score[neighbor] = tentative_g_score + self.heuristic(neighbor, end)
+
+                    in_open_set = any(neighbor == item[1] for item in open_set)
+                    if not in_open_set:
+                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                        heap_pushes += 1
+
+        # No path found
+        execution_time = (time.perf_counter() - start_time) * 1000
+        return [], float('inf'), {
+            'execution_time_ms': execution_time,
+            'nodes_explored': nodes_explored,
+            'path_length': 0,
+            'path_cost': float('inf'),
+            'metrics': {}
+        }
+
+    def _record_search(self, execution_time: float, nodes_explored: int,
+                       heap_pushes: Optional[int] = None,
+                       heap_pops: Optional[int] = None) -> None:
+        """Count a found path and record its latency and search effort"""
+        self.performance_stats['paths_found'] += 1
+        self.performance_stats['total_operations'] += nodes_explored
+        self.metrics.observe('latency_ms', execution_time)
+        self.metrics.observe('nodes_explored', nodes_explored)
+        if heap_pushes is not None:
+            self.metrics.observe('heap_pushes', heap_pushes)
+            self.metrics.observe('heap_pops', heap_pops)
+
+    def _calculate_path_cost(self, path: List[str]) -> float:
+        """Calculate total cost of a path (same method as load balancing)"""
+        if len(path) < 2:
+            return 0
+
+        total_cost = 0
+        for i in range(len(path) - 1):
+            edge = self.graph.get_edge(path[i], path[i+1])
+            if edge:
+                total_cost += edge.cost
+
+        return total_cost
+
+    def _calculate_path_metrics(self, path: List[str]) -> Dict:
+        """Calculate various metrics for a path"""
+        if len(path) < 2:
+            return {}
+
+        total_quality = 0
+        total_traffic = 0
+        total_cost = 0
+        hops = len(path) - 1
+
+        for i in range(hops):
+            edge = self.graph.get_edge(path[i], path[i+1])
+            if edge:
+                total_quality += edge.quality
+                total_traffic += edge.traffic_factor
+                total_cost += edge.cost
+
+        return {
+            'avg_quality': total_quality / hops,
+            'avg_traffic': total_traffic / hops,
+            'avg_cost': total_cost / hops,
+            'hops': hops
+        }
+
+    def get_performance_summary(self) -> Dict:
+        """Get performance statistics summary"""
+        times = self.metrics.histogram('latency_ms').snapshot()
+        return {
+            'total_paths_found': self.performance_stats['paths_found'],
+            'avg_execution_time_ms': times['mean'],
+            'min_execution_time_ms': times['min'],
+            'max_execution_time_ms': times['max'],
+            'p50_execution_time_ms': times['p50'],
+            'p90_execution_time_ms': times['p90'],
+            'p99_execution_time_ms': times['p99'],
+            'avg_operations_per_search': (self.performance_stats['total_operations'] /
+                                         self.performance_stats['paths_found']
+                                         if self.performance_stats['paths_found'] > 0 else 0)
+        }
+
+# ==================== Bounded Path Cache ====================
+
+class PathCache:
+    """
+    Bounded LRU path cache with an optional time-to-live
+
+    Holds at most max_entries results; the least recently used entry is
+    evicted first, and entries older than ttl_seconds are treated as misses.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict = OrderedDict()  # key -> (stored_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Return the cached value, or None on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None and self.ttl_seconds is not None:
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self.entries[key]
+                self.expirations += 1
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        self.entries[key] = (time.monotonic(), value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. after edge costs change)"""
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+# ==================== Algorithm 2: Dynamic Load Balancing - Comparative Version ====================
+
+class DynamicLoadBalancerComparative:
+    """
+    Dynamic Load Balancing Algorithm - Comparative Version
+
+    Modified to output comparable metrics to A* algorithm:
+    - Same test node pairs
+    - Same cost calculation method
+    - Comparable performance metrics
+    """
+
+    def __init__(self, graph: NetworkGraph, k_paths: int = 3,
+                 cache_size: int = 10000, cache_ttl: Optional[float] = None):
+        self.graph = graph
+        self.k_paths = k_paths
+
+        # Traffic monitoring (for dynamic simulation only)
+        self.node_traffic = defaultdict(int)
+        self.path_usage = defaultdict(int)
+        self.path_weights = defaultdict(list)
+
+        # Performance statistics for comparative analysis
+        self.comparative_stats = {
+            'paths_found': 0,
+            'total_operations': 0
+        }
+        self.metrics = MetricsRegistry(engine=type(self).__name__)
+
+        # Bounded LRU/TTL path cache for efficiency; cached K paths are
+        # ranked by the old costs, so drop them whenever edge costs change
+        self.path_cache = PathCache(cache_size, cache_ttl)
+        graph.add_listener(lambda changed: self.path_cache.clear())
+
+    def find_static_best_path(self, start: str, end: str) -> Tuple[List[str], float, Dict]:
+        """
+        Find the best static path for comparative analysis
+
+        This method provides outputs comparable to A* algorithm:
+        - Returns single best path (lowest static cost)
+        - Calculates execution time
+        - Counts nodes explored
+
+        Returns:
+            (best_path, path_cost, performance_stats)
+        """
+        start_time = time.perf_counter()
+
+        if start not in self.graph.nodes or end not in self.graph.nodes:
+            return [], float('inf'), {}
+
+        # Find K candidate paths
+        cache_hits = self.path_cache.hits
+        with self.metrics.phase('k_paths'):
+            paths, nodes_explored = self._find_k_paths_with_count(start, end)
+        cache_hit = self.path_cache.hits > cache_hits
+
+        if not paths:
+            execution_time = (time.perf_counter() - start_time) * 1000
+            return [], float('inf'), {
+                'execution_time_ms': execution_time,
+                'nodes_explored': nodes_explored,
+                'path_length': 0,
+                'path_cost': float('inf')
+            }
+
+        # Calculate static cost for each path (same method as A*)
+        path_costs = []
+        for path in paths:
+            cost = self._calculate_static_path_cost(path)
+            path_costs.append(cost)
+
+        # Select path with minimum static cost
+        best_idx = path_costs.index(min(path_costs))
+        best_path = paths[best_idx]
+        best_cost = path_costs[best_idx]
+
+        execution_time = (time.perf_counter() - start_time) * 1000
+
+        # Update comparative statistics
+        self.comparative_stats['paths_found'] += 1
+        self.comparative_stats['total_operations'] += nodes_explored
+        self.metrics.observe('latency_ms', execution_time)
+        self.metrics.observe('nodes_explored', nodes_explored)
+
+        # Calculate path metrics
+        path_metrics = self._calculate_path_metrics(best_path)
+
+        return best_path, best_cost, {
+            'execution_time_ms': execution_time,
+            'nodes_explored': nodes_explored,
+            'path_length': len(best_path) - 1,
+            'path_cost': best_cost,
+            'alternative_paths_found': len(paths),
+            'path_index': best_idx,
+            'cache_hit': cache_hit,
+            'metrics': path_metrics
+        }
+
+    def _find_k_paths_with_count(self, start: str, end: str) -> Tuple[List[List[str]], int]:
+        """
+        Find the K shortest loopless paths (Yen's algorithm) by static cost
+
+        Paths come back in ascending cost order (ties broken by node IDs), so
+        the result is deterministic. A cache hit reports the node count of
+        the search that produced the cached paths.
+
+        Returns:
+            (list_of_paths, total_nodes_explored)
+        """
+        cache_key = (start, end, self.k_paths)
+        cached = self.path_cache.get(cache_key)
+        if cached is not None:
+            return cached['paths'], cached['nodes_explored']
+
+        paths, nodes_explored = self._yen_k_shortest_paths(start, end, self.k_paths)
+
+        self.path_cache.put(cache_key, {
+            'paths': paths,
+            'nodes_explored': nodes_explored
+        })
+
+        return paths, nodes_explored
+
+    def _yen_k_shortest_paths(self, start: str, end: str, k: int) -> Tuple[List[List[str]], int]:
+        """
+        Yen's K shortest loopless paths with a shared shortest-path tree
+
+        One Dijkstra from the destination gives the first path and exact
+        cost-to-go values. Removing nodes and edges for a spur search can
+        only make paths longer, so those values stay an admissible (and
+        consistent) A* heuristic and every spur search is goal-directed.
+
+        Returns:
+            (list_of_paths, total_nodes_explored)
+        """
+        to_end, next_node, nodes_explored = self._shortest_path_tree_to(end)
+        if start not in to_end:
+            return [], nodes_explored
+
+        first = [start]
+        while first[-1] != end:
+            first.append(next_node[first[-1]])
+        paths = [first]
+
+        candidates = []  # heap of (cost, path)
+        seen = {tuple(first)}
+
+        while len(paths) < k:
+            previous = paths[-1]
+            root_costs = [0.0]
+            for node1, node2 in zip(previous, previous[1:]):
+                root_costs.append(root_costs[-1] + self._edge_cost(node1, node2))
+            for i in range(len(previous) - 1):
+                spur_node = previous[i]
+                root_path = previous[:i + 1]
+
+                # Block the next edge of every accepted path sharing this root,
+                # and the root nodes before the spur node (keeps paths loopless)
+                removed_edges = {(path[i], path[i + 1]) for path in paths
+                                 if len(path) > i + 1 and path[:i + 1] == root_path}
+                removed_nodes = set(root_path[:-1])
+
+                spur_path, spur_cost, explored = self._spur_search(
+                    spur_node, end, to_end, removed_nodes, removed_edges)
+                nodes_explored += explored
+                if spur_path is None:
+                    continue
+
+                candidate = root_path[:-1] + spur_path
+                if tuple(candidate) not in seen:
+                    seen.add(tuple(candidate))
+                    heapq.heappush(candidates, (root_costs[i] + spur_cost, candidate))
+
+            if not candidates:
+                break
+            _, path = heapq.heappop(candidates)
+            paths.append(path)
+
+        return paths, nodes_explored
+
+    def _shortest_path_tree_to(self, end: str) -> Tuple[Dict[str, float], Dict[str, str], int]:
+        """
+        Dijkstra from the destination over static edge costs
+
+        Returns:
+            (cost_to_end, next_node_towards_end, nodes_settled)
+        """
+        cost_to_end = {end: 0.0}
+        next_node = {}
+        settled = 0
+        pq = [(0.0, end)]
+
+        while pq:
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > cost_to_end[current]:
+                continue
+            settled += 1
+            for neighbor in self.graph.nodes[current].connections:
+                edge = self.graph.get_edge(neighbor, current)
+                if not edge:
+                    continue
+                new_dist = current_dist + edge.cost
+                if new_dist < cost_to_end.get(neighbor, float('inf')):
+                    cost_to_end[neighbor] = new_dist
+                    next_node[neighbor] = current
+                    heapq.heappush(pq, (new_dist, neighbor))
+
+        return cost_to_end, next_node, settled
+
+    def _spur_search(self, start: str, end: str, heuristic: Dict[str, float],
+                     removed_nodes: Set[str], removed_edges: Set[Tuple[str, str]]
+                     ) -> Tuple[Optional[List[str]], float, int]:
+        """
+        A* from the spur node with the destination tree as heuristic
+
+        Returns:
+            (path or None, path_cost, nodes_settled)
+        """
+        g_score = {start: 0.0}
+        previous = {start: None}
+        closed = set()
+        pq = [(heuristic.get(start, float('inf')), start)]
+
+        while pq:
+            _, current = heapq.heappop(pq)
+            if current in closed:
+                continue
+            closed.add(current)
+
+            if current == end:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = previous[current]
+                path.reverse()
+                return path, g_score[end], len(closed)
+
+            for neighbor in self.graph.nodes[current].connections:
+                if (neighbor in removed_nodes or neighbor in closed
+                        or (current, neighbor) in removed_edges
+                        or neighbor not in heuristic):
+                    continue
+                edge = self.graph.get_edge(current, neighbor)
+                if not edge:
+                    continue
+                tentative = g_score[current] + edge.cost
+                if tentative < g_score.get(neighbor, float('inf')):
+                    g_score[neighbor] = tentative
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (tentative + heuristic[neighbor], neighbor))
+
+        return None, float('inf'), len(closed)
+
+    def _edge_cost(self, node1: str, node2: str) -> float:
+        """Static cost of one edge"""
+        return self.graph.get_edge(node1, node2).cost
+
+    def _calculate_static_path_cost(self, path: List[str]) -> float:
+        """Calculate static cost of a path (same method as A* algorithm)"""
+        if len(path) < 2:
+            return 0
+
+        total_cost = 0
+        for i in range(len(path) - 1):
+            edge = self.graph.get_edge(path[i], path[i+1])
+            if edge:
+                total_cost += edge.cost
+
+        return total_cost
+
+    def _calculate_path_metrics(self, path: List[str]) -> Dict:
+        """Calculate various metrics for a path"""
+        if len(path) < 2:
+            return {}
+
+        total_quality = 0
+        total_traffic = 0
+        total_cost = 0
+        hops = len(path) - 1
+
+        for i in range(hops):
+            edge = self.graph.get_edge(path[i], path[i+1])
+            if edge:
+                total_quality += edge.quality
+                total_traffic += edge.traffic_factor
+                total_cost += edge.cost
+
+        return {
+            'avg_quality': total_quality / hops,
+            'avg_traffic': total_traffic / hops,
+            'avg_cost': total_cost / hops,
+            'hops': hops
+        }
+
+    def simulate_dynamic_routing(self, start: str, end: str, num_packets: int = 20) -> Dict:
+        """
+        Simulate dynamic routing with traffic
+
+        This is the original load balancing functionality
+        kept for demonstration purposes
+        """
+        print(f"\nDynamic Load Balancing Simulation: {start} -> {end}")
+        print(f"Routing {num_packets} packets with traffic awareness")
+
+        # Find candidate paths
+        paths, _ = self._find_k_paths_with_count(start, end)
+
+        if not paths:
+            return {'success': False, 'reason': 'No paths available'}
+
+        print(f"Found {len(paths)} candidate paths:")
+        for i, path in enumerate(paths):
+            path_names = [self.graph.nodes[node].name for node in path]
+            static_cost = self._calculate_static_path_cost(path)
+            print(f"  Path {i+1}: {' → '.join(path_names)} (Static cost: {static_cost:.2f})")
+
+        # Simulate packet routing with load awareness
+        path_counts = [0] * len(paths)
+        path_loads = [0.0] * len(paths)
+
+        for packet_num in range(num_packets):
+            # Calculate current load for each path
+            current_loads = []
+            for path in paths:
+                path_load = 0
+                for node in path:
+                    # Simple load model: more traffic = higher load
+                    node_load = 1.0 + (self.node_traffic[node] * 0.1)
+                    path_load += node_load
+                current_loads.append(path_load / len(path))
+
+            # Select path with minimum current load
+            selected_idx = current_loads.index(min(current_loads))
+            selected_path = paths[selected_idx]
+
+            # Update statistics
+            path_counts[selected_idx] += 1
+            path_loads[selected_idx] = current_loads[selected_idx]
+
+            # Update node traffic (simulate traffic accumulation)
+            for node in selected_path:
+                self.node_traffic[node] += 1
+
+            # Simulate traffic decay (every 5 packets)
+            if packet_num % 5 == 0:
+                for node in self.node_traffic:
+                    if self.node_traffic[node] > 0:
+                        self.node_traffic[node] -= 1
+
+        # Calculate dynamic metrics
+        total_packets = sum(path_counts)
+        load_balance_score = 0
+
+        if len(paths) > 1 and total_packets > 0:
+            # Calculate load balance: 1 - coefficient of variation
+            avg_load = fmean([c for c in path_counts if c > 0])
+            if avg_load > 0:
+                variance = pvariance([c for c in path_counts if c > 0])
+                load_balance_score = 1.0 / (1.0 + variance)
+
+        print("\nDynamic Routing Results:")
+        print("-" * 40)
+        for i in range(len(paths)):
+            if path_counts[i] > 0:
+                percentage = (path_counts[i] / total_packets) * 100
+                path_names = [self.graph.nodes[node].name for node in paths[i]]
+                print(f"  Path {i+1}: {path_counts[i]} packets ({percentage:.1f}%)")
+                print(f"    Average load: {path_loads[i]:.2f}")
+
+        print(f"\nLoad Balance Score: {load_balance_score:.3f} (1.0 = perfect balance)")
+
+        return {
+            'success': True,
+            'paths': paths,
+            'path_counts': path_counts,
+            'path_loads': path_loads,
+            'load_balance_score': load_balance_score,
+            'total_packets': total_packets
+        }
+
+    def get_comparative_stats_summary(self) -> Dict:
+        """Get comparative performance statistics"""
+        times = self.metrics.histogram('latency_ms').snapshot()
+
+        return {
+            'total_paths_found': self.comparative_stats['paths_found'],
+            'avg_execution_time_ms': times['mean'],
+            'min_execution_time_ms': times['min'],
+            'max_execution_time_ms': times['max'],
+            'p50_execution_time_ms': times['p50'],
+            'p90_execution_time_ms': times['p90'],
+            'p99_execution_time_ms': times['p99'],
+            'avg_nodes_explored': self.metrics.histogram('nodes_explored').mean(),
+            'avg_operations_per_search': (self.comparative_stats['total_operations'] /
+                                         self.comparative_stats['paths_found']
+                                         if self.comparative_stats['paths_found'] > 0 else 0),
+            'path_cache': self.path_cache.get_stats()
+        }
+
+# ==================== Network Creation Utility ====================
+
+def create_sample_network() -> NetworkGraph:
+    """Create sample network based on Table 4"""
+    graph = NetworkGraph()
+
+    graph.add_node(NetworkNode(
+        node_id='001',
+        name='Router-A',
+        connected_nodes=['002', '003', '004'],
+        traffic_load='High',
+        link_quality='Good'
+    ))
+
+    graph.add_node(NetworkNode(
+        node_id='002',
+        name='Router-B',
+        connected_nodes=['001', '003'],
+        traffic_load='Medium',
+        link_quality='Fair'
+    ))
+
+    graph.add_node(NetworkNode(
+        node_id='003',
+        name='Router-C',
+        connected_nodes=['001', '002', '004'],
+        traffic_load='High',
+        link_quality='Excellent'
+    ))
+
+    graph.add_node(NetworkNode(
+        node_id='004',
+        name='Router-D',
+        connected_nodes=['001', '003'],
+        traffic_load='Low',
+        link_quality='Poor'
+    ))
+
+    graph.build_edges()
+    return graph
+
+
+def create_random_network(num_nodes: int, avg_degree: int = 4, seed: int = 0) -> NetworkGraph:
+    """
+    Create a connected random network with Table 4 style attributes
+
+    A random spanning tree keeps the network connected; the remaining
+    links join random router pairs.
+    """
+    rng = random.Random(seed)
+    node_ids = [f"{i:06d}" for i in range(num_nodes)]
+    links = defaultdict(set)
+
+    for i in range(1, num_nodes):
+        j = rng.randrange(i)
+        links[node_ids[i]].add(node_ids[j])
+        links[node_ids[j]].add(node_ids[i])
+    for _ in range(max(0, num_nodes * avg_degree // 2 - (num_nodes - 1))):
+        a, b = rng.sample(node_ids, 2)
+        links[a].add(b)
+        links[b].add(a)
+
+    graph = NetworkGraph()
+    for i, node_id in enumerate(node_ids):
+        graph.add_node(NetworkNode(
+            node_id=node_id,
+            name=f"Router-{i}",
+            connected_nodes=sorted(links[node_id]),
+            traffic_load=rng.choice(['High', 'Medium', 'Low']),
+            link_quality=rng.choice(['Excellent', 'Good', 'Fair', 'Poor'])
+        ))
+    graph.build_edges()
+    return graph
+
+
+def load_network(path: str) -> NetworkGraph:
+    """
+    Load a network from a JSON file
+
+    The file holds a list of nodes (or {"nodes": [...]}) with the
+    NetworkNode fields: node_id, name, connected_nodes, traffic_load and
+    link_quality.
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data['nodes']
+
+    graph = NetworkGraph()
+    for node in data:
+        graph.add_node(NetworkNode(
+            node_id=str(node['node_id']),
+            name=node.get('name', str(node['node_id'])),
+            connected_nodes=[str(neighbor) for neighbor in node['connected_nodes']],
+            traffic_load=node.get('traffic_load', 'Medium'),
+            link_quality=node.get('link_quality', 'Good')
+        ))
+    graph.build_edges()
+    return graph
+
+# ==================== Comparative Analysis Function ====================
+
+def run_comparative_analysis():
+    """
+    Run comprehensive comparative analysis of both algorithms
+
+    Uses the same test cases for both algorithms and
+    outputs comparable performance metrics
+    """
+    print("=" * 70)
+    print("WOA7001 Network Routing - Algorithm Comparative Analysis")
+    print("=" * 70)
+
+    # Create network
+    graph = create_sample_network()
+
+    # Define test cases (same for both algorithms)
+    test_cases = [
+        ('001', '004'),  # Router-A -> Router-D
+        ('002', '004'),  # Router-B -> Router-D
+        ('001', '003'),  # Router-A -> Router-C
+        ('004', '002'),  # Router-D -> Router-B
+    ]
+
+    # Initialize results storage
+    a_star_results = []
+    load_balancing_results = []
+    comparison_table = []
+
+    print("\n1. Running Multi-Factor A* Algorithm Tests")
+    print("-" * 50)
+
+    # Test Multi-Factor A* algorithm
+    a_star_router = MultiFactorAStarRouter(graph)
+
+    for start, end in test_cases:
+        start_name = graph.nodes[start].name
+        end_name = graph.nodes[end].name
+
+        print(f"\n   Test: {start_name} -> {end_name}")
+
+        # Run A* algorithm
+        a_star_path, a_star_cost, a_star_stats = a_star_router.find_path(start, end)
+
+        if a_star_path:
+            path_names = [graph.nodes[node].name for node in a_star_path]
+            print(f"     Path: {' → '.join(path_names)}")
+            print(f"     Cost: {a_star_cost:.2f}")
+            print(f"     Execution time: {a_star_stats['execution_time_ms']:.4f} ms")
+            print(f"     Nodes explored: {a_star_stats['nodes_explored']}")
+            print(f"     Path length: {a_star_stats['path_length']} hops")
+
+            a_star_results.append({
+                'test_case': f"{start}->{end}",
+                'path': a_star_path,
+                'cost': a_star_cost,
+                'stats': a_star_stats
+            })
+        else:
+            print(f"     No path found")
+
+    print("\n\n2. Running Dynamic Load Balancing Algorithm Tests")
+    print("-" * 50)
+
+    # Test Dynamic Load Balancing algorithm
+    load_balancer = DynamicLoadBalancerComparative(graph, k_paths=3)
+
+    for start, end in test_cases:
+        start_name = graph.nodes[start].name
+        end_name = graph.nodes[end].name
+
+        print(f"\n   Test: {start_name} -> {end_name}")
+
+        # Run Load Balancing algorithm (static best path)
+        lb_path, lb_cost, lb_stats = load_balancer.find_static_best_path(start, end)
+
+        if lb_path:
+            path_names = [graph.nodes[node].name for node in lb_path]
+            print(f"     Best path: {' → '.join(path_names)}")
+            print(f"     Cost: {lb_cost:.2f}")
+            print(f"     Execution time: {lb_stats['execution_time_ms']:.4f} ms")
+            print(f"     Nodes explored: {lb_stats['nodes_explored']}")
+            print(f"     Path length: {lb_stats['path_length']} hops")
+            print(f"     Alternative paths found: {lb_stats['alternative_paths_found']}")
+
+            load_balancing_results.append({
+                'test_case': f"{start}->{end}",
+                'path': lb_path,
+                'cost': lb_cost,
+                'stats': lb_stats
+            })
+        else:
+            print(f"     No path found")
+
+    # Run one dynamic simulation for demonstration
+    print("\n\n3. Dynamic Load Balancing Simulation (Demo)")
+    print("-" * 50)
+    load_balancer.simulate_dynamic_routing('001', '004', num_packets=15)
+
+    # Generate comparative analysis
+    print("\n\n4. Algorithm Performance Comparison")
+    print("=" * 50)
+
+    print("\nPerformance Metrics Comparison:")
+    print("-" * 70)
+    print(f"{'Test Case':<15} {'Algorithm':<20} {'Cost':<10} {'Time (ms)':<12} {'Nodes Explored':<15} {'Path Length':<12}")
+    print("-" * 70)
+
+    for i, (a_star_result, lb_result) in enumerate(zip(a_star_results, load_balancing_results)):
+        test_case = a_star_result['test_case']
+
+        # A* results
+        print(f"{test_case:<15} {'Multi-Factor A*':<20} "
+              f"{a_star_result['cost']:<10.2f} "
+              f"{a_star_result['stats']['execution_time_ms']:<12.4f} "
+              f"{a_star_result['stats']['nodes_explored']:<15} "
+              f"{a_star_result['stats']['path_length']:<12}")
+
+        # Load Balancing results
+        print(f"{'':<15} {'Load Balancing':<20} "
+              f"{lb_result['cost']:<10.2f} "
+              f"{lb_result['stats']['execution_time_ms']:<12.4f} "
+              f"{lb_result['stats']['nodes_explored']:<15} "
+              f"{lb_result['stats']['path_length']:<12}")
+
+        print("-" * 70)
+
+        # Store comparison
+        comparison_table.append({
+            'test_case': test_case,
+            'a_star_cost': a_star_result['cost'],
+            'a_star_time': a_star_result['stats']['execution_time_ms'],
+            'a_star_nodes': a_star_result['stats']['nodes_explored'],
+            'a_star_length': a_star_result['stats']['path_length'],
+            'lb_cost': lb_result['cost'],
+            'lb_time': lb_result['stats']['execution_time_ms'],
+            'lb_nodes': lb_result['stats']['nodes_explored'],
+            'lb_length': lb_result['stats']['path_length'],
+            'alternative_paths': lb_result['stats']['alternative_paths_found']
+        })
+
+    # Calculate summary statistics
+    import numpy as np
+
+    print("\nSummary Statistics:")
+    print("-" * 70)
+
+    a_star_times = [r['stats']['execution_time_ms'] for r in a_star_results]
+    lb_times = [r['stats']['execution_time_ms'] for r in load_balancing_results]
+
+    a_star_costs = [r['cost'] for r in a_star_results]
+    lb_costs = [r['cost'] for r in load_balancing_results]
+
+    a_star_nodes = [r['stats']['nodes_explored'] for r in a_star_results]
+    lb_nodes = [r['stats']['nodes_explored'] for r in load_balancing_results]
+
+    print(f"Multi-Factor A* Algorithm:")
+    print(f"  Average execution time: {np.mean(a_star_times):.6f} ms")
+    print(f"  Average path cost: {np.mean(a_star_costs):.2f}")
+    print(f"  Average nodes explored: {np.mean(a_star_nodes):.1f}")
+    summary = a_star_router.get_performance_summary()
+    print(f"  Latency p50 / p99: {summary['p50_execution_time_ms']:.6f} / "
+          f"{summary['p99_execution_time_ms']:.6f} ms")
+
+    print(f"\nDynamic Load Balancing Algorithm:")
+    print(f"  Average execution time: {np.mean(lb_times):.6f} ms")
+    print(f"  Average path cost: {np.mean(lb_costs):.2f}")
+    print(f"  Average nodes explored: {np.mean(lb_nodes):.1f}")
+    summary = load_balancer.get_comparative_stats_summary()
+    print(f"  Latency p50 / p99: {summary['p50_execution_time_ms']:.6f} / "
+          f"{summary['p99_execution_time_ms']:.6f} ms")
+
+    print(f"\nComparative Analysis:")
+    print(f"  Time difference (A* - LB): {np.mean(a_star_times) - np.mean(lb_times):.6f} ms")
+    print(f"  Cost difference (A* - LB): {np.mean(a_star_costs) - np.mean(lb_costs):.2f}")
+    # 修复这行代码：从stats字典中获取alternative_paths_found
+    print(f"  Average alternative paths found: {np.mean([r['stats']['alternative_paths_found'] for r in load_balancing_results]):.1f}")
+
+    # Algorithm characteristics summary
+    print("\n\n5. Algorithm Characteristics Summary")
+    print("=" * 50)
+
+    characteristics = [
+        ["Characteristic", "Multi-Factor A*", "Dynamic Load Balancing"],
+        ["-"*20, "-"*25, "-"*25],
+        ["Primary Objective", "Find optimal single path", "Find multiple good paths"],
+        ["Output", "Single path with min cost", "K paths + dynamic selection"],
+        ["Time Complexity", "O((V+E)logV)", "O(K×(V+E) + monitoring)"],
+        ["Space Complexity", "O(V)", "O(K×V + monitoring data)"],
+        ["Best for", "Latency-sensitive flows", "High-throughput applications"],
+        ["Adaptability", "Static optimization", "Dynamic real-time adaptation"],
+        ["Path Diversity", "Single optimal path", "Multiple alternative paths"]
+    ]
+
+    for row in characteristics:
+        print(f"{row[0]:<20} {row[1]:<25} {row[2]:<25}")
+
+    return {
+        'a_star_results': a_star_results,
+        'load_balancing_results': load_balancing_results,
+        'comparison_table': comparison_table
+    }
+
+# ==================== Command Line Interface ====================
+
+ROUTING_METHODS = ('astar', 'balanced', 'table', 'ch', 'compact')
+
+# Modules that must import without NumPy / pandas (see startup-check)
+LIGHT_MODULES = ('problem2_routing', 'problem2_incremental_routing')
+
+
+def build_router(graph: NetworkGraph, method: str):
+    """
+    Create the router of a routing method
+
+    The NumPy-based engines ('table', 'ch', 'compact') are imported only
+    when requested.
+
+    Returns:
+        find(start, end) -> (path, cost, stats)
+    """
+    if method == 'astar':
+        return MultiFactorAStarRouter(graph).find_path
+    if method == 'balanced':
+        return DynamicLoadBalancerComparative(graph, k_paths=3).find_static_best_path
+    if method == 'table':
+        from problem2_routing_table import RoutingTableRouter
+        return RoutingTableRouter(graph).find_path
+    if method == 'ch':
+        from problem2_contraction_hierarchy import ContractionHierarchyRouter
+        return ContractionHierarchyRouter(graph).find_path
+    if method == 'compact':
+        from problem2_compact_graph import CompactAStarRouter, CompactNetworkGraph
+        return CompactAStarRouter(CompactNetworkGraph.from_graph(graph)).find_path
+    raise ValueError(f"Unknown routing method: {method}")
+
+
+def read_queries(path: str) -> List[Tuple[str, str]]:
+    """Read "start end" pairs, one per line (comma or whitespace separated)"""
+    queries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            fields = line.replace(',', ' ').split()
+            if fields and not fields[0].startswith('#'):
+                queries.append((fields[0], fields[1]))
+    return queries
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point
+
+    Without a command, runs the comparative analysis on the Table 4 network.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="WOA7001 network routing engines")
+    commands = parser.add_subparsers(dest="command")
+
+    route = commands.add_parser("route", help="answer routing queries on a network file")
+    route.add_argument("network", help="network JSON file (see load_network), or 'sample' for Table 4")
+    route.add_argument("start", nargs="?", help="start node ID")
+    route.add_argument("end", nargs="?", help="end node ID")
+    route.add_argument("--queries", help="file of 'start end' pairs, one per line")
+    route.add_argument("--method", choices=ROUTING_METHODS, default="astar")
+    route.add_argument("--format", choices=("json", "table"), default="json",
+                       help="JSON lines or a text table")
+
+    startup = commands.add_parser("startup-check",
+                                  help="measure cold-start import time of the NumPy-free modules")
+    startup.add_argument("--target-ms", type=float, default=IMPORT_TARGET_MS)
+    startup.add_argument("--runs", type=int, default=5)
+
+    commands.add_parser("demo", help="comparative analysis on the Table 4 network (default)")
+    args = parser.parse_args(argv)
+
+    if args.command == "startup-check":
+        return 0 if check_import_budget(LIGHT_MODULES, args.target_ms, args.runs) else 1
+
+    if args.command == "route":
+        graph = create_sample_network() if args.network == 'sample' else load_network(args.network)
+        queries = read_queries(args.queries) if args.queries else []
+        if args.start and args.end:
+            queries.append((args.start, args.end))
+        if not queries:
+            parser.error("route needs START END or --queries")
+
+        find = build_router(graph, args.method)
+        if args.format == "table":
+            print(f"{'Start':<10} {'End':<10} {'Cost':<10} {'Time (ms)':<10} {'Hops':<6} Path")
+            print("-" * 70)
+        for start, end in queries:
+            path, cost, stats = find(start, end)
+            if args.format == "table":
+                print(f"{start:<10} {end:<10} {cost:<10.2f} {stats.get('execution_time_ms', 0.0):<10.4f} "
+                      f"{max(len(path) - 1, 0):<6} {' -> '.join(path) if path else 'no path'}")
+            else:
+                print(json.dumps({'start': start, 'end': end, 'path': path,
+                                  'cost': cost if path else None,
+                                  'execution_time_ms': stats.get('execution_time_ms'),
+                                  'nodes_explored': stats.get('nodes_explored')}))
+        return 0
+
+    run_comparative_analysis()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
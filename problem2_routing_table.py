@@ -0,0 +1,473 @@
+"""
+WOA7001 Group Project - Problem 2: Network Routing
+Routing Table: Precomputed Shortest-Path Trees
+
+For a set of source routers the table stores the shortest-path tree of
+each source as compact NumPy arrays (parent, distance, next hop), built in
+parallel over a process pool. Lookups walk parent pointers instead of
+searching, and refresh() repairs only the trees affected by changed link
+costs. RoutingTableRouter answers find_path from the table and falls back
+to A* for pairs without a tabulated endpoint.
+"""
+
+import heapq
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from problem2_routing import (MultiFactorAStarRouter, NetworkGraph, create_random_network,
+                              create_sample_network)
+
+
+# Adjacency of the graph being tabulated, set once per worker process
+_TABLE_ADJACENCY: List[List[Tuple[int, float]]] = []
+
+
+def _init_table_worker(adjacency: List[List[Tuple[int, float]]]) -> None:
+    """Worker initializer: receive the adjacency lists once per process"""
+    global _TABLE_ADJACENCY
+    _TABLE_ADJACENCY = adjacency
+
+
+def _shortest_path_tree(source: int) -> Tuple[List[int], List[float]]:
+    """
+    Dijkstra from one source over _TABLE_ADJACENCY
+
+    Returns:
+        (parent, distance) lists indexed by node index; the source and
+        unreachable nodes have parent -1, unreachable nodes distance inf
+    """
+    num_nodes = len(_TABLE_ADJACENCY)
+    parent = [-1] * num_nodes
+    distance = [float('inf')] * num_nodes
+    distance[source] = 0.0
+
+    pq = [(0.0, source)]
+    while pq:
+        current_dist, current = heapq.heappop(pq)
+        if current_dist > distance[current]:
+            continue
+        for neighbor, cost in _TABLE_ADJACENCY[current]:
+            new_dist = current_dist + cost
+            if new_dist < distance[neighbor]:
+                distance[neighbor] = new_dist
+                parent[neighbor] = current
+                heapq.heappush(pq, (new_dist, neighbor))
+
+    return parent, distance
+
+
+class RoutingTable:
+    """
+    Precomputed single-source shortest-path trees over EdgeInfo.cost
+
+    For every tabulated source the table keeps compact arrays indexed by
+    node index: parent (tree predecessor), distance (path cost) and
+    next_hop (first router after the source). A lookup walks parent
+    pointers, so it costs O(path length) instead of a full search. Edges
+    are undirected, so a tree rooted at either endpoint answers a query.
+
+    When traffic_load / link_quality of nodes change, refresh() rebuilds
+    the changed edges and repairs only the trees whose shortest paths can
+    change.
+    """
+
+    def __init__(self, graph: NetworkGraph, sources: Optional[List[str]] = None,
+                 num_workers: Optional[int] = None):
+        self.graph = graph
+        self.node_ids = list(graph.nodes)
+        self.node_index = {node_id: idx for idx, node_id in enumerate(self.node_ids)}
+        self.sources = list(sources) if sources is not None else list(self.node_ids)
+        self.source_row = {node_id: row for row, node_id in enumerate(self.sources)}
+        self.num_workers = num_workers or os.cpu_count() or 1
+
+        num_sources, num_nodes = len(self.sources), len(self.node_ids)
+        self.parent = np.full((num_sources, num_nodes), -1, dtype=np.int32)
+        self.distance = np.full((num_sources, num_nodes), np.inf)
+        self.next_hop = np.full((num_sources, num_nodes), -1, dtype=np.int32)
+
+        # Node attributes the trees were built with, for change detection
+        self._node_state = {}
+        self._adjacency_lists: List[List[Tuple[int, float]]] = []
+        self.table_stats = {
+            'build_time_ms': 0.0,
+            'trees_built': 0,
+            'trees_repaired': 0,
+            'nodes_resettled': 0,
+            'lookups': 0
+        }
+
+    def _adjacency(self) -> List[List[Tuple[int, float]]]:
+        """Adjacency lists (neighbor index, cost) from the graph edges"""
+        adjacency = [[] for _ in self.node_ids]
+        for (node1, node2), edge in self.graph.edges.items():
+            if node1 in self.node_index and node2 in self.node_index:
+                adjacency[self.node_index[node1]].append((self.node_index[node2], edge.cost))
+        return adjacency
+
+    def build(self, rows: Optional[List[int]] = None) -> None:
+        """
+        Compute the shortest-path trees of the given table rows (all by default)
+
+        Trees are computed on a process pool when there are several workers
+        and the platform can fork (workers inherit this module's functions).
+        """
+        start_time = time.perf_counter()
+        if rows is None:
+            rows = list(range(len(self.sources)))
+        if not rows:
+            return
+
+        if not self._adjacency_lists:
+            self._adjacency_lists = self._adjacency()
+        adjacency = self._adjacency_lists
+        roots = [self.node_index[self.sources[row]] for row in rows]
+
+        can_fork = 'fork' in multiprocessing.get_all_start_methods()
+        if self.num_workers > 1 and len(roots) > 1 and can_fork:
+            chunksize = max(1, len(roots) // (self.num_workers * 4))
+            with ProcessPoolExecutor(max_workers=self.num_workers,
+                                     mp_context=multiprocessing.get_context('fork'),
+                                     initializer=_init_table_worker,
+                                     initargs=(adjacency,)) as pool:
+                trees = list(pool.map(_shortest_path_tree, roots, chunksize=chunksize))
+        else:
+            _init_table_worker(adjacency)
+            trees = [_shortest_path_tree(root) for root in roots]
+
+        for row, root, (parent, distance) in zip(rows, roots, trees):
+            self.parent[row] = parent
+            self.distance[row] = distance
+            self.next_hop[row] = self._next_hops(np.array(parent, dtype=np.int32), root)
+
+        if len(rows) == len(self.sources):
+            for node_id, node in self.graph.nodes.items():
+                self._node_state[node_id] = (node.traffic_load, node.link_quality)
+
+        self.table_stats['build_time_ms'] += (time.perf_counter() - start_time) * 1000
+        self.table_stats['trees_built'] += len(rows)
+
+    @staticmethod
+    def _next_hops(parent: np.ndarray, root: int) -> np.ndarray:
+        """
+        First hop from the root towards every node, by pointer jumping
+
+        Each node points at its parent until it reaches a child of the root;
+        doubling the pointers converges in O(log depth) array passes.
+        """
+        jump = parent.copy()
+        reachable = parent >= 0
+        settled = ~reachable | (parent == root)
+        jump[settled] = np.flatnonzero(settled)
+        while True:
+            nxt = jump[jump]
+            if np.array_equal(nxt, jump):
+                break
+            jump = nxt
+        hops = np.where(reachable, jump, -1).astype(np.int32)
+        hops[root] = root
+        return hops
+
+    def _tree_for(self, start: str, end: str) -> Optional[Tuple[int, int, bool]]:
+        """(row, target index, reversed) of a tree that answers start -> end"""
+        if start in self.source_row:
+            return self.source_row[start], self.node_index[end], False
+        if end in self.source_row:
+            return self.source_row[end], self.node_index[start], True
+        return None
+
+    def lookup(self, start: str, end: str) -> Optional[Tuple[List[str], float]]:
+        """
+        Look up the shortest path in O(path length)
+
+        Returns:
+            (path, cost), ([], inf) if unreachable, or None if neither
+            endpoint is a tabulated source
+        """
+        if start not in self.node_index or end not in self.node_index:
+            return [], float('inf')
+        found = self._tree_for(start, end)
+        if found is None:
+            return None
+        row, target, reverse = found
+        self.table_stats['lookups'] += 1
+
+        cost = float(self.distance[row, target])
+        if cost == float('inf'):
+            return [], cost
+
+        parent = self.parent[row]
+        path = [self.node_ids[target]]
+        current = target
+        while parent[current] >= 0:
+            current = int(parent[current])
+            path.append(self.node_ids[current])
+        if not reverse:
+            path.reverse()
+        return path, cost
+
+    def get_next_hop(self, start: str, end: str) -> Optional[str]:
+        """First router after start on the shortest path from a start source"""
+        row = self.source_row.get(start)
+        if row is None or end not in self.node_index:
+            return None
+        hop = int(self.next_hop[row, self.node_index[end]])
+        return self.node_ids[hop] if hop >= 0 else None
+
+    def refresh(self) -> int:
+        """
+        Apply node traffic_load / link_quality changes made since the last build
+
+        The edges of changed nodes are rebuilt, and a tree is touched only if
+        a changed edge can alter it: a tree edge whose cost rose, or any edge
+        whose new cost gives a strictly shorter path to an endpoint. Affected
+        trees are repaired rather than recomputed: only the subtrees below
+        risen tree edges are re-settled, plus the nodes a cheaper edge improves.
+
+        Returns:
+            Number of trees repaired
+        """
+        changed = [node_id for node_id, node in self.graph.nodes.items()
+                   if self._node_state.get(node_id) != (node.traffic_load, node.link_quality)]
+        if not changed:
+            return 0
+
+        # Rebuild the edges around the changed nodes; old costs come from the
+        # table's own adjacency, as NetworkGraph.update_node may have already
+        # rebuilt them
+        old_cost = {}
+        for node_id in changed:
+            tabulated = dict(self._adjacency_lists[self.node_index[node_id]])
+            for neighbor in self.graph.nodes[node_id].connections:
+                key = tuple(sorted((node_id, neighbor)))
+                if key not in old_cost and self.graph.get_edge(*key):
+                    old_cost[key] = tabulated.get(self.node_index.get(neighbor),
+                                                  self.graph.get_edge(*key).cost)
+                    self.graph._create_edge(*key)
+
+        src, dst, old, new = [], [], [], []
+        for (node1, node2), cost in old_cost.items():
+            src.append(self.node_index[node1])
+            dst.append(self.node_index[node2])
+            old.append(cost)
+            new.append(self.graph.get_edge(node1, node2).cost)
+        src, dst = np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64)
+        old, new = np.array(old), np.array(new)
+
+        for node_idx in set(src.tolist()) | set(dst.tolist()):
+            node_id = self.node_ids[node_idx]
+            self._adjacency_lists[node_idx] = [
+                (self.node_index[neighbor], self.graph.get_edge(node_id, neighbor).cost)
+                for neighbor in self.graph.nodes[node_id].connections
+                if neighbor in self.node_index and self.graph.get_edge(node_id, neighbor)]
+
+        # All tabulated trees are tested at once: (sources, changed edges)
+        dist_src, dist_dst = self.distance[:, src], self.distance[:, dst]
+        in_tree = (self.parent[:, dst] == src) | (self.parent[:, src] == dst)
+        rose = in_tree & (new > old)
+        shorter = (dist_src + new < dist_dst) | (dist_dst + new < dist_src)
+        rows = np.flatnonzero((rose | shorter).any(axis=1)).tolist()
+
+        for row in rows:
+            # Child endpoint of every risen tree edge roots an invalid subtree
+            risen = np.flatnonzero(rose[row])
+            parent = self.parent[row]
+            children = np.where(parent[dst[risen]] == src[risen], dst[risen], src[risen])
+            self._repair(row, children.tolist(), src.tolist(), dst.tolist(), new.tolist())
+
+        for node_id in changed:
+            node = self.graph.nodes[node_id]
+            self._node_state[node_id] = (node.traffic_load, node.link_quality)
+        self.table_stats['trees_repaired'] += len(rows)
+        return len(rows)
+
+    def _repair(self, row: int, invalid_roots: List[int], src: List[int],
+                dst: List[int], new_cost: List[float]) -> None:
+        """
+        Repair one shortest-path tree after edge cost changes
+
+        Distances outside the invalid subtrees are still achievable, so they
+        act as upper bounds: invalid nodes are reset, re-seeded from their
+        valid neighbours and from cheaper changed edges, and a Dijkstra pass
+        from those seeds settles only the nodes whose distance changes.
+        """
+        adjacency = self._adjacency_lists
+        parent = self.parent[row].tolist()
+        distance = self.distance[row].tolist()
+
+        invalid = self._subtree_nodes(self.parent[row], invalid_roots)
+        invalid_set = set(invalid)
+        for node in invalid:
+            distance[node] = float('inf')
+            parent[node] = -1
+
+        pq = []
+        for node in invalid:
+            for neighbor, cost in adjacency[node]:
+                if neighbor not in invalid_set and distance[neighbor] + cost < distance[node]:
+                    distance[node] = distance[neighbor] + cost
+                    parent[node] = neighbor
+            if parent[node] >= 0:
+                pq.append((distance[node], node))
+        for u, v, cost in zip(src, dst, new_cost):
+            for a, b in ((u, v), (v, u)):
+                if distance[a] + cost < distance[b]:
+                    distance[b] = distance[a] + cost
+                    parent[b] = a
+                    pq.append((distance[b], b))
+        heapq.heapify(pq)
+
+        settled = 0
+        while pq:
+            current_dist, current = heapq.heappop(pq)
+            if current_dist > distance[current]:
+                continue
+            settled += 1
+            for neighbor, cost in adjacency[current]:
+                new_dist = current_dist + cost
+                if new_dist < distance[neighbor]:
+                    distance[neighbor] = new_dist
+                    parent[neighbor] = current
+                    heapq.heappush(pq, (new_dist, neighbor))
+
+        root = self.node_index[self.sources[row]]
+        self.parent[row] = parent
+        self.distance[row] = distance
+        self.next_hop[row] = self._next_hops(self.parent[row], root)
+        self.table_stats['nodes_resettled'] += settled
+
+    @staticmethod
+    def _subtree_nodes(parent: np.ndarray, roots: List[int]) -> List[int]:
+        """All nodes in the subtrees of the given roots of a parent-array tree"""
+        if not roots:
+            return []
+        has_parent = np.flatnonzero(parent >= 0)
+        order = has_parent[np.argsort(parent[has_parent], kind='stable')]
+        bounds = np.searchsorted(parent[order], np.arange(len(parent) + 1))
+        order, bounds = order.tolist(), bounds.tolist()
+
+        nodes = list(dict.fromkeys(roots))
+        seen = set(nodes)
+        for node in nodes:
+            for child in order[bounds[node]:bounds[node + 1]]:
+                if child not in seen:
+                    seen.add(child)
+                    nodes.append(child)
+        return nodes
+
+    def memory_bytes(self) -> int:
+        """Size of the table arrays in bytes"""
+        return self.parent.nbytes + self.distance.nbytes + self.next_hop.nbytes
+
+
+class RoutingTableRouter(MultiFactorAStarRouter):
+    """
+    Multi-Factor A* router answering from a RoutingTable when it can
+
+    Same (path, total_cost, performance_stats) contract as find_path; pairs
+    with no tabulated endpoint fall back to the A* search.
+    """
+
+    def __init__(self, graph: NetworkGraph, sources: Optional[List[str]] = None,
+                 num_workers: Optional[int] = None):
+        super().__init__(graph)
+        self.table = RoutingTable(graph, sources, num_workers)
+        self.table.build()
+
+    def find_path(self, start: str, end: str,
+                  quality_weight: float = 0.7,
+                  traffic_weight: float = 0.3) -> Tuple[List[str], float, Dict]:
+        start_time = time.perf_counter()
+
+        found = self.table.lookup(start, end)
+        if found is None:
+            return super().find_path(start, end, quality_weight, traffic_weight)
+
+        path, path_cost = found
+        execution_time = (time.perf_counter() - start_time) * 1000
+        if not path:
+            return [], float('inf'), {
+                'execution_time_ms': execution_time,
+                'nodes_explored': 0,
+                'path_length': 0,
+                'path_cost': float('inf'),
+                'metrics': {}
+            }
+
+        self._record_search(execution_time, len(path))
+
+        return path, path_cost, {
+            'execution_time_ms': execution_time,
+            'nodes_explored': len(path),  # Table entries read by the lookup
+            'path_length': len(path) - 1,
+            'path_cost': path_cost,
+            'metrics': self._calculate_path_metrics(path)
+        }
+
+
+def run_routing_table_demo():
+    """Compare routing-table lookups with A* searches and show invalidation"""
+    print("=" * 70)
+    print("Routing Table: Precomputed Shortest-Path Trees")
+    print("=" * 70)
+
+    # Sample network: every lookup must match a fresh search
+    graph = create_sample_network()
+    table_router = RoutingTableRouter(graph)
+    a_star_router = MultiFactorAStarRouter(graph)
+    print(f"\n{'Test Case':<12} {'Table path':<34} {'Cost':<8} {'A* cost':<8}")
+    print("-" * 70)
+    for start, end in [('001', '004'), ('002', '004'), ('001', '003'), ('004', '002')]:
+        path, cost, _ = table_router.find_path(start, end)
+        _, a_star_cost, _ = a_star_router.find_path(start, end)
+        path_names = ' → '.join(graph.nodes[node].name for node in path)
+        print(f"{start}->{end:<7} {path_names:<34} {cost:<8.2f} {a_star_cost:<8.2f}")
+
+    graph.nodes['003'].traffic_load = 'Low'
+    repaired = table_router.table.refresh()
+    path, cost, _ = table_router.find_path('002', '004')
+    print(f"\nRouter-C traffic High -> Low: {repaired} of "
+          f"{len(table_router.table.sources)} trees repaired")
+    print(f"002->004 now: {' → '.join(graph.nodes[node].name for node in path)} (cost {cost:.2f})")
+
+    # Larger network: lookup latency vs search latency
+    graph = create_random_network(2000, avg_degree=4, seed=7)
+    sources = list(graph.nodes)[:200]
+    table_router = RoutingTableRouter(graph, sources=sources)
+    a_star_router = MultiFactorAStarRouter(graph)
+    rng = random.Random(1)
+    queries = [(rng.choice(sources), rng.choice(list(graph.nodes))) for _ in range(200)]
+
+    start = time.perf_counter()
+    for s, t in queries:
+        table_router.find_path(s, t)
+    lookup_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    start = time.perf_counter()
+    for s, t in queries[:20]:
+        a_star_router.find_path(s, t)
+    search_ms = (time.perf_counter() - start) * 1000 / 20
+
+    stats = table_router.table.table_stats
+    print(f"\n2000 routers, {len(sources)} source trees "
+          f"({table_router.table.memory_bytes() / 2 ** 20:.1f} MiB), "
+          f"built in {stats['build_time_ms']:.0f} ms")
+    print(f"  Table lookup: {lookup_ms:.4f} ms per query")
+    print(f"  A* search:    {search_ms:.4f} ms per query")
+
+    node = graph.nodes[list(graph.nodes)[-1]]
+    node.link_quality = 'Poor' if node.link_quality != 'Poor' else 'Excellent'
+    start = time.perf_counter()
+    repaired = table_router.table.refresh()
+    refresh_ms = (time.perf_counter() - start) * 1000
+    print(f"  Link quality change at {node.name}: {repaired} of {len(sources)} trees "
+          f"repaired in {refresh_ms:.1f} ms, "
+          f"{stats['nodes_resettled']} of {len(sources) * len(graph.nodes)} entries re-settled")
+
+if __name__ == "__main__":
+    run_routing_table_demo()
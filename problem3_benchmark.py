@@ -0,0 +1,464 @@
+"""
+WOA7001 Group Project - Problem 3: MST Benchmark Suite
+Synthetic graph generators, a timing harness and regression tracking.
+
+Every MST engine (Kruskal, Prim, Boruvka and streaming Kruskal) is run on
+seeded synthetic graphs from 10^3 up to 10^7 edges:
+
+    - "sparse":    random graph with average degree 8
+    - "grid":      road-like 4-neighbour grid with jittered block lengths
+    - "geometric": Delaunay edges of random locations (needs scipy)
+    - "complete":  dense complete graph with random distances
+
+Each case is timed with perf_counter_ns after warmup runs, split into the
+phases reported by the engine (plus loading the edge file), and its peak
+memory is measured with tracemalloc and the RSS high-water mark. Results are
+written as JSON; the "compare" command flags regressions against a stored
+baseline.
+
+Usage:
+    python problem3_benchmark.py run --sizes 1e3,1e4,1e5 --output current.json
+    python problem3_benchmark.py compare baseline.json current.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from problem3_edge_store import EdgeStore
+from problem3_comparison import random_graph_store
+from problem3_kruskal import KruskalMST
+from problem3_prim import PrimMST
+from problem3_boruvka import BoruvkaMST
+from problem3_external_kruskal import ExternalKruskalMST
+
+
+ENGINES = ("kruskal", "prim", "boruvka", "external_kruskal")
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Cases faster than this are never flagged, the difference is timer noise
+MIN_REGRESSION_NS = 1_000_000
+
+
+def sparse_graph(num_edges: int, seed: int = 0) -> EdgeStore:
+    """
+    Random connected graph with an average degree of about 8.
+
+    Args:
+        num_edges: Target number of edges
+        seed: Random seed
+
+    Returns:
+        EdgeStore with about num_edges edges
+    """
+    num_nodes = max(num_edges // 4, 2)
+    density = num_edges / (num_nodes * (num_nodes - 1) / 2)
+    return random_graph_store(num_nodes, density, seed=seed)
+
+
+def grid_graph(num_edges: int, seed: int = 0) -> EdgeStore:
+    """
+    Road-like square grid: every intersection joins its right and lower
+    neighbour, with block lengths of 100 units +/- 20%.
+
+    Args:
+        num_edges: Target number of edges
+        seed: Random seed
+
+    Returns:
+        EdgeStore with about num_edges edges
+    """
+    rng = np.random.default_rng(seed)
+    side = max(int(np.sqrt(num_edges / 2)) + 1, 2)
+    nodes = np.arange(side * side).reshape(side, side)
+
+    src = np.concatenate([nodes[:, :-1].ravel(), nodes[:-1, :].ravel()])
+    dst = np.concatenate([nodes[:, 1:].ravel(), nodes[1:, :].ravel()])
+    distance = 100.0 * rng.uniform(0.8, 1.2, len(src))
+    x_coord = (src % side) * 100.0
+    y_coord = (src // side) * 100.0
+    return EdgeStore(np.arange(len(src)), src, dst, distance, x_coord, y_coord)
+
+
+def geometric_graph(num_edges: int, seed: int = 0) -> EdgeStore:
+    """
+    Delaunay triangulation of uniformly random locations (about 3 edges per
+    location), with Euclidean distances.
+
+    Args:
+        num_edges: Target number of edges
+        seed: Random seed
+
+    Returns:
+        EdgeStore with about num_edges edges
+    """
+    from problem3_euclidean import EuclideanMST
+
+    rng = np.random.default_rng(seed)
+    num_points = max(num_edges // 3, 3)
+    euclidean = EuclideanMST(method="delaunay")
+    euclidean.load_coordinates(rng.uniform(0, 10_000, num_points),
+                               rng.uniform(0, 10_000, num_points))
+    return euclidean.build_candidates()
+
+
+def complete_graph(num_edges: int, seed: int = 0) -> EdgeStore:
+    """
+    Complete graph with random distances.
+
+    Args:
+        num_edges: Target number of edges (n is chosen so n(n-1)/2 is close)
+        seed: Random seed
+
+    Returns:
+        EdgeStore with about num_edges edges
+    """
+    num_nodes = max(int(round((1 + np.sqrt(1 + 8 * num_edges)) / 2)), 2)
+    return random_graph_store(num_nodes, 1.0, seed=seed)
+
+
+GENERATORS = {
+    "sparse": sparse_graph,
+    "grid": grid_graph,
+    "geometric": geometric_graph,
+    "complete": complete_graph,
+}
+
+
+def save_edge_file(store: EdgeStore, path: str):
+    """
+    Write an edge store as an (m, 4) .npy table readable by every engine.
+
+    Args:
+        store: EdgeStore to write
+        path: Destination .npy path
+    """
+    np.save(path, np.column_stack([store.edge_id, store.start_node,
+                                   store.end_node, store.distance]).astype(np.float64))
+
+
+def _solve(engine: str, edge_path: str, options: Dict) -> Tuple[Dict[str, int], int, float]:
+    """
+    Load an edge file and run one MST engine on it once.
+
+    Args:
+        engine: One of ENGINES
+        edge_path: Path of the .npy edge file
+        options: Engine options (sort_buffer, work_dir)
+
+    Returns:
+        Tuple of (phase times in ns, number of MST edges, total MST distance)
+    """
+    if engine == "external_kruskal":
+        # Streaming Kruskal reads the file itself, inside its sort phase
+        solver = ExternalKruskalMST(sort_buffer_edges=options["sort_buffer"],
+                                    tmp_dir=options["work_dir"])
+        output_path = os.path.join(options["work_dir"], "mst_edges.csv")
+        num_mst_edges, total_distance, _ = solver.find_mst(edge_path, output_path)
+        load_ns = 0
+    else:
+        load_start = time.perf_counter_ns()
+        store = EdgeStore.from_npy(edge_path, mmap=False)
+        load_ns = time.perf_counter_ns() - load_start
+
+        solver = {"kruskal": KruskalMST, "prim": PrimMST, "boruvka": BoruvkaMST}[engine]()
+        solver.load_edge_store(store)
+        mst_edges, total_distance, _ = solver.find_mst()
+        num_mst_edges = len(mst_edges)
+
+    phases = {"load": load_ns}
+    phases.update({phase: int(seconds * 1e9) for phase, seconds in solver.phase_times.items()})
+    return phases, num_mst_edges, total_distance
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(engine: str, edge_path: str, warmup: int, repeats: int,
+             options: Dict) -> Dict:
+    """
+    Benchmark one engine on one edge file.
+
+    The timed runs come first; peak memory is measured in an extra run with
+    tracemalloc enabled, since tracing slows allocation down.
+
+    Args:
+        engine: One of ENGINES
+        edge_path: Path of the .npy edge file
+        warmup: Untimed runs before measuring
+        repeats: Timed runs
+        options: Engine options (see _solve)
+
+    Returns:
+        Dictionary with timings (ns), phase medians (ns), memory and MST result
+    """
+    for _ in range(warmup):
+        _solve(engine, edge_path, options)
+
+    times = []
+    phase_runs = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        phases, num_mst_edges, total_distance = _solve(engine, edge_path, options)
+        times.append(time.perf_counter_ns() - start)
+        phase_runs.append(phases)
+
+    tracemalloc.start()
+    try:
+        _solve(engine, edge_path, options)
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "engine": engine,
+        "time_ns": {
+            "median": int(statistics.median(times)),
+            "min": min(times),
+            "max": max(times),
+            "mean": int(statistics.mean(times)),
+        },
+        "phases_ns": {phase: int(statistics.median(run[phase] for run in phase_runs))
+                      for phase in phase_runs[0]},
+        "tracemalloc_peak_bytes": traced_peak,
+        "rss_peak_bytes": _peak_rss_bytes(),
+        "mst_edges": num_mst_edges,
+        "mst_distance": total_distance,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, generators=tuple(GENERATORS), engines=ENGINES,
+                   warmup: int = 1, repeats: int = 5, seed: int = 0,
+                   sort_buffer: int = 1_000_000, isolate: bool = True) -> Dict:
+    """
+    Run every engine on every generator and size.
+
+    Args:
+        sizes: Target edge counts
+        generators: Names from GENERATORS
+        engines: Names from ENGINES
+        warmup: Untimed runs per case
+        repeats: Timed runs per case
+        seed: Random seed for the generators
+        sort_buffer: Edges per sorted run for the streaming Kruskal engine
+        isolate: Run each case in a fresh process, so the RSS peak belongs
+            to that case alone
+
+    Returns:
+        Dictionary with "meta" and "results", ready to be written as JSON
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        options = {"sort_buffer": sort_buffer, "work_dir": work_dir}
+        edge_path = os.path.join(work_dir, "edges.npy")
+
+        for generator in generators:
+            for size in sizes:
+                store = GENERATORS[generator](size, seed=seed)
+                save_edge_file(store, edge_path)
+                print(f"{generator} graph: {store.num_nodes} nodes, {store.num_edges} edges")
+
+                for engine in engines:
+                    if isolate:
+                        with ProcessPoolExecutor(max_workers=1) as pool:
+                            result = pool.submit(run_case, engine, edge_path, warmup,
+                                                 repeats, options).result()
+                    else:
+                        result = run_case(engine, edge_path, warmup, repeats, options)
+                    result.update({"generator": generator, "size": size,
+                                   "num_nodes": store.num_nodes,
+                                   "num_edges": store.num_edges})
+                    results.append(result)
+
+                    phases = " ".join(f"{phase}={ns / 1e6:.2f}"
+                                      for phase, ns in result["phases_ns"].items())
+                    print(f"  {engine:<18} {result['time_ns']['median'] / 1e6:>12.3f} ms  "
+                          f"peak {result['tracemalloc_peak_bytes'] / 2 ** 20:>9.1f} MiB  "
+                          f"[{phases}]")
+
+                _check_agreement(results[-len(engines):])
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "warmup": warmup,
+        "repeats": repeats,
+        "seed": seed,
+        "isolated": isolate,
+    }
+    return {"meta": meta, "results": results}
+
+
+def _check_agreement(case_results: List[Dict]):
+    """Warn when the engines disagree on the MST of one graph."""
+    distances = [result["mst_distance"] for result in case_results]
+    if distances and max(distances) - min(distances) > 1e-6 * max(1.0, abs(distances[0])):
+        print("  WARNING: engines disagree on the MST distance: "
+              + ", ".join(f"{result['engine']}={result['mst_distance']:.6f}"
+                          for result in case_results))
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.20,
+                    memory_threshold: float = 0.10) -> List[str]:
+    """
+    Compare two benchmark result files case by case.
+
+    A case regresses when its median time grows by more than threshold (and
+    by more than MIN_REGRESSION_NS), when its tracemalloc peak grows by more
+    than memory_threshold, or when its MST distance changes.
+
+    Args:
+        baseline: Parsed baseline JSON
+        current: Parsed current JSON
+        threshold: Allowed relative growth of the median time
+        memory_threshold: Allowed relative growth of the peak memory
+
+    Returns:
+        List of regression messages (empty when there are none)
+    """
+    def key(result):
+        return result["generator"], result["size"], result["engine"]
+
+    baseline_cases = {key(result): result for result in baseline["results"]}
+    regressions = []
+
+    print(f"\n{'Generator':<10} {'Size':>9} {'Engine':<18} {'Base (ms)':>11} "
+          f"{'Now (ms)':>11} {'Time':>8} {'Memory':>8}")
+    print("-" * 80)
+
+    for result in current["results"]:
+        old = baseline_cases.pop(key(result), None)
+        if old is None:
+            continue
+        generator, size, engine = key(result)
+        name = f"{generator}/{size}/{engine}"
+
+        old_ns, new_ns = old["time_ns"]["median"], result["time_ns"]["median"]
+        time_ratio = new_ns / old_ns if old_ns else 1.0
+        old_peak, new_peak = old["tracemalloc_peak_bytes"], result["tracemalloc_peak_bytes"]
+        memory_ratio = new_peak / old_peak if old_peak else 1.0
+
+        flags = []
+        if time_ratio > 1 + threshold and new_ns - old_ns > MIN_REGRESSION_NS:
+            flags.append("TIME")
+            regressions.append(f"{name}: median time {old_ns / 1e6:.3f} ms -> "
+                               f"{new_ns / 1e6:.3f} ms ({time_ratio:.2f}x)")
+        if memory_ratio > 1 + memory_threshold:
+            flags.append("MEMORY")
+            regressions.append(f"{name}: peak memory {old_peak} -> {new_peak} bytes "
+                               f"({memory_ratio:.2f}x)")
+        if abs(result["mst_distance"] - old["mst_distance"]) > 1e-6 * max(1.0, abs(old["mst_distance"])):
+            flags.append("RESULT")
+            regressions.append(f"{name}: MST distance {old['mst_distance']:.6f} -> "
+                               f"{result['mst_distance']:.6f}")
+
+        print(f"{generator:<10} {size:>9} {engine:<18} {old_ns / 1e6:>11.3f} "
+              f"{new_ns / 1e6:>11.3f} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x "
+              f"{' '.join(flags)}")
+
+    print("-" * 80)
+    for generator, size, engine in baseline_cases:
+        print(f"Not in current results: {generator}/{size}/{engine}")
+    return regressions
+
+
+def _parse_list(text: str) -> List[str]:
+    return [item.strip() for item in text.split(",") if item.strip()]
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Exit status: 1 if "compare" found regressions, else 0
+    """
+    parser = argparse.ArgumentParser(description="MST engine benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks and write JSON")
+    run_parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                            help="Comma-separated target edge counts (e.g. 1e3,1e5,1e7)")
+    run_parser.add_argument("--generators", default=",".join(GENERATORS),
+                            help=f"Comma-separated subset of {','.join(GENERATORS)}")
+    run_parser.add_argument("--engines", default=",".join(ENGINES),
+                            help=f"Comma-separated subset of {','.join(ENGINES)}")
+    run_parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per case")
+    run_parser.add_argument("--repeats", type=int, default=5, help="Timed runs per case")
+    run_parser.add_argument("--seed", type=int, default=0, help="Generator random seed")
+    run_parser.add_argument("--sort-buffer", type=int, default=1_000_000,
+                            help="Edges per sorted run for external_kruskal")
+    run_parser.add_argument("--no-isolate", action="store_true",
+                            help="Run cases in this process (RSS peak is then cumulative)")
+    run_parser.add_argument("--output", default="mst_benchmark.json", help="JSON output path")
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions against a baseline")
+    compare_parser.add_argument("baseline", help="Baseline JSON file")
+    compare_parser.add_argument("current", help="Current JSON file")
+    compare_parser.add_argument("--threshold", type=float, default=0.20,
+                                help="Allowed relative growth of the median time")
+    compare_parser.add_argument("--memory-threshold", type=float, default=0.10,
+                                help="Allowed relative growth of the peak memory")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        generators = _parse_list(args.generators)
+        engines = _parse_list(args.engines)
+        for name, known in ((generators, GENERATORS), (engines, ENGINES)):
+            unknown = set(name) - set(known)
+            if unknown:
+                parser.error(f"Unknown choice(s): {', '.join(sorted(unknown))}")
+
+        print("\n" + "=" * 80)
+        print("WOA7001 GROUP PROJECT - PROBLEM 3")
+        print("MST BENCHMARK SUITE")
+        print("=" * 80 + "\n")
+        report = run_benchmarks(sizes=[int(float(size)) for size in _parse_list(args.sizes)],
+                                generators=generators, engines=engines,
+                                warmup=args.warmup, repeats=args.repeats, seed=args.seed,
+                                sort_buffer=args.sort_buffer, isolate=not args.no_isolate)
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nResults written to {args.output}")
+        return 0
+
+    with open(args.baseline) as handle:
+        baseline = json.load(handle)
+    with open(args.current) as handle:
+        current = json.load(handle)
+    regressions = compare_results(baseline, current, args.threshold, args.memory_threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) found:")
+        for message in regressions:
+            print(f"- {message}")
+        return 1
+    print("\nNo regressions found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
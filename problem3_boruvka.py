@@ -0,0 +1,457 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Algorithm 3: Parallel Boruvka's Algorithm for Minimum Spanning Tree (MST)
+
+This implementation uses Boruvka's algorithm to determine the optimal road
+network connecting locations in Delhi City by minimizing the total distance.
+Each round, every component picks its cheapest outgoing edge; that scan and
+the following contraction step are split across a process pool that works on
+edge and component arrays kept in shared memory.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem3_edge_store import EdgeStore
+
+
+# Shared arrays of the current solve, attached once per worker process
+_SHARED: Dict[str, np.ndarray] = {}
+_SHARED_BLOCKS: List[shared_memory.SharedMemory] = []
+
+
+def _attach_shared(specs: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+    """
+    Worker initializer: attach to the shared-memory arrays of a solve.
+
+    Args:
+        specs: Mapping of array name -> (shared memory name, shape, dtype)
+    """
+    _SHARED.clear()
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _SHARED_BLOCKS.append(block)
+        _SHARED[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _cheapest_edges(begin: int, end: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the cheapest outgoing edge per component within an edge range.
+
+    Edges are compared by their rank in ascending distance order, which is
+    a strict total order, so ties can never create a cycle.
+
+    Args:
+        begin: First edge position of the range
+        end: One past the last edge position of the range
+
+    Returns:
+        Tuple of (component labels, rank of their cheapest outgoing edge)
+    """
+    comp = _SHARED["comp"]
+    comp_src = comp[_SHARED["src"][begin:end]]
+    comp_dst = comp[_SHARED["dst"][begin:end]]
+    outgoing = comp_src != comp_dst
+    ranks = _SHARED["rank"][begin:end][outgoing]
+
+    components = np.concatenate([comp_src[outgoing], comp_dst[outgoing]])
+    ranks = np.concatenate([ranks, ranks])
+    return _min_per_component(components, ranks)
+
+
+def _relabel_nodes(begin: int, end: int) -> int:
+    """
+    Contraction step: point the nodes of a range at their new component.
+
+    The parent array is only read here (every old component already points
+    straight at its new root), so workers can relabel disjoint node ranges
+    at the same time.
+
+    Args:
+        begin: First node of the range
+        end: One past the last node of the range
+
+    Returns:
+        Number of nodes relabelled
+    """
+    comp = _SHARED["comp"]
+    comp[begin:end] = _SHARED["parent"][comp[begin:end]]
+    return end - begin
+
+
+def _min_per_component(components: np.ndarray, ranks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (component, rank) pairs to the minimum rank per component.
+
+    Args:
+        components: Component label of each pair
+        ranks: Edge rank of each pair
+
+    Returns:
+        Tuple of (unique component labels, minimum rank of each)
+    """
+    if len(components) == 0:
+        return components, ranks
+    no_edge = np.iinfo(ranks.dtype).max
+    best = np.full(len(_SHARED["comp"]), no_edge, dtype=ranks.dtype)
+    np.minimum.at(best, components, ranks)
+    present = np.flatnonzero(best != no_edge)
+    return present, best[present]
+
+
+def _split(total: int, parts: int) -> List[Tuple[int, int]]:
+    """Split range(total) into at most `parts` contiguous (begin, end) ranges."""
+    bounds = np.linspace(0, total, min(parts, max(total, 1)) + 1).astype(np.int64)
+    return [(int(b), int(e)) for b, e in zip(bounds[:-1], bounds[1:]) if e > b]
+
+
+class BoruvkaMST:
+    """
+    Implementation of Boruvka's Algorithm for finding Minimum Spanning Tree,
+    parallelized over a process pool.
+    """
+
+    def __init__(self, num_workers: Optional[int] = None,
+                 min_parallel_edges: int = 200_000):
+        """
+        Initialize Boruvka MST solver.
+
+        Args:
+            num_workers: Worker processes (defaults to the number of CPUs)
+            min_parallel_edges: Graphs with fewer edges are solved in-process,
+                where starting a pool would cost more than it saves
+        """
+        self.edges: List[Tuple[int, int, int, float]] = []
+        self.nodes: set = set()
+        self.node_coordinates: Dict[int, Tuple[float, float]] = {}
+        self.edge_store: Optional[EdgeStore] = None
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.min_parallel_edges = min_parallel_edges
+        self.num_rounds = 0
+        # Seconds spent in each phase of the last find_mst call
+        self.phase_times: Dict[str, float] = {}
+        # Run and phase duration histograms across find_mst calls
+        self.metrics = MetricsRegistry(engine="boruvka")
+
+    def add_edge(self, edge_id: int, start_node: int, end_node: int,
+                 distance: float, x_coord: float, y_coord: float):
+        """
+        Add an edge to the graph.
+
+        Args:
+            edge_id: Unique identifier for the edge
+            start_node: Starting node
+            end_node: Ending node
+            distance: Distance between nodes
+            x_coord: X coordinate of start node
+            y_coord: Y coordinate of start node
+        """
+        self.edges.append((edge_id, start_node, end_node, distance))
+        self.nodes.add(start_node)
+        self.nodes.add(end_node)
+
+        # Store coordinates for the first occurrence of each node
+        if start_node not in self.node_coordinates:
+            self.node_coordinates[start_node] = (x_coord, y_coord)
+
+    def load_edge_store(self, edge_store: EdgeStore):
+        """
+        Use a columnar edge store instead of per-edge tuples.
+
+        Args:
+            edge_store: EdgeStore holding the graph edges
+        """
+        self.edge_store = edge_store
+
+    def get_total_nodes(self) -> int:
+        """
+        Get the total number of nodes in the graph.
+
+        Returns:
+            Number of nodes
+        """
+        if self.edge_store is not None:
+            return self.edge_store.num_nodes
+        return len(self.nodes)
+
+    def get_total_edges(self) -> int:
+        """
+        Get the total number of edges (rows) in the graph.
+
+        Returns:
+            Number of edges
+        """
+        if self.edge_store is not None:
+            return self.edge_store.num_edges
+        return len(self.edges)
+
+    def find_mst(self) -> Tuple[List[Tuple], float, float]:
+        """
+        Find the Minimum Spanning Tree using Boruvka's algorithm.
+
+        For a disconnected graph this returns a minimum spanning forest,
+        like KruskalMST.find_mst.
+
+        Returns:
+            Tuple containing:
+                - List of edges in MST (edge_id, start_node, end_node, distance)
+                - Total distance of MST
+                - Execution time in seconds
+        """
+        start_time = time.perf_counter()
+
+        store = self.edge_store
+        if store is None:
+            store = EdgeStore(*zip(*self.edges)) if self.edges else None
+        if store is None or store.num_nodes == 0:
+            return [], 0.0, time.perf_counter() - start_time
+
+        # Rank edges by distance once; ranks give a strict total order
+        order = store.sorted_order()
+        rank_dtype = np.int32 if store.num_edges < 2 ** 31 else np.int64
+        rank = np.empty(store.num_edges, dtype=rank_dtype)
+        rank[order] = np.arange(store.num_edges, dtype=rank_dtype)
+        sort_time = time.perf_counter()
+
+        index_dtype = store.src_index.dtype
+        arrays = {
+            "src": store.src_index,
+            "dst": store.dst_index,
+            "rank": rank,
+            "comp": np.arange(store.num_nodes, dtype=index_dtype),
+            "parent": np.arange(store.num_nodes, dtype=index_dtype),
+        }
+
+        if self.num_workers > 1 and store.num_edges >= self.min_parallel_edges:
+            chosen_ranks = self._run_parallel(arrays)
+        else:
+            _SHARED.clear()
+            _SHARED.update(arrays)
+            try:
+                chosen_ranks = self._run_rounds(map)
+            finally:
+                _SHARED.clear()
+        rounds_time = time.perf_counter()
+
+        mst_edges = [store.mst_edge(position) for position in order[np.sort(chosen_ranks)].tolist()]
+        total_distance = sum(edge[3] for edge in mst_edges)
+
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        self.phase_times = {"sort": sort_time - start_time,
+                            "union_find": rounds_time - sort_time,
+                            "output": end_time - rounds_time}
+        self.metrics.record_run(execution_time, self.phase_times)
+
+        return mst_edges, total_distance, execution_time
+
+    def _run_parallel(self, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Copy the solve arrays into shared memory and run the rounds on a pool.
+
+        Args:
+            arrays: Arrays of the solve (see find_mst)
+
+        Returns:
+            Ranks of the accepted edges
+        """
+        blocks = []
+        specs = {}
+        try:
+            # The parent process uses the same shared arrays for the union step
+            _SHARED.clear()
+            for key, array in arrays.items():
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                blocks.append(block)
+                _SHARED[key] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                _SHARED[key][:] = array
+                specs[key] = (block.name, array.shape, array.dtype.str)
+
+            with ProcessPoolExecutor(max_workers=self.num_workers,
+                                     initializer=_attach_shared,
+                                     initargs=(specs,)) as pool:
+                def pool_map(function, begins, ends):
+                    return pool.map(function, begins, ends)
+                return self._run_rounds(pool_map)
+        finally:
+            _SHARED.clear()
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def _run_rounds(self, map_function) -> np.ndarray:
+        """
+        Run Boruvka rounds until no component has an outgoing edge.
+
+        Args:
+            map_function: map-like callable used to run the per-range steps
+                (the builtin map, or a process pool's map)
+
+        Returns:
+            Ranks of the accepted edges
+        """
+        num_edges = len(_SHARED["src"])
+        num_nodes = len(_SHARED["comp"])
+        edge_ranges = _split(num_edges, self.num_workers)
+        node_ranges = _split(num_nodes, self.num_workers)
+
+        src, dst = _SHARED["src"], _SHARED["dst"]
+        comp, parent = _SHARED["comp"], _SHARED["parent"]
+
+        order_by_rank = np.empty(num_edges, dtype=np.int64)
+        order_by_rank[_SHARED["rank"]] = np.arange(num_edges)
+
+        chosen = []
+        self.num_rounds = 0
+
+        while True:
+            # Cheapest outgoing edge per component, scanned in parallel
+            results = list(map_function(_cheapest_edges, *zip(*edge_ranges)))
+            components = np.concatenate([components for components, _ in results])
+            ranks = np.concatenate([ranks for _, ranks in results])
+            components, best_ranks = _min_per_component(components, ranks)
+            if len(best_ranks) == 0:
+                break
+            self.num_rounds += 1
+
+            # Hook each component onto the one across its cheapest edge. Two
+            # components can only choose each other through the same edge;
+            # the smaller label of such a pair stays the root.
+            positions = order_by_rank[best_ranks]
+            comp_src = comp[src[positions]]
+            comp_dst = comp[dst[positions]]
+            targets = np.where(comp_src == components, comp_dst, comp_src)
+            parent[components] = targets
+            mutual = (parent[targets] == components) & (components < targets)
+            parent[components[mutual]] = components[mutual]
+
+            # Pointer doubling until every component points straight at its root
+            while True:
+                grandparents = parent[parent[components]]
+                if np.array_equal(grandparents, parent[components]):
+                    break
+                parent[components] = grandparents
+
+            # Both components of a pair report the same edge; keep it once
+            chosen.append(np.unique(best_ranks))
+
+            # Contract the merged components, relabelling nodes in parallel
+            list(map_function(_relabel_nodes, *zip(*node_ranges)))
+
+        return np.concatenate(chosen) if chosen else np.empty(0, dtype=np.int64)
+
+    def display_mst(self, mst_edges: List[Tuple], total_distance: float,
+                    execution_time: float):
+        """
+        Display the Minimum Spanning Tree results.
+
+        Args:
+            mst_edges: List of edges in MST
+            total_distance: Total distance of MST
+            execution_time: Time taken to compute MST
+        """
+        print("=" * 80)
+        print("BORUVKA'S ALGORITHM - MINIMUM SPANNING TREE")
+        print("=" * 80)
+        print("\nOptimal Road Network for Delhi City\n")
+        print(f"{'Edge ID':<10} {'Start':<8} {'End':<8} {'Distance':<15}")
+        print("-" * 80)
+
+        for edge_id, start_node, end_node, distance in mst_edges:
+            print(f"{edge_id:<10} {start_node:<8} {end_node:<8} {distance:<15.2f}")
+
+        print("-" * 80)
+        print(f"\nTotal Number of Nodes: {self.get_total_nodes()}")
+        print(f"Total Number of Roads (Edges in MST): {len(mst_edges)}")
+        print(f"Total Network Distance: {total_distance:.2f} units")
+        print(f"Boruvka Rounds: {self.num_rounds}")
+        print(f"Execution Time: {execution_time:.6f} seconds")
+        print("=" * 80)
+
+
+def load_delhi_city_data() -> BoruvkaMST:
+    """
+    Load the Delhi City network data from Table 5.
+
+    Returns:
+        BoruvkaMST object with loaded data
+    """
+    # Data from Table 5: Delhi City locations
+    data = [
+        (712537.65892300, 3144490.85877640, 1, 2, 1, 3.75432447162338),
+        (712537.65892300, 3144490.85877640, 1, 2, 2, 3.75432447162338),
+        (712537.65892300, 3144490.85877640, 1, 3, 3, 20.4871202876504),
+        (712537.65892300, 3144490.85877640, 1, 4, 4, 19.1877809458002),
+        (712540.40782175, 3144488.30172578, 2, 1, 1, 3.75432447162338),
+        (712540.40782175, 3144488.30172578, 2, 1, 2, 3.75432447162338),
+        (712557.85887214, 3144494.27698534, 3, 1, 3, 20.4871202876504),
+        (712522.10662982, 3144502.09697530, 4, 1, 4, 19.1877809458002),
+        (712522.10662982, 3144502.09697530, 4, 5, 5, 201.987464765257),
+        (712522.10662982, 3144502.09697530, 4, 5, 6, 131.072874250845),
+        (712522.10662982, 3144502.09697530, 4, 5, 7, 131.072874250845),
+        (712419.52081542, 3144583.68281383, 5, 4, 5, 201.987464765257),
+        (712419.52081542, 3144583.68281383, 5, 4, 6, 131.072874250845),
+        (712419.52081542, 3144583.68281383, 5, 4, 7, 131.072874250845),
+        (712419.52081542, 3144583.68281383, 5, 6, 8, 1008.13308093641),
+        (711578.86168731, 3145075.59898330, 6, 5, 8, 1008.13308093641),
+        (711315.23002979, 3145398.57620775, 7, 8, 9, 113.853447528611),
+        (711315.23002979, 3145398.57620775, 7, 8, 10, 113.853447528611),
+        (711284.86276158, 3145505.61220279, 8, 7, 9, 113.853447528611),
+        (711284.86276158, 3145505.61220279, 8, 7, 10, 113.853447528611),
+    ]
+
+    boruvka = BoruvkaMST()
+
+    for x_coord, y_coord, start_node, end_node, edge_id, distance in data:
+        boruvka.add_edge(edge_id, start_node, end_node, distance, x_coord, y_coord)
+
+    return boruvka
+
+
+def load_edge_file(path: str, num_workers: Optional[int] = None) -> BoruvkaMST:
+    """
+    Bulk-load a road network edge table from a .csv, .npy or .npz file.
+
+    Args:
+        path: Path to the edge table
+        num_workers: Worker processes (defaults to the number of CPUs)
+
+    Returns:
+        BoruvkaMST object backed by a columnar edge store
+    """
+    boruvka = BoruvkaMST(num_workers=num_workers)
+    boruvka.load_edge_store(EdgeStore.load(path))
+    return boruvka
+
+
+def main():
+    """
+    Main function to demonstrate Boruvka's algorithm on Delhi City network.
+    """
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT - PROBLEM 3")
+    print("Urban Road Network Planning using Boruvka's Algorithm")
+    print("=" * 80 + "\n")
+
+    # Load Delhi City data
+    boruvka = load_delhi_city_data()
+
+    print(f"Loaded {boruvka.get_total_edges()} edges connecting {boruvka.get_total_nodes()} nodes")
+    print("Computing Minimum Spanning Tree...\n")
+
+    # Find MST
+    mst_edges, total_distance, execution_time = boruvka.find_mst()
+
+    # Display results
+    boruvka.display_mst(mst_edges, total_distance, execution_time)
+    print("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,37 @@
 """
 WOA7001 Group Project - Problem 3: Comparison of Algorithms
-This script runs both Kruskal's and Prim's algorithms and compares their performance.
+This script runs Kruskal's, Prim's and Boruvka's algorithms and compares their performance.
 """
 
 import time
-from problem3_kruskal import KruskalMST, load_delhi_city_data as load_kruskal_data
-from problem3_prim import PrimMST, load_delhi_city_data as load_prim_data
+
+import numpy as np
+
+from problem3_edge_store import EdgeStore
+from problem3_graph_snapshot import load_delhi_city_snapshot
+from problem3_kruskal import KruskalMST
+from problem3_prim import PrimMST
+from problem3_boruvka import BoruvkaMST
 
 
 def run_comparison():
     """
-    Run both algorithms and compare their results.
+    Run all three algorithms and compare their results.
     """
     print("\n" + "=" * 80)
     print("WOA7001 GROUP PROJECT - PROBLEM 3")
-    print("COMPARATIVE ANALYSIS: Kruskal's vs Prim's Algorithm")
+    print("COMPARATIVE ANALYSIS: Kruskal's vs Prim's vs Boruvka's Algorithm")
     print("=" * 80 + "\n")
     
+    # Canonical snapshot shared by all solvers (built once, cached on disk)
+    snapshot = load_delhi_city_snapshot()
+    print(f"Graph snapshot: {snapshot.num_input_edges} input rows -> "
+          f"{snapshot.num_edges} distinct roads\n")
+    
     # Run Kruskal's Algorithm
     print("Running Kruskal's Algorithm...")
-    kruskal = load_kruskal_data()
+    kruskal = KruskalMST()
+    kruskal.load_edge_store(snapshot)
     kruskal_mst, kruskal_distance, kruskal_time = kruskal.find_mst()
     kruskal.display_mst(kruskal_mst, kruskal_distance, kruskal_time)
     
@@ -27,41 +39,62 @@ def run_comparison():
     
     # Run Prim's Algorithm
     print("Running Prim's Algorithm...")
-    prim = load_prim_data()
+    prim = PrimMST()
+    prim.load_edge_store(snapshot)
     prim_mst, prim_distance, prim_time = prim.find_mst(start_node=1)
     prim.display_mst(prim_mst, prim_distance, prim_time)
     
+    print("\n" + "-" * 80 + "\n")
+    
+    # Run Boruvka's Algorithm
+    print("Running Boruvka's Algorithm...")
+    boruvka = BoruvkaMST()
+    boruvka.load_edge_store(snapshot)
+    boruvka_mst, boruvka_distance, boruvka_time = boruvka.find_mst()
+    boruvka.display_mst(boruvka_mst, boruvka_distance, boruvka_time)
+    
     print("\n" + "=" * 80)
     print("COMPARISON TABLE")
     print("=" * 80)
     
     # Create comparison table
-    print(f"\n{'Metric':<40} {'Kruskal':<20} {'Prim':<20}")
+    print(f"\n{'Metric':<32} {'Kruskal':<15} {'Prim':<15} {'Boruvka':<15}")
     print("-" * 80)
-    print(f"{'Total Network Distance (units)':<40} {kruskal_distance:<20.2f} {prim_distance:<20.2f}")
-    print(f"{'Number of Edges in MST':<40} {len(kruskal_mst):<20} {len(prim_mst):<20}")
-    print(f"{'Execution Time (seconds)':<40} {kruskal_time:<20.8f} {prim_time:<20.8f}")
-    print(f"{'Number of Nodes Connected':<40} {len(kruskal.nodes):<20} {len(prim.nodes):<20}")
+    print(f"{'Total Network Distance (units)':<32} {kruskal_distance:<15.2f} {prim_distance:<15.2f} {boruvka_distance:<15.2f}")
+    print(f"{'Number of Edges in MST':<32} {len(kruskal_mst):<15} {len(prim_mst):<15} {len(boruvka_mst):<15}")
+    print(f"{'Execution Time (seconds)':<32} {kruskal_time:<15.8f} {prim_time:<15.8f} {boruvka_time:<15.8f}")
+    print(f"{'Number of Nodes Connected':<32} {snapshot.num_nodes:<15} {snapshot.num_nodes:<15} {snapshot.num_nodes:<15}")
     
     # Performance comparison
-    faster_algorithm = "Kruskal's" if kruskal_time < prim_time else "Prim's"
-    time_difference = abs(kruskal_time - prim_time)
-    speedup = max(kruskal_time, prim_time) / min(kruskal_time, prim_time)
+    times = {"Kruskal's": kruskal_time, "Prim's": prim_time, "Boruvka's": boruvka_time}
+    faster_algorithm = min(times, key=times.get)
+    slower_algorithm = max(times, key=times.get)
+    time_difference = times[slower_algorithm] - times[faster_algorithm]
+    speedup = times[slower_algorithm] / times[faster_algorithm]
+    prim_matches = abs(kruskal_distance - prim_distance) < 0.01
+    boruvka_matches = abs(kruskal_distance - boruvka_distance) < 0.01
     
     print("-" * 80)
     print(f"\nPERFORMANCE ANALYSIS:")
-    print(f"- Both algorithms produced MSTs with identical total distance: {kruskal_distance:.2f} units")
-    print(f"- {faster_algorithm} Algorithm was faster by {time_difference:.8f} seconds")
+    if prim_matches and boruvka_matches:
+        print(f"- All three algorithms produced MSTs with identical total distance: {kruskal_distance:.2f} units")
+    else:
+        print(f"- MST total distances differ: Kruskal {kruskal_distance:.2f}, Prim {prim_distance:.2f}, "
+              f"Boruvka {boruvka_distance:.2f} units")
+    print(f"- {faster_algorithm} Algorithm was fastest, {time_difference:.8f} seconds ahead of {slower_algorithm}")
     print(f"- Speedup factor: {speedup:.2f}x")
-    print(f"- Distance verification: {'PASSED' if abs(kruskal_distance - prim_distance) < 0.01 else 'FAILED'}")
+    print(f"- Distance verification: {'PASSED' if prim_matches else 'FAILED'}")
+    print(f"- Boruvka distance verification: {'PASSED' if boruvka_matches else 'FAILED'}")
     
     print("\nKEY OBSERVATIONS:")
-    print("1. Both algorithms guarantee finding the optimal MST with minimum total distance")
+    print("1. All three algorithms guarantee finding the optimal MST with minimum total distance")
     print("2. The MST is unique for this graph (no edges with equal weights causing ties)")
     print("3. Kruskal's algorithm is edge-oriented (processes all edges)")
     print("4. Prim's algorithm is vertex-oriented (grows tree from a starting vertex)")
     print("5. For sparse graphs, Kruskal's is typically more efficient")
     print("6. For dense graphs, Prim's with binary heap can be more efficient")
+    print("7. Boruvka's algorithm is component-oriented (all components grow each round),")
+    print("   so each round can be split across CPU cores on large graphs")
     
     print("\n" + "=" * 80 + "\n")
 
@@ -70,6 +103,9 @@ def run_multiple_trials(num_trials=10):
     """
     Run multiple trials to get average execution time.
     
+    This times the 20-edge Delhi graph only; use problem3_benchmark.py for
+    warmed-up, phase-split measurements on large synthetic graphs.
+    
     Args:
         num_trials: Number of trials to run
     """
@@ -80,14 +116,19 @@ def run_multiple_trials(num_trials=10):
     kruskal_times = []
     prim_times = []
     
+    # The graph is canonicalized once and reused by every trial
+    snapshot = load_delhi_city_snapshot()
+    
     for i in range(num_trials):
         # Kruskal's Algorithm
-        kruskal = load_kruskal_data()
+        kruskal = KruskalMST()
+        kruskal.load_edge_store(snapshot)
         _, _, k_time = kruskal.find_mst()
         kruskal_times.append(k_time)
         
         # Prim's Algorithm
-        prim = load_prim_data()
+        prim = PrimMST()
+        prim.load_edge_store(snapshot)
         _, _, p_time = prim.find_mst(start_node=1)
         prim_times.append(p_time)
         
@@ -114,9 +155,98 @@ def run_multiple_trials(num_trials=10):
     print(f"Faster algorithm on average: {'Kruskal' if avg_kruskal < avg_prim else 'Prim'}\n")
 
 
+def random_graph_store(num_nodes: int, density: float, seed: int = 0) -> EdgeStore:
+    """
+    Generate a connected random graph with the given edge density.
+    
+    Args:
+        num_nodes: Number of nodes
+        density: Fraction of all n(n-1)/2 node pairs that get an edge
+        seed: Random seed
+        
+    Returns:
+        EdgeStore with random distances
+    """
+    rng = np.random.default_rng(seed)
+    num_pairs = num_nodes * (num_nodes - 1) // 2
+    
+    if density >= 1.0:
+        src, dst = np.triu_indices(num_nodes, k=1)
+    else:
+        # A random path keeps the graph connected; the rest are random pairs
+        path = rng.permutation(num_nodes)
+        extra = max(int(density * num_pairs) - (num_nodes - 1), 0)
+        src = np.concatenate([path[:-1], rng.integers(0, num_nodes, extra)])
+        dst = np.concatenate([path[1:], rng.integers(0, num_nodes, extra)])
+    
+    distance = rng.uniform(1.0, 1000.0, len(src))
+    return EdgeStore(np.arange(len(src)), src, dst, distance)
+
+
+def run_prim_crossover_benchmark(node_counts=(500, 1000, 2000),
+                                 densities=(0.01, 0.02, 0.05, 0.1, 0.25, 0.5, 1.0),
+                                 num_trials=3):
+    """
+    Benchmark the Prim modes across graph densities to find the crossover
+    point where the O(V^2) dense mode beats the heap-based modes.
+    
+    Args:
+        node_counts: Graph sizes to test
+        densities: Edge densities to test for each size
+        num_trials: Trials per configuration (the best time is reported)
+    """
+    modes = ("lazy", "indexed", "dense")
+    
+    print("\n" + "=" * 80)
+    print("PRIM'S ALGORITHM - HEAP VS DENSE CROSSOVER BENCHMARK")
+    print("=" * 80)
+    
+    for num_nodes in node_counts:
+        print(f"\nNodes: {num_nodes}")
+        print(f"{'Density':<10} {'Edges':<12} {'Lazy (s)':<14} {'Indexed (s)':<14} "
+              f"{'Dense (s)':<14} {'Auto picks':<10}")
+        print("-" * 80)
+        
+        crossover = {"lazy": None, "indexed": None}
+        for density in densities:
+            store = random_graph_store(num_nodes, density, seed=num_nodes)
+            prim = PrimMST()
+            prim.load_edge_store(store)
+            store.build_csr()  # Shared by all heap modes, built once
+            
+            best = {}
+            for mode in modes:
+                times = []
+                for _ in range(num_trials):
+                    start = time.perf_counter()
+                    prim.find_mst(mode=mode)
+                    times.append(time.perf_counter() - start)
+                best[mode] = min(times)
+            
+            for heap_mode in crossover:
+                if crossover[heap_mode] is None and best["dense"] < best[heap_mode]:
+                    crossover[heap_mode] = density
+            
+            print(f"{density:<10.2f} {store.num_edges:<12} {best['lazy']:<14.6f} "
+                  f"{best['indexed']:<14.6f} {best['dense']:<14.6f} "
+                  f"{prim.choose_mode(store):<10}")
+        
+        print("-" * 80)
+        for heap_mode, density in crossover.items():
+            if density is None:
+                print(f"Dense mode did not beat the {heap_mode} heap at any tested density")
+            else:
+                print(f"Dense mode beats the {heap_mode} heap from density {density:.2f}")
+    
+    print("\n" + "=" * 80 + "\n")
+
+
 if __name__ == "__main__":
     # Run single comparison
     run_comparison()
     
     # Run multiple trials for statistical analysis
     run_multiple_trials(num_trials=10)
+    
+    # Find where Prim's dense mode overtakes the heap modes
+    run_prim_crossover_benchmark()
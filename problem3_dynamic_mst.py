@@ -0,0 +1,680 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Dynamic Minimum Spanning Tree Maintenance
+
+Keeps the optimal road network current while road segments open, close or
+get re-surveyed, instead of rebuilding and re-sorting the whole network with
+Kruskal's algorithm after every change. The tree is stored in a link-cut
+tree, which answers "heaviest road on the tree path between two locations"
+in O(log n) amortized time.
+
+Update costs:
+    - insert_edge, and update_distance that lowers a distance: O(log n)
+    - delete_edge of a non-tree edge, or raising a non-tree distance: O(1)
+    - delete_edge of a tree edge, or raising a tree distance: proportional
+      to the smaller of the two pieces the tree splits into (plus the
+      non-tree edges touching it), which is where a replacement road
+      has to come from
+"""
+
+import random
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from instrumentation import MetricsRegistry
+from problem3_kruskal import KruskalMST
+
+
+class LinkCutTree:
+    """
+    Link-cut tree (Sleator-Tarjan) over a forest with weighted nodes.
+
+    Tree edges are modelled as nodes of their own, placed between their two
+    endpoints, so the path aggregate (maximum node value) gives the heaviest
+    edge on a path. Locations have value -inf.
+    """
+
+    def __init__(self):
+        """Initialize an empty forest."""
+        self.left: List[int] = []
+        self.right: List[int] = []
+        self.parent: List[int] = []
+        self.flip: List[bool] = []
+        self.value: List[float] = []
+        self.best: List[int] = []   # Node with the largest value in the splay subtree
+        self.free: List[int] = []
+
+    def add_node(self, value: float = float('-inf')) -> int:
+        """
+        Add an isolated node.
+
+        Args:
+            value: Node value
+
+        Returns:
+            Index of the new node
+        """
+        if self.free:
+            x = self.free.pop()
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flip[x] = False
+            self.value[x] = value
+            self.best[x] = x
+            return x
+        x = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def remove_node(self, x: int):
+        """
+        Release an isolated node so its index can be reused.
+
+        Args:
+            x: Node to release (must already be cut from all neighbours)
+        """
+        self.free.append(x)
+
+    def set_value(self, x: int, value: float):
+        """
+        Change the value of a node.
+
+        Args:
+            x: Node to update
+            value: New value
+        """
+        self._access(x)
+        self.value[x] = value
+        self._update(x)
+
+    def link(self, x: int, y: int):
+        """
+        Connect two nodes that are in different trees.
+
+        Args:
+            x: First node
+            y: Second node
+        """
+        self._make_root(x)
+        self.parent[x] = y
+
+    def cut(self, x: int, y: int):
+        """
+        Remove the tree edge between two adjacent nodes.
+
+        Args:
+            x: First node
+            y: Second node
+        """
+        self._make_root(x)
+        self._access(y)
+        # x is now the only node left of y in y's splay tree
+        self.left[y] = -1
+        self.parent[x] = -1
+        self._update(y)
+
+    def connected(self, x: int, y: int) -> bool:
+        """
+        Check whether two nodes are in the same tree.
+
+        Args:
+            x: First node
+            y: Second node
+
+        Returns:
+            True if x and y are connected
+        """
+        return x == y or self._find_root(x) == self._find_root(y)
+
+    def path_max(self, x: int, y: int) -> int:
+        """
+        Find the node with the largest value on the path between two nodes.
+
+        Args:
+            x: First node
+            y: Second node (must be connected to x)
+
+        Returns:
+            Index of the node with the largest value
+        """
+        self._make_root(x)
+        self._access(y)
+        return self.best[y]
+
+    # ------------------------------------------------------------------
+    # Splay tree internals
+    # ------------------------------------------------------------------
+
+    def _is_root(self, x: int) -> bool:
+        p = self.parent[x]
+        return p < 0 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x: int):
+        if self.flip[x]:
+            left, right = self.left[x], self.right[x]
+            self.left[x], self.right[x] = right, left
+            if left >= 0:
+                self.flip[left] = not self.flip[left]
+            if right >= 0:
+                self.flip[right] = not self.flip[right]
+            self.flip[x] = False
+
+    def _update(self, x: int):
+        value, best = self.value, self.best
+        top = x
+        left, right = self.left[x], self.right[x]
+        if left >= 0 and value[best[left]] > value[top]:
+            top = best[left]
+        if right >= 0 and value[best[right]] > value[top]:
+            top = best[right]
+        best[x] = top
+
+    def _rotate(self, x: int):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if left[p] == x:
+            child = right[x]
+            left[p] = child
+            right[x] = p
+        else:
+            child = left[x]
+            right[p] = child
+            left[x] = p
+        if child >= 0:
+            parent[child] = p
+        if g >= 0:
+            if left[g] == p:
+                left[g] = x
+            elif right[g] == p:
+                right[g] = x
+            # Otherwise g is a path-parent pointer, which x inherits
+        parent[x] = g
+        parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x: int):
+        # Push pending flips from the splay root down to x
+        path = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+
+        while not self._is_root(x):
+            p = self.parent[x]
+            if not self._is_root(p):
+                g = self.parent[p]
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _access(self, x: int):
+        last = -1
+        y = x
+        while y >= 0:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x: int):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+        self._push(x)
+
+    def _find_root(self, x: int) -> int:
+        self._access(x)
+        while True:
+            self._push(x)
+            if self.left[x] < 0:
+                break
+            x = self.left[x]
+        self._splay(x)
+        return x
+
+
+class DynamicMST:
+    """
+    Minimum spanning tree (forest) that is repaired in place as edges are
+    inserted, deleted or change distance.
+    """
+
+    def __init__(self):
+        """Initialize an empty dynamic MST."""
+        self.lct = LinkCutTree()
+        self.node_index: Dict[int, int] = {}         # node ID -> tree node
+        self.node_ids: Dict[int, int] = {}           # tree node -> node ID
+        self.edges: Dict[int, List] = {}             # edge ID -> [start, end, distance]
+        self.edge_node: Dict[int, int] = {}          # tree edge ID -> tree node
+        self.node_edge: Dict[int, int] = {}          # tree node -> tree edge ID
+        self.tree_adj: Dict[int, Set[int]] = {}      # node -> incident tree edge IDs
+        self.nontree_adj: Dict[int, Set[int]] = {}   # node -> incident non-tree edge IDs
+        self.total_distance = 0.0
+        # Per-operation duration histograms of apply()
+        self.metrics = MetricsRegistry(engine="dynamic_mst")
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[int, int, int, float]],
+                   mst_edges: Optional[List[Tuple]] = None) -> "DynamicMST":
+        """
+        Build a dynamic MST from an edge list, seeded with an existing MST.
+
+        Rows that repeat an edge ID (the same road listed once per
+        direction) are treated as a single edge.
+
+        Args:
+            edges: Edges as (edge_id, start_node, end_node, distance)
+            mst_edges: MST edges from a find_mst call on the same edges
+                (computed with Kruskal's algorithm if not given)
+
+        Returns:
+            DynamicMST holding the seeded tree
+        """
+        unique_edges: Dict[int, Tuple[int, int, int, float]] = {}
+        for edge in edges:
+            unique_edges.setdefault(edge[0], edge)
+
+        if mst_edges is None:
+            kruskal = KruskalMST()
+            for edge_id, start_node, end_node, distance in unique_edges.values():
+                kruskal.add_edge(edge_id, start_node, end_node, distance, 0.0, 0.0)
+            mst_edges, _, _ = kruskal.find_mst()
+
+        dynamic = cls()
+        tree_ids = {edge[0] for edge in mst_edges}
+        for edge_id, start_node, end_node, distance in unique_edges.values():
+            u = dynamic._add_node(start_node)
+            v = dynamic._add_node(end_node)
+            dynamic.edges[edge_id] = [u, v, distance]
+            if edge_id in tree_ids:
+                dynamic._link_tree_edge(edge_id)
+            else:
+                dynamic._add_nontree_edge(edge_id)
+        return dynamic
+
+    @classmethod
+    def from_kruskal(cls, kruskal: KruskalMST,
+                     mst_edges: Optional[List[Tuple]] = None) -> "DynamicMST":
+        """
+        Build a dynamic MST from a loaded KruskalMST solver.
+
+        Args:
+            kruskal: Solver with loaded edges (tuples or edge store)
+            mst_edges: Result of kruskal.find_mst() (computed if not given)
+
+        Returns:
+            DynamicMST holding the seeded tree
+        """
+        if mst_edges is None:
+            mst_edges, _, _ = kruskal.find_mst()
+        if kruskal.edge_store is not None:
+            store = kruskal.edge_store
+            edges = zip(store.edge_id.tolist(), store.start_node.tolist(),
+                        store.end_node.tolist(), store.distance.tolist())
+        else:
+            edges = kruskal.edges
+        return cls.from_edges(edges, mst_edges)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def insert_edge(self, edge_id: int, start_node: int, end_node: int, distance: float):
+        """
+        Add a new road segment and repair the tree.
+
+        Args:
+            edge_id: Unique identifier for the edge
+            start_node: Starting node
+            end_node: Ending node
+            distance: Distance between nodes
+        """
+        if edge_id in self.edges:
+            raise ValueError(f"Edge {edge_id} already exists")
+        u = self._add_node(start_node)
+        v = self._add_node(end_node)
+        self.edges[edge_id] = [u, v, distance]
+
+        if u == v:
+            self._add_nontree_edge(edge_id)
+        elif not self.lct.connected(u, v):
+            self._link_tree_edge(edge_id)
+        else:
+            self._add_nontree_edge(edge_id)
+            self._try_swap_in(edge_id)
+
+    def delete_edge(self, edge_id: int):
+        """
+        Close a road segment and repair the tree.
+
+        Args:
+            edge_id: Edge to remove
+        """
+        if edge_id not in self.edges:
+            raise KeyError(f"Edge {edge_id} does not exist")
+
+        if edge_id in self.edge_node:
+            u, v, _ = self.edges[edge_id]
+            self._cut_tree_edge(edge_id)
+            del self.edges[edge_id]
+            replacement = self._find_replacement(u, v)
+            if replacement is not None:
+                self._remove_nontree_edge(replacement)
+                self._link_tree_edge(replacement)
+        else:
+            self._remove_nontree_edge(edge_id)
+            del self.edges[edge_id]
+
+    def update_distance(self, edge_id: int, distance: float):
+        """
+        Change the distance of a road segment and repair the tree.
+
+        Args:
+            edge_id: Edge to update
+            distance: New distance
+        """
+        if edge_id not in self.edges:
+            raise KeyError(f"Edge {edge_id} does not exist")
+        edge = self.edges[edge_id]
+        old_distance = edge[2]
+
+        if edge_id in self.edge_node:
+            edge[2] = distance
+            self.total_distance += distance - old_distance
+            self.lct.set_value(self.edge_node[edge_id], distance)
+            if distance > old_distance:
+                # A cheaper non-tree edge across the same cut may now win
+                u, v, _ = edge
+                self._cut_tree_edge(edge_id)
+                replacement = self._find_replacement(u, v)
+                if replacement is not None and self.edges[replacement][2] < distance:
+                    self._remove_nontree_edge(replacement)
+                    self._link_tree_edge(replacement)
+                    self._add_nontree_edge(edge_id)
+                else:
+                    self._link_tree_edge(edge_id)
+        else:
+            edge[2] = distance
+            if distance < old_distance:
+                self._try_swap_in(edge_id)
+
+    def apply(self, updates: Iterable[Tuple]):
+        """
+        Apply a stream of updates, timing each operation.
+
+        Args:
+            updates: Tuples of ("insert", edge_id, start, end, distance),
+                ("delete", edge_id) or ("update", edge_id, distance)
+        """
+        for update in updates:
+            operation = update[0]
+            with self.metrics.phase(operation):
+                if operation == "insert":
+                    self.insert_edge(*update[1:])
+                elif operation == "delete":
+                    self.delete_edge(update[1])
+                elif operation == "update":
+                    self.update_distance(update[1], update[2])
+                else:
+                    raise ValueError(f"Unknown update '{operation}'")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_mst_edges(self) -> List[Tuple[int, int, int, float]]:
+        """
+        Get the current MST edges.
+
+        Returns:
+            List of (edge_id, start_node, end_node, distance) sorted by distance
+        """
+        mst_edges = []
+        for edge_id in self.edge_node:
+            u, v, distance = self.edges[edge_id]
+            mst_edges.append((edge_id, self.node_ids[u], self.node_ids[v], distance))
+        mst_edges.sort(key=lambda edge: edge[3])
+        return mst_edges
+
+    def is_tree_edge(self, edge_id: int) -> bool:
+        """
+        Check whether an edge is currently part of the MST.
+
+        Args:
+            edge_id: Edge to check
+
+        Returns:
+            True if the edge is in the MST
+        """
+        return edge_id in self.edge_node
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _add_node(self, node_id: int) -> int:
+        index = self.node_index.get(node_id)
+        if index is None:
+            index = self.lct.add_node()
+            self.node_index[node_id] = index
+            self.node_ids[index] = node_id
+            self.tree_adj[index] = set()
+            self.nontree_adj[index] = set()
+        return index
+
+    def _link_tree_edge(self, edge_id: int):
+        u, v, distance = self.edges[edge_id]
+        x = self.lct.add_node(distance)
+        self.edge_node[edge_id] = x
+        self.node_edge[x] = edge_id
+        self.lct.link(u, x)
+        self.lct.link(x, v)
+        self.tree_adj[u].add(edge_id)
+        self.tree_adj[v].add(edge_id)
+        self.total_distance += distance
+
+    def _cut_tree_edge(self, edge_id: int):
+        u, v, distance = self.edges[edge_id]
+        x = self.edge_node.pop(edge_id)
+        del self.node_edge[x]
+        self.lct.cut(u, x)
+        self.lct.cut(x, v)
+        self.lct.remove_node(x)
+        self.tree_adj[u].discard(edge_id)
+        self.tree_adj[v].discard(edge_id)
+        self.total_distance -= distance
+
+    def _add_nontree_edge(self, edge_id: int):
+        u, v, _ = self.edges[edge_id]
+        self.nontree_adj[u].add(edge_id)
+        self.nontree_adj[v].add(edge_id)
+
+    def _remove_nontree_edge(self, edge_id: int):
+        u, v, _ = self.edges[edge_id]
+        self.nontree_adj[u].discard(edge_id)
+        self.nontree_adj[v].discard(edge_id)
+
+    def _try_swap_in(self, edge_id: int):
+        """Replace the heaviest edge on the tree path if this non-tree edge is lighter."""
+        u, v, distance = self.edges[edge_id]
+        if u == v:
+            return
+        heaviest = self.lct.path_max(u, v)
+        if self.lct.value[heaviest] <= distance:
+            return
+        heaviest_id = self.node_edge[heaviest]
+        self._cut_tree_edge(heaviest_id)
+        self._add_nontree_edge(heaviest_id)
+        self._remove_nontree_edge(edge_id)
+        self._link_tree_edge(edge_id)
+
+    def _find_replacement(self, u: int, v: int) -> Optional[int]:
+        """
+        Find the lightest non-tree edge reconnecting the pieces of u and v.
+
+        Both pieces are explored in lockstep and the smaller one is scanned,
+        so the cost is bounded by the size of the smaller piece.
+
+        Args:
+            u: Node on one side of the removed tree edge
+            v: Node on the other side
+
+        Returns:
+            Edge ID of the lightest reconnecting edge, or None
+        """
+        side = self._smaller_side(u, v)
+        best_id = None
+        best_distance = float('inf')
+        for node in side:
+            for edge_id in self.nontree_adj[node]:
+                a, b, distance = self.edges[edge_id]
+                if (a in side) != (b in side) and distance < best_distance:
+                    best_id = edge_id
+                    best_distance = distance
+        return best_id
+
+    def _smaller_side(self, u: int, v: int) -> Set[int]:
+        """Explore the trees of u and v in lockstep; return the one finished first."""
+        searches = []
+        for root in (u, v):
+            searches.append(({root}, deque([root])))
+        while True:
+            for seen, queue in searches:
+                if not queue:
+                    return seen
+                node = queue.popleft()
+                for edge_id in self.tree_adj[node]:
+                    a, b, _ = self.edges[edge_id]
+                    neighbor = b if a == node else a
+                    if neighbor not in seen:
+                        seen.add(neighbor)
+                        queue.append(neighbor)
+
+
+def benchmark_updates(num_nodes: int = 100_000, edges_per_node: int = 3,
+                      num_updates: int = 5_000, seed: int = 42) -> Dict:
+    """
+    Time random insert / delete / reweight updates on a random road network.
+
+    The default 100,000 locations keep the pure-Python seeding step short;
+    a 1,000,000-location network works too but takes about a minute and a
+    few GB to seed. Deleting a tree road (or raising its distance) costs
+    O(smaller side) of the split, so those updates set the p99 / max latency.
+
+    Args:
+        num_nodes: Number of locations
+        edges_per_node: Average number of roads per location
+        num_updates: Number of updates to apply
+        seed: Random seed
+
+    Returns:
+        Dictionary with timing results
+    """
+    rng = random.Random(seed)
+    edges = []
+    # A random path keeps the network connected; the rest are random roads
+    order = list(range(num_nodes))
+    rng.shuffle(order)
+    for i in range(num_nodes - 1):
+        edges.append((i, order[i], order[i + 1], rng.uniform(1.0, 1000.0)))
+    for edge_id in range(num_nodes - 1, num_nodes * edges_per_node):
+        edges.append((edge_id, rng.randrange(num_nodes), rng.randrange(num_nodes),
+                      rng.uniform(1.0, 1000.0)))
+
+    start = time.perf_counter()
+    dynamic = DynamicMST.from_edges(edges)
+    seed_time = time.perf_counter() - start
+
+    live_ids = [edge[0] for edge in edges]
+    next_id = len(edges)
+    updates = []
+    for _ in range(num_updates):
+        choice = rng.random()
+        if choice < 0.4:
+            updates.append(("insert", next_id, rng.randrange(num_nodes),
+                            rng.randrange(num_nodes), rng.uniform(1.0, 1000.0)))
+            live_ids.append(next_id)
+            next_id += 1
+        elif choice < 0.7:
+            position = rng.randrange(len(live_ids))
+            live_ids[position], live_ids[-1] = live_ids[-1], live_ids[position]
+            updates.append(("delete", live_ids.pop()))
+        else:
+            updates.append(("update", rng.choice(live_ids), rng.uniform(1.0, 1000.0)))
+
+    start = time.perf_counter()
+    dynamic.apply(updates)
+    update_time = time.perf_counter() - start
+
+    return {
+        'num_nodes': num_nodes,
+        'num_edges': len(edges),
+        'seed_time_s': seed_time,
+        'num_updates': num_updates,
+        'update_time_s': update_time,
+        'updates_per_second': num_updates / update_time if update_time > 0 else float('inf'),
+        'total_distance': dynamic.total_distance,
+        'operation_latency_s': {operation: histogram.snapshot() for operation, histogram
+                                in dynamic.metrics.histograms.items()},
+    }
+
+
+def main():
+    """
+    Main function to demonstrate dynamic MST maintenance on Delhi City network.
+    """
+    from problem3_kruskal import load_delhi_city_data
+
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT - PROBLEM 3")
+    print("Urban Road Network Planning with Dynamic MST Maintenance")
+    print("=" * 80 + "\n")
+
+    kruskal = load_delhi_city_data()
+    dynamic = DynamicMST.from_kruskal(kruskal)
+    print(f"Seeded from Kruskal's MST: {len(dynamic.edge_node)} roads, "
+          f"total distance {dynamic.total_distance:.2f} units\n")
+
+    updates = [
+        ("insert", 11, 6, 7, 250.0),        # New road joins the two parts of the city
+        ("update", 8, 90.0),                # Road 5-6 re-surveyed shorter
+        ("delete", 4),                      # Road 1-4 closed
+        ("update", 11, 2000.0),             # New road turns out longer
+    ]
+    print(f"{'Update':<35} {'MST Roads':<12} {'Total Distance':<15}")
+    print("-" * 80)
+    for update in updates:
+        dynamic.apply([update])
+        print(f"{str(update):<35} {len(dynamic.edge_node):<12} {dynamic.total_distance:<15.2f}")
+    print("-" * 80)
+
+    print("\nBenchmark on a random network:")
+    result = benchmark_updates()
+    print(f"- {result['num_nodes']} nodes, {result['num_edges']} edges "
+          f"(seeded in {result['seed_time_s']:.2f} seconds)")
+    print("- Limits: 100,000 nodes by default (seeding 1,000,000 takes about a minute); "
+          "tree-road deletes and raises cost O(smaller side) of the split")
+    print(f"- {result['num_updates']} updates in {result['update_time_s']:.3f} seconds "
+          f"({result['updates_per_second']:.0f} updates/second)")
+    for name, latency in sorted(result['operation_latency_s'].items()):
+        operation = name[len("phase_"):-len("_seconds")]
+        print(f"- {operation:<6} p50 {latency['p50'] * 1e6:8.1f} us, "
+              f"p99 {latency['p99'] * 1e6:8.1f} us, max {latency['max'] * 1e6:8.1f} us")
+    print("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Columnar Edge Store for Kruskal's and Prim's Algorithms
+
+This module keeps the road network edge table as contiguous NumPy columns
+(edge_id, start_node, end_node, distance, x_coord, y_coord) instead of one
+Python tuple per edge, so that city-scale edge lists can be loaded in bulk
+and handed to the MST solvers without building per-edge objects.
+"""
+
+import os
+import warnings
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# Column order used for CSV files and 2-D .npy arrays
+COLUMNS = ("edge_id", "start_node", "end_node", "distance", "x_coord", "y_coord")
+
+
+class EdgeStore:
+    """
+    Columnar edge table with dense node indices and CSR adjacency.
+
+    Node IDs from the input are remapped to dense indices 0..n-1 (in sorted
+    order of the original IDs), which is what the array-backed solvers use.
+    """
+
+    def __init__(self, edge_id: np.ndarray, start_node: np.ndarray,
+                 end_node: np.ndarray, distance: np.ndarray,
+                 x_coord: Optional[np.ndarray] = None,
+                 y_coord: Optional[np.ndarray] = None):
+        """
+        Initialize the edge store from column arrays.
+
+        Args:
+            edge_id: Unique identifier for each edge
+            start_node: Starting node of each edge
+            end_node: Ending node of each edge
+            distance: Distance of each edge
+            x_coord: X coordinate of the start node of each edge (optional)
+            y_coord: Y coordinate of the start node of each edge (optional)
+        """
+        self.edge_id = np.ascontiguousarray(edge_id, dtype=np.int64)
+        self.start_node = np.ascontiguousarray(start_node, dtype=np.int64)
+        self.end_node = np.ascontiguousarray(end_node, dtype=np.int64)
+        self.distance = np.ascontiguousarray(distance, dtype=np.float64)
+
+        num_edges = len(self.edge_id)
+        if x_coord is None:
+            x_coord = np.full(num_edges, np.nan)
+        if y_coord is None:
+            y_coord = np.full(num_edges, np.nan)
+        self.x_coord = np.ascontiguousarray(x_coord, dtype=np.float64)
+        self.y_coord = np.ascontiguousarray(y_coord, dtype=np.float64)
+
+        for column in (self.start_node, self.end_node, self.distance,
+                       self.x_coord, self.y_coord):
+            if len(column) != num_edges:
+                raise ValueError("All edge columns must have the same length")
+
+        # Remap original node IDs to dense indices in one vectorized pass
+        self.node_ids, inverse = np.unique(
+            np.concatenate([self.start_node, self.end_node]), return_inverse=True)
+        index_dtype = np.int32 if len(self.node_ids) < 2 ** 31 else np.int64
+        inverse = inverse.astype(index_dtype, copy=False)
+        self.src_index = inverse[:num_edges]
+        self.dst_index = inverse[num_edges:]
+
+        self._csr: Optional[Tuple[np.ndarray, ...]] = None
+
+    # ------------------------------------------------------------------
+    # Loaders
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_rows(cls, rows: List[Tuple]) -> "EdgeStore":
+        """
+        Build an edge store from Table 5 style rows.
+
+        Args:
+            rows: Rows of (x_coord, y_coord, start_node, end_node, edge_id, distance)
+
+        Returns:
+            EdgeStore with the given edges
+        """
+        table = np.asarray(rows, dtype=np.float64).reshape(-1, 6)
+        return cls(table[:, 4], table[:, 2], table[:, 3], table[:, 5],
+                   table[:, 0], table[:, 1])
+
+    @classmethod
+    def from_table(cls, table: np.ndarray) -> "EdgeStore":
+        """
+        Build an edge store from a 2-D array or a structured array.
+
+        Args:
+            table: Either an (n, 6) array with columns in COLUMNS order, or a
+                structured array with fields named as in COLUMNS
+
+        Returns:
+            EdgeStore with the given edges
+        """
+        if table.dtype.names:
+            columns = [table[name] if name in table.dtype.names else None
+                       for name in COLUMNS]
+        else:
+            if table.ndim != 2 or table.shape[1] < 4:
+                raise ValueError("Edge table must have at least 4 columns "
+                                 "(edge_id, start_node, end_node, distance)")
+            columns = [table[:, i] if i < table.shape[1] else None
+                       for i in range(len(COLUMNS))]
+        return cls(*columns)
+
+    @classmethod
+    def from_csv(cls, path: str, delimiter: str = ",",
+                 chunk_rows: int = 1_000_000) -> "EdgeStore":
+        """
+        Load an edge table from a CSV file with a header row.
+
+        The header must name the columns as in COLUMNS (any order, extra
+        columns are ignored; x_coord/y_coord are optional).
+
+        Args:
+            path: Path to the CSV file
+            delimiter: Field delimiter
+            chunk_rows: Number of rows parsed per chunk
+
+        Returns:
+            EdgeStore with the loaded edges
+        """
+        chunks = list(iter_csv_chunks(path, delimiter=delimiter,
+                                      chunk_rows=chunk_rows))
+        if not chunks:
+            return cls(*[np.empty(0) for _ in COLUMNS])
+        table = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        return cls(*[table[:, i] for i in range(len(COLUMNS))])
+
+    @classmethod
+    def from_npy(cls, path: str, mmap: bool = True) -> "EdgeStore":
+        """
+        Load an edge table from a .npy file, memory-mapped by default.
+
+        Args:
+            path: Path to the .npy file (2-D or structured array)
+            mmap: Whether to memory-map the file instead of reading it
+
+        Returns:
+            EdgeStore with the loaded edges
+        """
+        table = np.load(path, mmap_mode="r" if mmap else None)
+        return cls.from_table(table)
+
+    @classmethod
+    def from_npz(cls, path: str) -> "EdgeStore":
+        """
+        Load an edge table from a .npz archive with one array per column.
+
+        Args:
+            path: Path to the .npz file
+
+        Returns:
+            EdgeStore with the loaded edges
+        """
+        with np.load(path) as archive:
+            columns = [archive[name] if name in archive.files else None
+                       for name in COLUMNS]
+        return cls(*columns)
+
+    @classmethod
+    def load(cls, path: str) -> "EdgeStore":
+        """
+        Load an edge table, choosing the loader from the file extension.
+
+        Args:
+            path: Path to a .csv, .npy or .npz file
+
+        Returns:
+            EdgeStore with the loaded edges
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".npy":
+            return cls.from_npy(path)
+        if extension == ".npz":
+            return cls.from_npz(path)
+        return cls.from_csv(path)
+
+    def save_npz(self, path: str):
+        """
+        Save the edge columns to a .npz archive.
+
+        Args:
+            path: Destination path
+        """
+        np.savez(path, **{name: getattr(self, name) for name in COLUMNS})
+
+    # ------------------------------------------------------------------
+    # Graph views
+    # ------------------------------------------------------------------
+
+    @property
+    def num_edges(self) -> int:
+        """Number of edges (rows) in the store."""
+        return len(self.edge_id)
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of distinct nodes in the store."""
+        return len(self.node_ids)
+
+    def sorted_order(self) -> np.ndarray:
+        """
+        Get edge positions sorted by ascending distance.
+
+        A stable sort is used so ties keep their input order, matching
+        `sorted(edges, key=distance)` in the tuple-based solvers.
+
+        Returns:
+            Array of edge positions
+        """
+        return np.argsort(self.distance, kind="stable")
+
+    def build_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build undirected CSR adjacency in one vectorized pass.
+
+        Returns:
+            Tuple containing:
+                - indptr: Offsets into the neighbor arrays (length n + 1)
+                - neighbors: Dense index of each neighbor
+                - weights: Distance of each adjacency entry
+                - edge_pos: Edge position (row in the store) of each entry
+        """
+        if self._csr is not None:
+            return self._csr
+
+        num_edges = self.num_edges
+        heads = np.concatenate([self.src_index, self.dst_index])
+        tails = np.concatenate([self.dst_index, self.src_index])
+        positions = np.arange(num_edges, dtype=np.int64)
+        positions = np.concatenate([positions, positions])
+
+        order = np.argsort(heads, kind="stable")
+        counts = np.bincount(heads, minlength=self.num_nodes)
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        edge_pos = positions[order]
+        self._csr = (indptr, tails[order], self.distance[edge_pos], edge_pos)
+        return self._csr
+
+    def node_coordinates(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get coordinates per dense node index.
+
+        As in `add_edge`, the coordinates of a node are taken from the first
+        edge that starts at it; nodes that never start an edge get NaN.
+
+        Returns:
+            Tuple of (x, y) arrays indexed by dense node index
+        """
+        x = np.full(self.num_nodes, np.nan)
+        y = np.full(self.num_nodes, np.nan)
+        nodes, first = np.unique(self.src_index, return_index=True)
+        x[nodes] = self.x_coord[first]
+        y[nodes] = self.y_coord[first]
+        return x, y
+
+    def mst_edge(self, position: int) -> Tuple[int, int, int, float]:
+        """
+        Get an edge in the (edge_id, start_node, end_node, distance) format.
+
+        Args:
+            position: Edge position (row) in the store
+
+        Returns:
+            Edge tuple using the original node IDs
+        """
+        return (int(self.edge_id[position]), int(self.start_node[position]),
+                int(self.end_node[position]), float(self.distance[position]))
+
+
+def iter_csv_chunks(path: str, delimiter: str = ",",
+                    chunk_rows: int = 1_000_000) -> Iterator[np.ndarray]:
+    """
+    Parse a headed edge CSV file into (rows, 6) float arrays chunk by chunk.
+
+    Columns of each chunk are in COLUMNS order; missing coordinate columns
+    are filled with NaN.
+
+    Args:
+        path: Path to the CSV file
+        delimiter: Field delimiter
+        chunk_rows: Maximum number of rows per chunk
+
+    Yields:
+        Array of shape (rows, 6)
+    """
+    with open(path, "r") as handle:
+        header = [name.strip() for name in handle.readline().split(delimiter)]
+        missing = [name for name in COLUMNS[:4] if name not in header]
+        if missing:
+            raise ValueError(f"CSV file {path} is missing columns: {missing}")
+        usecols = [header.index(name) for name in COLUMNS if name in header]
+        present = [i for i, name in enumerate(COLUMNS) if name in header]
+
+        while True:
+            with warnings.catch_warnings():
+                # loadtxt warns when the remaining input is empty
+                warnings.simplefilter("ignore", UserWarning)
+                block = np.loadtxt(handle, delimiter=delimiter, usecols=usecols,
+                                   max_rows=chunk_rows, ndmin=2, dtype=np.float64)
+            if block.shape[0] == 0:
+                break
+            chunk = np.full((block.shape[0], len(COLUMNS)), np.nan)
+            chunk[:, present] = block
+            yield chunk
+            if block.shape[0] < chunk_rows:
+                break
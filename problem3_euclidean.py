@@ -0,0 +1,253 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Euclidean Minimum Spanning Tree from Location Coordinates
+
+For greenfield planning only the coordinates of the locations are known.
+Instead of building the complete graph (n^2 edges), a sparse candidate edge
+set is generated from the coordinates and handed to the existing Kruskal
+machinery:
+
+    - "delaunay": edges of the Delaunay triangulation. The Euclidean MST is
+      always a subgraph of it, so the result is exact, in O(n log n).
+    - "knn": edges to the k nearest neighbours from a KD-tree. Faster to
+      build but approximate (the k-NN graph may miss an MST edge).
+
+scipy is only needed for this module and is imported on first use.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem3_edge_store import EdgeStore
+from problem3_kruskal import KruskalMST
+
+
+CANDIDATE_METHODS = ("delaunay", "knn")
+
+
+def _import_spatial():
+    try:
+        from scipy import spatial
+    except ImportError as error:
+        raise ImportError("Euclidean MST candidate generation requires scipy "
+                          "(pip install scipy)") from error
+    return spatial
+
+
+def candidate_edges(x: np.ndarray, y: np.ndarray, method: str = "delaunay",
+                    k: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate sparse candidate edges between locations.
+
+    Locations with identical coordinates are joined to one representative by
+    zero-length edges, and the geometric method runs on the distinct points.
+
+    Args:
+        x: X coordinate of each location
+        y: Y coordinate of each location
+        method: "delaunay" (exact) or "knn" (approximate)
+        k: Number of neighbours per location for "knn"
+
+    Returns:
+        Tuple of (src, dst) arrays of location indices, one pair per edge
+    """
+    if method not in CANDIDATE_METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {CANDIDATE_METHODS}")
+
+    points = np.column_stack([np.asarray(x, dtype=np.float64),
+                              np.asarray(y, dtype=np.float64)])
+    unique_points, first, inverse = np.unique(points, axis=0, return_index=True,
+                                              return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # Duplicates of a point connect to its first occurrence
+    duplicates = np.flatnonzero(first[inverse] != np.arange(len(points)))
+    dup_src = first[inverse[duplicates]]
+    dup_dst = duplicates
+
+    num_unique = len(unique_points)
+    if num_unique < 2:
+        src, dst = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    elif method == "knn":
+        src, dst = _knn_edges(unique_points, k)
+    else:
+        src, dst = _delaunay_edges(unique_points)
+
+    # Map distinct-point indices back to location indices
+    src = np.concatenate([first[src], dup_src])
+    dst = np.concatenate([first[dst], dup_dst])
+    return src, dst
+
+
+def _delaunay_edges(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Edges of the Delaunay triangulation of distinct points."""
+    spatial = _import_spatial()
+    try:
+        simplices = spatial.Delaunay(points).simplices
+    except spatial.QhullError:
+        # All points on one line (or fewer than 3): the MST is the chain of
+        # points in order along that line
+        order = np.lexsort((points[:, 1], points[:, 0]))
+        return order[:-1], order[1:]
+
+    pairs = np.concatenate([simplices[:, [0, 1]], simplices[:, [1, 2]],
+                            simplices[:, [0, 2]]])
+    pairs.sort(axis=1)
+    pairs = np.unique(pairs, axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _knn_edges(points: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Edges from every distinct point to its k nearest neighbours."""
+    spatial = _import_spatial()
+    k = min(k, len(points) - 1)
+    _, neighbors = spatial.cKDTree(points).query(points, k=k + 1)
+    src = np.repeat(np.arange(len(points)), k)
+    dst = neighbors[:, 1:].reshape(-1)
+    pairs = np.sort(np.column_stack([src, dst]), axis=1)
+    pairs = np.unique(pairs, axis=0)
+    return pairs[:, 0], pairs[:, 1]
+
+
+class EuclideanMST:
+    """
+    Euclidean Minimum Spanning Tree over location coordinates, solved with
+    Kruskal's algorithm on a sparse geometric candidate edge set.
+    """
+
+    def __init__(self, method: str = "delaunay", k: int = 8):
+        """
+        Initialize Euclidean MST solver.
+
+        Args:
+            method: Candidate edge method, "delaunay" (exact) or "knn"
+            k: Number of neighbours per location for "knn"
+        """
+        self.method = method
+        self.k = k
+        self.node_ids = np.empty(0, dtype=np.int64)
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.edge_store: Optional[EdgeStore] = None
+        # Seconds spent in each phase of the last find_mst call
+        self.phase_times: Dict[str, float] = {}
+        # Run and phase duration histograms across find_mst calls
+        self.metrics = MetricsRegistry(engine="euclidean")
+
+    def load_coordinates(self, x: np.ndarray, y: np.ndarray,
+                         node_ids: Optional[np.ndarray] = None):
+        """
+        Load location coordinates.
+
+        Args:
+            x: X coordinate of each location
+            y: Y coordinate of each location
+            node_ids: Node ID of each location (defaults to 0..n-1)
+        """
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        if len(self.x) != len(self.y):
+            raise ValueError("x and y must have the same length")
+        if node_ids is None:
+            node_ids = np.arange(len(self.x))
+        self.node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.edge_store = None
+
+    def load_node_coordinates(self, node_coordinates: Dict[int, Tuple[float, float]]):
+        """
+        Load coordinates collected by KruskalMST / PrimMST.add_edge.
+
+        Args:
+            node_coordinates: Mapping of node ID -> (x, y)
+        """
+        node_ids = sorted(node_coordinates)
+        coordinates = np.array([node_coordinates[node] for node in node_ids],
+                               dtype=np.float64).reshape(-1, 2)
+        self.load_coordinates(coordinates[:, 0], coordinates[:, 1], node_ids)
+
+    def build_candidates(self) -> EdgeStore:
+        """
+        Generate the candidate edge set as an EdgeStore.
+
+        Edge IDs are the positions of the candidate edges (0..m-1), and
+        distances are Euclidean lengths.
+
+        Returns:
+            EdgeStore with the candidate edges
+        """
+        src, dst = candidate_edges(self.x, self.y, self.method, self.k)
+        distance = np.hypot(self.x[src] - self.x[dst], self.y[src] - self.y[dst])
+        self.edge_store = EdgeStore(np.arange(len(src)), self.node_ids[src],
+                                    self.node_ids[dst], distance,
+                                    self.x[src], self.y[src])
+        return self.edge_store
+
+    def find_mst(self) -> Tuple[List[Tuple], float, float]:
+        """
+        Find the Euclidean Minimum Spanning Tree.
+
+        Returns:
+            Tuple containing:
+                - List of edges in MST (edge_id, start_node, end_node, distance)
+                - Total distance of MST
+                - Execution time in seconds (candidate generation included)
+        """
+        start_time = time.perf_counter()
+        candidates = self.build_candidates()
+        candidate_time = time.perf_counter()
+
+        kruskal = KruskalMST()
+        kruskal.load_edge_store(candidates)
+        mst_edges, total_distance, _ = kruskal.find_mst()
+
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        self.phase_times = {"candidates": candidate_time - start_time,
+                            "mst": end_time - candidate_time}
+        self.metrics.record_run(execution_time, self.phase_times)
+
+        return mst_edges, total_distance, execution_time
+
+
+def main():
+    """
+    Main function to demonstrate the Euclidean MST on Delhi City locations
+    and on a large set of random locations.
+    """
+    from problem3_kruskal import load_delhi_city_data
+
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT - PROBLEM 3")
+    print("Greenfield Road Network Planning using the Euclidean MST")
+    print("=" * 80 + "\n")
+
+    kruskal = load_delhi_city_data()
+    euclidean = EuclideanMST()
+    euclidean.load_node_coordinates(kruskal.node_coordinates)
+    mst_edges, total_distance, execution_time = euclidean.find_mst()
+
+    print(f"{'Start':<8} {'End':<8} {'Distance':<15}")
+    print("-" * 80)
+    for _, start_node, end_node, distance in mst_edges:
+        print(f"{start_node:<8} {end_node:<8} {distance:<15.2f}")
+    print("-" * 80)
+    print(f"Total Network Distance: {total_distance:.2f} units")
+    print(f"Execution Time: {execution_time:.6f} seconds\n")
+
+    rng = np.random.default_rng(0)
+    for num_points in (10_000, 100_000, 1_000_000):
+        euclidean = EuclideanMST()
+        euclidean.load_coordinates(rng.uniform(0, 10_000, num_points),
+                                   rng.uniform(0, 10_000, num_points))
+        mst_edges, total_distance, execution_time = euclidean.find_mst()
+        print(f"{num_points:>9} random locations: {len(mst_edges)} roads, "
+              f"{euclidean.edge_store.num_edges} candidate edges, "
+              f"{execution_time:.2f} seconds")
+    print("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Out-of-Core Streaming Kruskal's Algorithm
+
+For edge lists larger than RAM. The edge file is read in chunks; each chunk
+is sorted by distance and spilled to a temporary run file (external merge
+sort). The sorted runs are then merged block by block and streamed through
+an ArrayUnionFind, and accepted MST edges are appended to an output file as
+they are found. Peak memory is bounded by the node count plus the sort
+buffer (and one merge block per run), not by the edge count.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem3_edge_store import COLUMNS, iter_csv_chunks
+from problem3_kruskal import ArrayUnionFind
+
+
+# Layout of a sorted run file
+RUN_DTYPE = np.dtype([("distance", "<f8"), ("edge_id", "<i8"),
+                      ("start_node", "<i8"), ("end_node", "<i8")])
+
+
+def iter_edge_chunks(path: str, chunk_rows: int) -> Iterator[np.ndarray]:
+    """
+    Read an edge file chunk by chunk as RUN_DTYPE records.
+
+    Args:
+        path: Path to a headed .csv file or a .npy file (read memory-mapped)
+        chunk_rows: Maximum number of edges per chunk
+
+    Yields:
+        Structured array of edges
+    """
+    if os.path.splitext(path)[1].lower() == ".npy":
+        table = np.load(path, mmap_mode="r")
+        for begin in range(0, len(table), chunk_rows):
+            block = table[begin:begin + chunk_rows]
+            if table.dtype.names:
+                columns = [block[name] for name in COLUMNS[:4]]
+            else:
+                columns = [block[:, i] for i in range(4)]
+            yield _to_records(*columns)
+    else:
+        for chunk in iter_csv_chunks(path, chunk_rows=chunk_rows):
+            yield _to_records(chunk[:, 0], chunk[:, 1], chunk[:, 2], chunk[:, 3])
+
+
+def _to_records(edge_id, start_node, end_node, distance) -> np.ndarray:
+    records = np.empty(len(edge_id), dtype=RUN_DTYPE)
+    records["edge_id"] = edge_id
+    records["start_node"] = start_node
+    records["end_node"] = end_node
+    records["distance"] = distance
+    return records
+
+
+class ExternalKruskalMST:
+    """
+    Streaming Kruskal's Algorithm with an external merge sort.
+    """
+
+    def __init__(self, sort_buffer_edges: int = 4_000_000,
+                 merge_block_edges: int = 65_536, tmp_dir: str = None):
+        """
+        Initialize the streaming Kruskal solver.
+
+        Args:
+            sort_buffer_edges: Edges sorted in memory per run (32 bytes each)
+            merge_block_edges: Edges read from each run per merge step
+            tmp_dir: Directory for run files (defaults to the system temp dir)
+        """
+        self.sort_buffer_edges = sort_buffer_edges
+        self.merge_block_edges = merge_block_edges
+        self.tmp_dir = tmp_dir
+        self.num_runs = 0
+        self.num_nodes = 0
+        self.edges_scanned = 0
+        # Seconds spent in each phase of the last find_mst call
+        self.phase_times: Dict[str, float] = {}
+        # Run and phase duration histograms across find_mst calls
+        self.metrics = MetricsRegistry(engine="external_kruskal")
+
+    def find_mst(self, edge_path: str, output_path: str) -> Tuple[int, float, float]:
+        """
+        Find the Minimum Spanning Tree of an edge file, writing it to a file.
+
+        The output is a CSV file with columns edge_id,start_node,end_node,
+        distance in ascending distance order (ties keep input order, as in
+        KruskalMST.find_mst).
+
+        Args:
+            edge_path: Path to the edge file (.csv with header, or .npy)
+            output_path: Path of the output CSV file
+
+        Returns:
+            Tuple containing:
+                - Number of edges in MST
+                - Total distance of MST
+                - Execution time in seconds
+        """
+        start_time = time.perf_counter()
+
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as run_dir:
+            run_paths, node_ids = self._spill_runs(edge_path, run_dir)
+            self.num_runs = len(run_paths)
+            self.num_nodes = len(node_ids)
+            sort_time = time.perf_counter()
+            output_time = 0.0
+
+            uf = ArrayUnionFind(len(node_ids))
+            num_accepted = 0
+            total_distance = 0.0
+            self.edges_scanned = 0
+
+            with open(output_path, "w") as output:
+                output.write("edge_id,start_node,end_node,distance\n")
+                for block in self._merge_runs(run_paths):
+                    self.edges_scanned += len(block)
+                    accepted = uf.union_many(np.searchsorted(node_ids, block["start_node"]),
+                                             np.searchsorted(node_ids, block["end_node"]))
+                    accepted_edges = block[accepted]
+                    write_start = time.perf_counter()
+                    for distance, edge_id, start_node, end_node in accepted_edges.tolist():
+                        output.write(f"{edge_id},{start_node},{end_node},{distance!r}\n")
+                    output_time += time.perf_counter() - write_start
+                    num_accepted += len(accepted_edges)
+                    total_distance += float(accepted_edges["distance"].sum())
+
+                    # Stop when we have n-1 edges (complete MST)
+                    if num_accepted >= len(node_ids) - 1:
+                        break
+
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        # The merge is interleaved with the union-find scan and counted in it
+        self.phase_times = {"sort": sort_time - start_time,
+                            "union_find": end_time - sort_time - output_time,
+                            "output": output_time}
+        self.metrics.record_run(execution_time, self.phase_times)
+
+        return num_accepted, total_distance, execution_time
+
+    def _spill_runs(self, edge_path: str, run_dir: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Sort the edge file chunk by chunk into run files.
+
+        Args:
+            edge_path: Path to the edge file
+            run_dir: Directory for the run files
+
+        Returns:
+            Tuple of (run file paths, sorted array of distinct node IDs)
+        """
+        run_paths = []
+        node_ids = np.empty(0, dtype=np.int64)
+
+        for chunk in iter_edge_chunks(edge_path, self.sort_buffer_edges):
+            chunk = chunk[np.argsort(chunk["distance"], kind="stable")]
+            run_path = os.path.join(run_dir, f"run_{len(run_paths):05d}.npy")
+            np.save(run_path, chunk)
+            run_paths.append(run_path)
+            node_ids = np.union1d(node_ids, np.concatenate([chunk["start_node"],
+                                                            chunk["end_node"]]))
+
+        return run_paths, node_ids
+
+    def _merge_runs(self, run_paths: List[str]) -> Iterator[np.ndarray]:
+        """
+        Merge sorted run files into a stream of sorted blocks.
+
+        Every run keeps one buffered block. All buffered edges whose key
+        (distance, run, position) is not larger than the smallest "last
+        buffered key" over the runs are safe to emit, since every unread
+        edge has a larger key. Runs whose buffer is used up are refilled.
+
+        Args:
+            run_paths: Paths of the sorted run files
+
+        Yields:
+            Structured arrays of edges in ascending (distance, input order)
+        """
+        runs = [np.load(path, mmap_mode="r") for path in run_paths]
+        offsets = [0] * len(runs)
+        buffers = [None] * len(runs)
+
+        while True:
+            for run_index, run in enumerate(runs):
+                if buffers[run_index] is None and offsets[run_index] < len(run):
+                    begin = offsets[run_index]
+                    end = min(begin + self.merge_block_edges, len(run))
+                    buffers[run_index] = (np.array(run[begin:end]),
+                                          np.arange(begin, end, dtype=np.int64))
+                    offsets[run_index] = end
+
+            active = [i for i, buffer in enumerate(buffers) if buffer is not None]
+            if not active:
+                return
+
+            # Smallest last-buffered key over runs that still have unread edges
+            limit = None
+            for run_index in active:
+                records, positions = buffers[run_index]
+                key = (records["distance"][-1], run_index, positions[-1])
+                if offsets[run_index] < len(runs[run_index]) and (limit is None or key < limit):
+                    limit = key
+
+            blocks, run_ids, positions_out = [], [], []
+            for run_index in active:
+                records, positions = buffers[run_index]
+                if limit is None:
+                    count = len(records)
+                else:
+                    distances = records["distance"]
+                    count = int(np.searchsorted(distances, limit[0], side="left"))
+                    if run_index <= limit[1]:
+                        # Equal distances from runs up to the limit run are safe too
+                        equal_end = int(np.searchsorted(distances, limit[0], side="right"))
+                        if run_index < limit[1]:
+                            count = equal_end
+                        else:
+                            count = int(np.searchsorted(positions[:equal_end], limit[2],
+                                                        side="right"))
+                blocks.append(records[:count])
+                run_ids.append(np.full(count, run_index, dtype=np.int64))
+                positions_out.append(positions[:count])
+                buffers[run_index] = ((records[count:], positions[count:])
+                                      if count < len(records) else None)
+
+            block = np.concatenate(blocks)
+            order = np.lexsort((np.concatenate(positions_out), np.concatenate(run_ids),
+                                block["distance"]))
+            yield block[order]
+
+
+def main():
+    """
+    Main function: run streaming Kruskal's algorithm on an edge file, or on
+    the Delhi City network with a tiny sort buffer when no file is given.
+    """
+    parser = argparse.ArgumentParser(description="Out-of-core streaming Kruskal's algorithm")
+    parser.add_argument("edge_path", nargs="?", help="Edge file (.csv with header, or .npy)")
+    parser.add_argument("output_path", nargs="?", default="mst_edges.csv",
+                        help="Output CSV file for the MST edges")
+    parser.add_argument("--sort-buffer", type=int, default=4_000_000,
+                        help="Edges sorted in memory per run")
+    parser.add_argument("--merge-block", type=int, default=65_536,
+                        help="Edges read from each run per merge step")
+    parser.add_argument("--tmp-dir", default=None, help="Directory for run files")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT - PROBLEM 3")
+    print("Urban Road Network Planning using Streaming Kruskal's Algorithm")
+    print("=" * 80 + "\n")
+
+    with tempfile.TemporaryDirectory() as demo_dir:
+        edge_path, output_path = args.edge_path, args.output_path
+        if edge_path is None:
+            from problem3_kruskal import load_delhi_city_data
+
+            kruskal = load_delhi_city_data()
+            edge_path = os.path.join(demo_dir, "delhi_edges.csv")
+            output_path = os.path.join(demo_dir, "delhi_mst.csv")
+            with open(edge_path, "w") as handle:
+                handle.write("edge_id,start_node,end_node,distance\n")
+                for edge_id, start_node, end_node, distance in kruskal.edges:
+                    handle.write(f"{edge_id},{start_node},{end_node},{distance!r}\n")
+            args.sort_buffer, args.merge_block = 4, 2
+
+        solver = ExternalKruskalMST(sort_buffer_edges=args.sort_buffer,
+                                    merge_block_edges=args.merge_block,
+                                    tmp_dir=args.tmp_dir)
+        num_edges, total_distance, execution_time = solver.find_mst(edge_path, output_path)
+
+        print(f"Sorted runs spilled: {solver.num_runs}")
+        print(f"Edges scanned in merge: {solver.edges_scanned}")
+        print(f"Total Number of Nodes: {solver.num_nodes}")
+        print(f"Total Number of Roads (Edges in MST): {num_edges}")
+        print(f"Total Network Distance: {total_distance:.2f} units")
+        print(f"Execution Time: {execution_time:.6f} seconds")
+        if args.edge_path is None:
+            print("\nMST edges written:")
+            with open(output_path) as handle:
+                print(handle.read())
+        else:
+            print(f"MST edges written to {output_path}")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
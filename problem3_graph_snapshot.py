@@ -0,0 +1,254 @@
+"""
+WOA7001 Group Project - Problem 3: Urban Road Network Planning
+Canonical Graph Snapshot shared by the MST Solvers
+
+Road tables list every road once per direction and may contain parallel
+duplicates (the Delhi data has 20 rows for 6 distinct roads). A snapshot is
+the canonical form of such a table, built once:
+
+    - undirected: each node pair appears once, self-loops are dropped
+    - of parallel edges only the shortest is kept (ties: first row)
+    - node IDs are remapped to dense indices 0..n-1
+    - rows are pre-sorted by ascending distance (ties keep input order)
+    - the CSR adjacency is prebuilt
+
+Every solver that accepts an EdgeStore accepts a snapshot, and gets the
+same MST as on the raw table without re-sorting. Snapshots are cached on
+disk as .npz files named after the SHA-256 hash of the input content, so a
+repeated run skips parsing and preprocessing entirely.
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from typing import Optional
+
+import numpy as np
+
+from problem3_edge_store import COLUMNS, EdgeStore
+
+
+# Bump when the canonical form or file layout changes, to invalidate caches
+SNAPSHOT_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshot_cache")
+
+_INDEX_ARRAYS = ("node_ids", "src_index", "dst_index")
+_CSR_ARRAYS = ("indptr", "neighbors", "weights", "edge_pos")
+
+
+class GraphSnapshot(EdgeStore):
+    """
+    Immutable canonical edge table with pre-sorted rows and CSR adjacency.
+
+    All arrays are read-only. Edge IDs and the orientation of each kept row
+    are those of the input, so MST edge tuples match the raw-table solvers.
+    """
+
+    def __init__(self, edge_store: EdgeStore, content_hash: str = ""):
+        """
+        Canonicalize an edge store.
+
+        Args:
+            edge_store: Raw edge table
+            content_hash: Hash of the input this snapshot was built from
+        """
+        low = np.minimum(edge_store.src_index, edge_store.dst_index)
+        high = np.maximum(edge_store.src_index, edge_store.dst_index)
+        distance = edge_store.distance
+
+        # Group rows by node pair; within a pair the shortest, earliest comes first
+        rows = np.flatnonzero(low != high)
+        rows = rows[np.lexsort((rows, distance[rows], high[rows], low[rows]))]
+        pairs = low[rows].astype(np.int64) * edge_store.num_nodes + high[rows]
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = pairs[1:] != pairs[:-1]
+        rows = rows[first]
+
+        # Ascending distance, ties in input order (as a stable sort would)
+        rows = rows[np.lexsort((rows, distance[rows]))]
+
+        arrays = {name: getattr(edge_store, name)[rows] for name in COLUMNS}
+        arrays["node_ids"] = edge_store.node_ids
+        arrays["src_index"] = edge_store.src_index[rows]
+        arrays["dst_index"] = edge_store.dst_index[rows]
+        self._set_arrays(arrays, content_hash, edge_store.num_edges)
+        self._csr = None
+        self._csr = self._freeze(EdgeStore.build_csr(self))
+
+    def _set_arrays(self, arrays, content_hash: str, num_input_edges: int):
+        for name, array in arrays.items():
+            setattr(self, name, np.ascontiguousarray(array))
+        self._freeze([getattr(self, name) for name in COLUMNS + _INDEX_ARRAYS])
+        self.content_hash = content_hash
+        self.num_input_edges = num_input_edges
+
+    @staticmethod
+    def _freeze(arrays):
+        for array in arrays:
+            array.flags.writeable = False
+        return tuple(arrays)
+
+    # ------------------------------------------------------------------
+    # Construction with the on-disk cache
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edge_store(cls, edge_store: EdgeStore,
+                        cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> "GraphSnapshot":
+        """
+        Get the snapshot of an in-memory edge table, using the cache.
+
+        Args:
+            edge_store: Raw edge table
+            cache_dir: Snapshot cache directory (None disables caching)
+
+        Returns:
+            GraphSnapshot of the table
+        """
+        digest = hashlib.sha256(f"snapshot-v{SNAPSHOT_VERSION}:columns".encode())
+        for name in COLUMNS:
+            digest.update(getattr(edge_store, name))
+        return cls._cached(digest.hexdigest(), cache_dir, lambda: edge_store)
+
+    @classmethod
+    def from_file(cls, path: str,
+                  cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> "GraphSnapshot":
+        """
+        Get the snapshot of an edge file, using the cache.
+
+        The file is hashed as raw bytes, so on a cache hit it is never parsed.
+
+        Args:
+            path: Path to a .csv, .npy or .npz edge file
+            cache_dir: Snapshot cache directory (None disables caching)
+
+        Returns:
+            GraphSnapshot of the file
+        """
+        digest = hashlib.sha256(f"snapshot-v{SNAPSHOT_VERSION}:file".encode())
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        return cls._cached(digest.hexdigest(), cache_dir, lambda: EdgeStore.load(path))
+
+    @classmethod
+    def _cached(cls, content_hash: str, cache_dir: Optional[str], load_store) -> "GraphSnapshot":
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(cache_dir, f"{content_hash}.npz")
+            if os.path.exists(cache_path):
+                return cls.read(cache_path)
+
+        snapshot = cls(load_store(), content_hash)
+        if cache_path is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            snapshot.save(cache_path)
+        return snapshot
+
+    def save(self, path: str):
+        """
+        Write the snapshot (CSR included) to a .npz file.
+
+        The file is written next to its destination and renamed into place,
+        so concurrent readers never see a partial snapshot.
+
+        Args:
+            path: Destination .npz path
+        """
+        arrays = {name: getattr(self, name) for name in COLUMNS + _INDEX_ARRAYS}
+        arrays.update(zip(_CSR_ARRAYS, self._csr))
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile(dir=directory, suffix=".npz", delete=False) as handle:
+            np.savez(handle, version=SNAPSHOT_VERSION, content_hash=self.content_hash,
+                     num_input_edges=self.num_input_edges, **arrays)
+        os.replace(handle.name, path)
+
+    @classmethod
+    def read(cls, path: str) -> "GraphSnapshot":
+        """
+        Read a snapshot written by save, without re-canonicalizing it.
+
+        Args:
+            path: Path of the .npz snapshot file
+
+        Returns:
+            GraphSnapshot
+        """
+        with np.load(path) as archive:
+            if int(archive["version"]) != SNAPSHOT_VERSION:
+                raise ValueError(f"Snapshot {path} has version {int(archive['version'])}, "
+                                 f"expected {SNAPSHOT_VERSION}")
+            snapshot = cls.__new__(cls)
+            snapshot._set_arrays({name: archive[name] for name in COLUMNS + _INDEX_ARRAYS},
+                                 str(archive["content_hash"]), int(archive["num_input_edges"]))
+            snapshot._csr = cls._freeze([archive[name] for name in _CSR_ARRAYS])
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Graph views
+    # ------------------------------------------------------------------
+
+    def sorted_order(self) -> np.ndarray:
+        """
+        Get edge positions sorted by ascending distance.
+
+        Rows are stored pre-sorted, so this is the identity order.
+
+        Returns:
+            Array of edge positions
+        """
+        return np.arange(self.num_edges)
+
+
+def load_delhi_city_snapshot(cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> GraphSnapshot:
+    """
+    Build the snapshot of the Delhi City network data from Table 5.
+
+    Args:
+        cache_dir: Snapshot cache directory (None disables caching)
+
+    Returns:
+        GraphSnapshot of the Delhi City network
+    """
+    from problem3_kruskal import load_delhi_city_data
+
+    kruskal = load_delhi_city_data()
+    return GraphSnapshot.from_edge_store(EdgeStore(*zip(*kruskal.edges)), cache_dir)
+
+
+def main():
+    """
+    Main function: build (or fetch from the cache) the snapshot of an edge
+    file, or of the Delhi City network when no file is given.
+    """
+    parser = argparse.ArgumentParser(description="Build a canonical graph snapshot")
+    parser.add_argument("edge_path", nargs="?", help="Edge file (.csv, .npy or .npz)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="Snapshot cache directory")
+    args = parser.parse_args()
+
+    print("\n" + "=" * 80)
+    print("WOA7001 GROUP PROJECT - PROBLEM 3")
+    print("Canonical Graph Snapshot")
+    print("=" * 80 + "\n")
+
+    for attempt in ("First load", "Second load"):
+        start_time = time.perf_counter()
+        if args.edge_path is None:
+            snapshot = load_delhi_city_snapshot(args.cache_dir)
+        else:
+            snapshot = GraphSnapshot.from_file(args.edge_path, args.cache_dir)
+        print(f"{attempt}: {time.perf_counter() - start_time:.6f} seconds")
+
+    print(f"\nContent hash: {snapshot.content_hash}")
+    print(f"Input rows: {snapshot.num_input_edges}")
+    print(f"Canonical edges: {snapshot.num_edges}")
+    print(f"Nodes: {snapshot.num_nodes}")
+    print(f"Cache file: {os.path.join(args.cache_dir, snapshot.content_hash + '.npz')}")
+    print("=" * 80 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,12 @@ connecting locations in Delhi City by minimizing the total distance.
 """
 
 import time
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
+
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem3_edge_store import EdgeStore
 
 
 class UnionFind:
@@ -36,9 +41,14 @@ class UnionFind:
         Returns:
             Root of the set containing x
         """
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])  # Path compression
-        return self.parent[x]
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        
+        # Path compression (iterative, so long chains cannot hit the recursion limit)
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
     
     def union(self, x: int, y: int) -> bool:
         """
@@ -69,6 +79,128 @@ class UnionFind:
         return True
 
 
+class ArrayUnionFind:
+    """
+    Array-backed Union-Find for large graphs.
+    
+    Parent and rank are stored in compact typed arrays (int32/uint8), so
+    memory is proportional to the node count, and find never recurses.
+    union_many processes a whole batch of edges per call.
+    """
+    
+    def __init__(self, n: int):
+        """
+        Initialize Union-Find structure.
+        
+        Args:
+            n: Number of nodes
+        """
+        dtype = np.int32 if n < 2 ** 31 else np.int64
+        self.parent = np.arange(n, dtype=dtype)
+        self.rank = np.zeros(n, dtype=np.uint8)
+        self.num_components = n
+    
+    def find(self, x: int) -> int:
+        """
+        Find the root of the set containing x with iterative path compression.
+        
+        Args:
+            x: Node to find root for
+            
+        Returns:
+            Root of the set containing x
+        """
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = int(parent[root])
+        
+        while x != root:
+            parent[x], x = root, int(parent[x])
+        return root
+    
+    def union(self, x: int, y: int) -> bool:
+        """
+        Union two sets containing x and y using union by rank.
+        
+        Args:
+            x: First node
+            y: Second node
+            
+        Returns:
+            True if union was performed, False if already in same set
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        
+        if root_x == root_y:
+            return False
+        
+        rank = self.rank
+        if rank[root_x] < rank[root_y]:
+            self.parent[root_x] = root_y
+        elif rank[root_x] > rank[root_y]:
+            self.parent[root_y] = root_x
+        else:
+            self.parent[root_y] = root_x
+            rank[root_x] += 1
+        
+        self.num_components -= 1
+        return True
+    
+    def find_many(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        Find the roots of many nodes at once by vectorized pointer jumping.
+        
+        The queried nodes are compressed to point directly at their roots.
+        
+        Args:
+            nodes: Array of nodes to find roots for
+            
+        Returns:
+            Array of roots, one per queried node
+        """
+        roots = self.parent[nodes]
+        while True:
+            next_roots = self.parent[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+        self.parent[nodes] = roots
+        return roots
+    
+    def union_many(self, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """
+        Union a batch of edges, in order, as if union were called per edge.
+        
+        Edges whose endpoints are already connected before the batch are
+        rejected in one vectorized step; only the remaining candidates are
+        unioned one at a time, stopping as soon as everything is connected.
+        
+        Args:
+            src: Array of first endpoints
+            dst: Array of second endpoints
+            
+        Returns:
+            Boolean mask of the edges that were accepted (did not form a cycle)
+        """
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        accepted = np.zeros(len(src), dtype=bool)
+        
+        root_src = self.find_many(src)
+        root_dst = self.find_many(dst)
+        candidates = np.flatnonzero(root_src != root_dst)
+        
+        for i, x, y in zip(candidates.tolist(), root_src[candidates].tolist(),
+                           root_dst[candidates].tolist()):
+            accepted[i] = self.union(x, y)
+            if self.num_components == 1:
+                break
+        
+        return accepted
+
+
 class KruskalMST:
     """
     Implementation of Kruskal's Algorithm for finding Minimum Spanning Tree.
@@ -79,6 +211,44 @@ class KruskalMST:
         self.edges: List[Tuple[int, int, int, float]] = []
         self.nodes: set = set()
         self.node_coordinates: Dict[int, Tuple[float, float]] = {}
+        self.edge_store: Optional[EdgeStore] = None
+        # Seconds spent in each phase of the last find_mst call
+        self.phase_times: Dict[str, float] = {}
+        # Run and phase duration histograms across find_mst calls
+        self.metrics = MetricsRegistry(engine="kruskal")
+    
+    def load_edge_store(self, edge_store: EdgeStore):
+        """
+        Use a columnar edge store instead of per-edge tuples.
+        
+        Once loaded, find_mst runs directly on the store's arrays.
+        
+        Args:
+            edge_store: EdgeStore holding the graph edges
+        """
+        self.edge_store = edge_store
+    
+    def get_total_nodes(self) -> int:
+        """
+        Get the total number of nodes in the graph.
+        
+        Returns:
+            Number of nodes
+        """
+        if self.edge_store is not None:
+            return self.edge_store.num_nodes
+        return len(self.nodes)
+    
+    def get_total_edges(self) -> int:
+        """
+        Get the total number of edges (rows) in the graph.
+        
+        Returns:
+            Number of edges
+        """
+        if self.edge_store is not None:
+            return self.edge_store.num_edges
+        return len(self.edges)
     
     def add_edge(self, edge_id: int, start_node: int, end_node: int, 
                  distance: float, x_coord: float, y_coord: float):
@@ -101,17 +271,23 @@ class KruskalMST:
         if start_node not in self.node_coordinates:
             self.node_coordinates[start_node] = (x_coord, y_coord)
     
-    def find_mst(self) -> Tuple[List[Tuple], float, float]:
+    def find_mst(self, chunk_size: int = 65536) -> Tuple[List[Tuple], float, float]:
         """
         Find the Minimum Spanning Tree using Kruskal's algorithm.
         
+        Args:
+            chunk_size: Sorted edges per batch when running on an edge store
+            
         Returns:
             Tuple containing:
                 - List of edges in MST (edge_id, start_node, end_node, distance)
                 - Total distance of MST
                 - Execution time in seconds
         """
-        start_time = time.time()
+        if self.edge_store is not None:
+            return self._find_mst_arrays(chunk_size)
+        
+        start_time = time.perf_counter()
         
         # Sort edges by distance (ascending order)
         sorted_edges = sorted(self.edges, key=lambda x: x[3])
@@ -119,6 +295,7 @@ class KruskalMST:
         # Create node mapping (node_id -> index)
         node_list = sorted(list(self.nodes))
         node_to_index = {node: idx for idx, node in enumerate(node_list)}
+        sort_time = time.perf_counter()
         
         # Initialize Union-Find structure
         uf = UnionFind(len(node_list))
@@ -140,7 +317,64 @@ class KruskalMST:
                 if len(mst_edges) == len(node_list) - 1:
                     break
         
-        execution_time = time.time() - start_time
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        self.phase_times = {"sort": sort_time - start_time,
+                            "union_find": end_time - sort_time,
+                            "output": 0.0}
+        self.metrics.record_run(execution_time, self.phase_times)
+        
+        return mst_edges, total_distance, execution_time
+    
+    def _find_mst_arrays(self, chunk_size: int) -> Tuple[List[Tuple], float, float]:
+        """
+        Kruskal's algorithm over the columns of the loaded edge store.
+        
+        Sorted edges are fed to an ArrayUnionFind in chunks, so no per-edge
+        Python objects are created for the whole edge list.
+        
+        Args:
+            chunk_size: Number of sorted edges processed per union_many call
+            
+        Returns:
+            Same tuple as find_mst
+        """
+        start_time = time.perf_counter()
+        store = self.edge_store
+        num_nodes = store.num_nodes
+        
+        # Vectorized sort of edge positions by distance
+        order = store.sorted_order()
+        sort_time = time.perf_counter()
+        
+        uf = ArrayUnionFind(num_nodes)
+        accepted_chunks = []
+        num_accepted = 0
+        
+        for begin in range(0, len(order), chunk_size):
+            positions = order[begin:begin + chunk_size]
+            accepted = uf.union_many(store.src_index[positions],
+                                     store.dst_index[positions])
+            accepted_chunks.append(positions[accepted])
+            num_accepted += int(accepted.sum())
+            
+            # Stop when we have n-1 edges (complete MST)
+            if num_accepted >= num_nodes - 1:
+                break
+        
+        union_find_time = time.perf_counter()
+        
+        accepted_positions = (np.concatenate(accepted_chunks) if accepted_chunks
+                              else np.empty(0, dtype=np.int64))
+        mst_edges = [store.mst_edge(position) for position in accepted_positions.tolist()]
+        total_distance = sum(edge[3] for edge in mst_edges)
+        
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        self.phase_times = {"sort": sort_time - start_time,
+                            "union_find": union_find_time - sort_time,
+                            "output": end_time - union_find_time}
+        self.metrics.record_run(execution_time, self.phase_times)
         
         return mst_edges, total_distance, execution_time
     
@@ -165,7 +399,7 @@ class KruskalMST:
             print(f"{edge_id:<10} {start_node:<8} {end_node:<8} {distance:<15.2f}")
         
         print("-" * 80)
-        print(f"\nTotal Number of Nodes: {len(self.nodes)}")
+        print(f"\nTotal Number of Nodes: {self.get_total_nodes()}")
         print(f"Total Number of Roads (Edges in MST): {len(mst_edges)}")
         print(f"Total Network Distance: {total_distance:.2f} units")
         print(f"Execution Time: {execution_time:.6f} seconds")
@@ -211,6 +445,21 @@ def load_delhi_city_data() -> KruskalMST:
     return kruskal
 
 
+def load_edge_file(path: str) -> KruskalMST:
+    """
+    Bulk-load a road network edge table from a .csv, .npy or .npz file.
+    
+    Args:
+        path: Path to the edge table
+        
+    Returns:
+        KruskalMST object backed by a columnar edge store
+    """
+    kruskal = KruskalMST()
+    kruskal.load_edge_store(EdgeStore.load(path))
+    return kruskal
+
+
 def main():
     """
     Main function to demonstrate Kruskal's algorithm on Delhi City network.
@@ -8,9 +8,155 @@ connecting locations in Delhi City by minimizing the total distance.
 
 import time
 import heapq
-from typing import List, Tuple, Dict, Set
+from typing import List, Tuple, Dict, Set, Optional
 from collections import defaultdict
 
+import numpy as np
+
+from instrumentation import MetricsRegistry
+from problem3_edge_store import EdgeStore
+
+
+PRIM_MODES = ("auto", "lazy", "indexed", "dense")
+
+# "auto" switches to the O(V^2) dense mode when the graph has at least this
+# fraction of all possible edges (see run_prim_crossover_benchmark in
+# problem3_comparison.py), as long as a V x V matrix stays reasonably small.
+DENSE_DENSITY_THRESHOLD = 0.25
+DENSE_MAX_NODES = 5000
+
+
+class IndexedMinHeap:
+    """
+    Binary min-heap over items 0..n-1 with a position index.
+    
+    Each item appears at most once, and its key can be lowered in place
+    (decrease-key), so the heap size is bounded by the number of items.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty indexed heap.
+        
+        Args:
+            capacity: Number of items (items are 0..capacity-1)
+        """
+        self.heap: List[int] = []
+        self.keys: List[float] = [float('inf')] * capacity
+        self.position: List[int] = [-1] * capacity
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def __contains__(self, item: int) -> bool:
+        return self.position[item] >= 0
+    
+    def push(self, item: int, key: float):
+        """
+        Insert an item, or decrease its key if it is already in the heap.
+        
+        Args:
+            item: Item to insert
+            key: New key (ignored if not lower than the current key)
+        """
+        if self.position[item] < 0:
+            self.keys[item] = key
+            self.heap.append(item)
+            self.position[item] = len(self.heap) - 1
+            self._sift_up(len(self.heap) - 1)
+        elif key < self.keys[item]:
+            self.keys[item] = key
+            self._sift_up(self.position[item])
+    
+    def pop(self) -> Tuple[int, float]:
+        """
+        Remove and return the item with the smallest key.
+        
+        Returns:
+            Tuple of (item, key)
+        """
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.position[top] = -1
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+    
+    def _sift_up(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if keys[parent] <= key:
+                break
+            heap[index] = parent
+            position[parent] = index
+            index = parent_index
+        heap[index] = item
+        position[item] = index
+    
+    def _sift_down(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and keys[heap[right_index]] < keys[heap[child_index]]:
+                child_index = right_index
+            child = heap[child_index]
+            if keys[child] >= key:
+                break
+            heap[index] = child
+            position[child] = index
+            index = child_index
+        heap[index] = item
+        position[item] = index
+
+
+def _prim_dense(weights: np.ndarray, start_idx: int) -> List[Tuple[int, int]]:
+    """
+    O(V^2) Prim's algorithm on a dense weight matrix.
+    
+    Args:
+        weights: Symmetric (n, n) weight matrix, inf where there is no edge
+        start_idx: Row of the starting node
+        
+    Returns:
+        List of (parent_row, child_row) pairs in the order they join the tree
+    """
+    num_nodes = weights.shape[0]
+    in_tree = np.zeros(num_nodes, dtype=bool)
+    in_tree[start_idx] = True
+    key = weights[start_idx].copy()
+    key[start_idx] = np.inf
+    parent = np.full(num_nodes, start_idx, dtype=np.int64)
+    tree = []
+    
+    for _ in range(num_nodes - 1):
+        child = int(np.argmin(key))
+        if key[child] == np.inf:
+            break  # Remaining nodes are not reachable from the start node
+        tree.append((int(parent[child]), child))
+        in_tree[child] = True
+        key[child] = np.inf
+        
+        # Relax all edges out of the new tree node in one array operation
+        row = weights[child]
+        closer = (row < key) & ~in_tree
+        key[closer] = row[closer]
+        parent[closer] = child
+    
+    return tree
+
 
 class PrimMST:
     """
@@ -23,6 +169,36 @@ class PrimMST:
         self.nodes: Set[int] = set()
         self.edge_info: Dict[Tuple[int, int], Tuple[int, float]] = {}
         self.node_coordinates: Dict[int, Tuple[float, float]] = {}
+        self.edge_store: Optional[EdgeStore] = None
+        self.distance_matrix: Optional[np.ndarray] = None
+        self.matrix_node_ids: Optional[np.ndarray] = None
+        self._graph_store: Optional[EdgeStore] = None
+        # Seconds spent in each phase of the last find_mst call
+        self.phase_times: Dict[str, float] = {}
+        # Run and phase duration histograms across find_mst calls
+        self.metrics = MetricsRegistry(engine="prim")
+    
+    def load_edge_store(self, edge_store: EdgeStore):
+        """
+        Use a columnar edge store instead of per-edge adjacency lists.
+        
+        Once loaded, find_mst runs directly on the store's CSR adjacency.
+        
+        Args:
+            edge_store: EdgeStore holding the graph edges
+        """
+        self.edge_store = edge_store
+    
+    def get_total_nodes(self) -> int:
+        """
+        Get the total number of nodes in the graph.
+        
+        Returns:
+            Number of nodes
+        """
+        if self.edge_store is not None:
+            return self.edge_store.num_nodes
+        return len(self.nodes)
     
     def add_edge(self, edge_id: int, start_node: int, end_node: int, 
                  distance: float, x_coord: float, y_coord: float):
@@ -37,6 +213,8 @@ class PrimMST:
             x_coord: X coordinate of start node
             y_coord: Y coordinate of start node
         """
+        self._graph_store = None
+        
         # Add edge in both directions (undirected graph)
         self.graph[start_node].append((end_node, edge_id, distance))
         self.graph[end_node].append((start_node, edge_id, distance))
@@ -53,12 +231,18 @@ class PrimMST:
         if start_node not in self.node_coordinates:
             self.node_coordinates[start_node] = (x_coord, y_coord)
     
-    def find_mst(self, start_node: int = None) -> Tuple[List[Tuple], float, float]:
+    def find_mst(self, start_node: int = None,
+                 mode: str = "auto") -> Tuple[List[Tuple], float, float]:
         """
         Find the Minimum Spanning Tree using Prim's algorithm.
         
         Args:
             start_node: Starting node for MST construction (defaults to smallest node)
+            mode: Priority queue strategy:
+                - "lazy": binary heap with one entry per adjacent edge (O(E) heap)
+                - "indexed": indexed heap with decrease-key (heap bounded by V)
+                - "dense": O(V^2) array scan, best for dense / complete graphs
+                - "auto": "dense" for dense graphs, otherwise "indexed"
             
         Returns:
             Tuple containing:
@@ -66,7 +250,24 @@ class PrimMST:
                 - Total distance of MST
                 - Execution time in seconds
         """
-        start_time = time.time()
+        if mode not in PRIM_MODES:
+            raise ValueError(f"Unknown Prim mode '{mode}', expected one of {PRIM_MODES}")
+        
+        if self.distance_matrix is not None:
+            return self._find_mst_dense_matrix(start_node)
+        
+        if self.edge_store is None and mode != "lazy":
+            # Run the array-based modes on a CSR copy of the adjacency lists;
+            # the copy is made once and its cost is timed as part of "build"
+            start_time = time.perf_counter()
+            if self._graph_store is None:
+                self._graph_store = self._build_graph_store()
+            return self._find_mst_arrays(self._graph_store, start_node, mode, start_time)
+        
+        if self.edge_store is not None:
+            return self._find_mst_arrays(self.edge_store, start_node, mode)
+        
+        start_time = time.perf_counter()
         
         if start_node is None:
             start_node = min(self.nodes)
@@ -98,7 +299,279 @@ class PrimMST:
                     heapq.heappush(pq, (neighbor_distance, neighbor, 
                                        current_node, neighbor_edge_id))
         
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
+        self.phase_times = {"build": 0.0, "search": execution_time, "output": 0.0}
+        self.metrics.record_run(execution_time, self.phase_times)
+        
+        return mst_edges, total_distance, execution_time
+    
+    def choose_mode(self, edge_store: EdgeStore) -> str:
+        """
+        Pick the Prim mode for "auto" based on graph density.
+        
+        Args:
+            edge_store: EdgeStore holding the graph edges
+            
+        Returns:
+            "dense" for dense graphs small enough for a V x V matrix, else "indexed"
+        """
+        num_nodes = edge_store.num_nodes
+        if num_nodes < 2 or num_nodes > DENSE_MAX_NODES:
+            return "indexed"
+        density = edge_store.num_edges / (num_nodes * (num_nodes - 1) / 2)
+        return "dense" if density >= DENSE_DENSITY_THRESHOLD else "indexed"
+    
+    def _build_graph_store(self) -> EdgeStore:
+        """
+        Convert the adjacency lists built by add_edge into an EdgeStore.
+        
+        Returns:
+            EdgeStore with one row per add_edge call
+        """
+        edge_ids, starts, ends, distances = [], [], [], []
+        for node, adjacent in self.graph.items():
+            for neighbor, edge_id, distance in adjacent:
+                # Each add_edge stored the edge once per direction; keep one
+                # (self-loops never belong to an MST and are dropped)
+                if node < neighbor:
+                    edge_ids.append(edge_id)
+                    starts.append(node)
+                    ends.append(neighbor)
+                    distances.append(distance)
+        return EdgeStore(np.array(edge_ids, dtype=np.int64), np.array(starts, dtype=np.int64),
+                         np.array(ends, dtype=np.int64), np.array(distances, dtype=np.float64))
+    
+    def _find_mst_arrays(self, store: EdgeStore, start_node: int = None,
+                         mode: str = "auto",
+                         start_time: float = None) -> Tuple[List[Tuple], float, float]:
+        """
+        Prim's algorithm over the CSR adjacency of an edge store.
+        
+        Args:
+            store: EdgeStore holding the graph edges
+            start_node: Starting node for MST construction (defaults to smallest node)
+            mode: Priority queue strategy (see find_mst)
+            start_time: perf_counter value the timing starts from (defaults to
+                now), so that preparing the store can be counted as build time
+            
+        Returns:
+            Same tuple as find_mst
+        """
+        if start_time is None:
+            start_time = time.perf_counter()
+        num_nodes = store.num_nodes
+        if num_nodes == 0:
+            return [], 0.0, time.perf_counter() - start_time
+        
+        # Dense index of the start node (node_ids is sorted)
+        start_idx = 0
+        if start_node is not None:
+            start_idx = int(store.node_ids.searchsorted(start_node))
+            if start_idx >= num_nodes or store.node_ids[start_idx] != start_node:
+                raise ValueError(f"Start node {start_node} is not in the graph")
+        
+        if mode == "auto":
+            mode = self.choose_mode(store)
+        
+        if mode == "dense":
+            weights, positions = self._dense_matrices(store)
+            build_time = time.perf_counter()
+            tree = _prim_dense(weights, start_idx)
+            search_time = time.perf_counter()
+            mst_edges = [(int(store.edge_id[positions[parent, child]]),
+                          int(store.node_ids[parent]), int(store.node_ids[child]),
+                          float(weights[parent, child]))
+                         for parent, child in tree]
+        else:
+            store.build_csr()  # Cached on the store after the first call
+            build_time = time.perf_counter()
+            if mode == "indexed":
+                mst_edges = self._prim_indexed(store, start_idx)
+            else:
+                mst_edges = self._prim_lazy(store, start_idx)
+            search_time = time.perf_counter()
+        
+        total_distance = sum(edge[3] for edge in mst_edges)
+        end_time = time.perf_counter()
+        execution_time = end_time - start_time
+        self.phase_times = {"build": build_time - start_time,
+                            "search": search_time - build_time,
+                            "output": end_time - search_time}
+        self.metrics.record_run(execution_time, self.phase_times)
+        
+        return mst_edges, total_distance, execution_time
+    
+    def _prim_lazy(self, store: EdgeStore, start_idx: int) -> List[Tuple]:
+        """
+        Lazy-heap Prim's algorithm over CSR arrays (heap may grow to O(E)).
+        
+        Args:
+            store: EdgeStore holding the graph edges
+            start_idx: Dense index of the starting node
+            
+        Returns:
+            List of edges in MST (edge_id, start_node, end_node, distance)
+        """
+        num_nodes = store.num_nodes
+        indptr, neighbors, weights, edge_pos = (array.tolist() for array in store.build_csr())
+        
+        # Priority queue: (distance, current_node, parent_node, edge_position)
+        pq = [(0, start_idx, -1, -1)]
+        visited = [False] * num_nodes
+        num_visited = 0
+        mst_edges: List[Tuple] = []
+        
+        while pq and num_visited < num_nodes:
+            distance, current, parent, position = heapq.heappop(pq)
+            
+            if visited[current]:
+                continue
+            
+            visited[current] = True
+            num_visited += 1
+            
+            if parent >= 0:
+                mst_edges.append((int(store.edge_id[position]),
+                                  int(store.node_ids[parent]),
+                                  int(store.node_ids[current]), distance))
+            
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[k]
+                if not visited[neighbor]:
+                    heapq.heappush(pq, (weights[k], neighbor, current, edge_pos[k]))
+        
+        return mst_edges
+    
+    def _prim_indexed(self, store: EdgeStore, start_idx: int) -> List[Tuple]:
+        """
+        Prim's algorithm with an indexed heap and true decrease-key.
+        
+        Each node is in the heap at most once, keyed by its cheapest known
+        connecting edge, so the heap never holds more than V entries.
+        
+        Args:
+            store: EdgeStore holding the graph edges
+            start_idx: Dense index of the starting node
+            
+        Returns:
+            List of edges in MST (edge_id, start_node, end_node, distance)
+        """
+        num_nodes = store.num_nodes
+        indptr, neighbors, weights, edge_pos = (array.tolist() for array in store.build_csr())
+        
+        heap = IndexedMinHeap(num_nodes)
+        keys = heap.keys
+        parent = [-1] * num_nodes
+        best_edge = [-1] * num_nodes
+        in_tree = [False] * num_nodes
+        mst_edges: List[Tuple] = []
+        
+        heap.push(start_idx, 0.0)
+        
+        while heap:
+            current, distance = heap.pop()
+            in_tree[current] = True
+            
+            if parent[current] >= 0:
+                mst_edges.append((int(store.edge_id[best_edge[current]]),
+                                  int(store.node_ids[parent[current]]),
+                                  int(store.node_ids[current]), distance))
+            
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = neighbors[k]
+                if not in_tree[neighbor] and weights[k] < keys[neighbor]:
+                    heap.push(neighbor, weights[k])
+                    parent[neighbor] = current
+                    best_edge[neighbor] = edge_pos[k]
+        
+        return mst_edges
+    
+    def _dense_matrices(self, store: EdgeStore) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build V x V weight and edge-position matrices for dense mode.
+        
+        Parallel edges keep the lightest one (ties go to the earliest row).
+        
+        Args:
+            store: EdgeStore holding the graph edges
+            
+        Returns:
+            Tuple of (weights, positions); missing edges have weight inf
+        """
+        num_nodes = store.num_nodes
+        low = np.minimum(store.src_index, store.dst_index)
+        high = np.maximum(store.src_index, store.dst_index)
+        
+        weights = np.full((num_nodes, num_nodes), np.inf)
+        np.minimum.at(weights, (low, high), store.distance)
+        np.fill_diagonal(weights, np.inf)
+        
+        # Among the lightest parallel edges, keep the earliest row
+        lightest = np.flatnonzero(store.distance == weights[low, high])
+        index_dtype = np.int32 if store.num_edges < 2 ** 31 else np.int64
+        positions = np.full((num_nodes, num_nodes), np.iinfo(index_dtype).max,
+                            dtype=index_dtype)
+        np.minimum.at(positions, (low[lightest], high[lightest]),
+                      lightest.astype(index_dtype))
+        
+        # Mirror the upper triangle so rows can be scanned in either direction
+        upper = np.triu_indices(num_nodes, k=1)
+        weights.T[upper] = weights[upper]
+        positions.T[upper] = positions[upper]
+        return weights, positions
+    
+    def load_distance_matrix(self, matrix: np.ndarray, node_ids: List[int] = None):
+        """
+        Use an all-pairs distance matrix as a complete graph.
+        
+        find_mst always runs in dense mode on a loaded matrix. The edge ID
+        reported for the edge between matrix rows i < j is i * n + j.
+        
+        Args:
+            matrix: Symmetric (n, n) distance matrix (inf marks a missing edge)
+            node_ids: Node ID of each row (defaults to 0..n-1)
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Distance matrix must be square")
+        if node_ids is None:
+            node_ids = np.arange(matrix.shape[0])
+        self.distance_matrix = matrix
+        self.matrix_node_ids = np.asarray(node_ids, dtype=np.int64)
+        self.nodes = set(self.matrix_node_ids.tolist())
+    
+    def _find_mst_dense_matrix(self, start_node: int = None) -> Tuple[List[Tuple], float, float]:
+        """
+        Dense-mode Prim's algorithm on a loaded distance matrix.
+        
+        Args:
+            start_node: Starting node for MST construction (defaults to first row)
+            
+        Returns:
+            Same tuple as find_mst
+        """
+        start_time = time.perf_counter()
+        matrix = self.distance_matrix
+        node_ids = self.matrix_node_ids
+        num_nodes = matrix.shape[0]
+        
+        start_idx = 0
+        if start_node is not None:
+            matches = np.flatnonzero(node_ids == start_node)
+            if len(matches) == 0:
+                raise ValueError(f"Start node {start_node} is not in the graph")
+            start_idx = int(matches[0])
+        
+        mst_edges = []
+        for parent, child in _prim_dense(matrix, start_idx):
+            low, high = min(parent, child), max(parent, child)
+            mst_edges.append((low * num_nodes + high, int(node_ids[parent]),
+                              int(node_ids[child]), float(matrix[parent, child])))
+        
+        total_distance = sum(edge[3] for edge in mst_edges)
+        execution_time = time.perf_counter() - start_time
+        self.phase_times = {"build": 0.0, "search": execution_time, "output": 0.0}
+        self.metrics.record_run(execution_time, self.phase_times)
         
         return mst_edges, total_distance, execution_time
     
@@ -123,7 +596,7 @@ class PrimMST:
             print(f"{edge_id:<10} {start_node:<8} {end_node:<8} {distance:<15.2f}")
         
         print("-" * 80)
-        print(f"\nTotal Number of Nodes: {len(self.nodes)}")
+        print(f"\nTotal Number of Nodes: {self.get_total_nodes()}")
         print(f"Total Number of Roads (Edges in MST): {len(mst_edges)}")
         print(f"Total Network Distance: {total_distance:.2f} units")
         print(f"Execution Time: {execution_time:.6f} seconds")
@@ -136,6 +609,11 @@ class PrimMST:
         Returns:
             Number of unique edges
         """
+        if self.edge_store is not None:
+            store = self.edge_store
+            low = np.minimum(store.src_index, store.dst_index).astype(np.int64)
+            high = np.maximum(store.src_index, store.dst_index).astype(np.int64)
+            return len(np.unique(low * store.num_nodes + high))
         return len(self.edge_info)
 
 
@@ -178,6 +656,21 @@ def load_delhi_city_data() -> PrimMST:
     return prim
 
 
+def load_edge_file(path: str) -> PrimMST:
+    """
+    Bulk-load a road network edge table from a .csv, .npy or .npz file.
+    
+    Args:
+        path: Path to the edge table
+        
+    Returns:
+        PrimMST object backed by a columnar edge store
+    """
+    prim = PrimMST()
+    prim.load_edge_store(EdgeStore.load(path))
+    return prim
+
+
 def main():
     """
     Main function to demonstrate Prim's algorithm on Delhi City network.
@@ -0,0 +1,111 @@
+"""
+WOA7001 Group Project - Startup Budget
+Cold-Start Import Time of the Scheduling and Routing Modules
+
+measure_import_time / check_import_budget time a module's cold import in a
+fresh interpreter and report whether pandas or numpy came in with it; the
+scheduling and routing CLIs expose this as their startup-check subcommand,
+and test_startup.py holds their LIGHT_MODULES to the budget.
+
+    python startup_check.py problem2_routing problem1_online
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable
+
+
+# Cold-start budget of the importable engine modules (see check_import_budget):
+# importing one must not load these, and should take at most this long
+HEAVY_MODULES = ("pandas", "numpy")
+IMPORT_TARGET_MS = 50.0
+
+
+def measure_import_time(module: str, runs: int = 5,
+                        heavy_modules: Iterable[str] = HEAVY_MODULES) -> Dict:
+    """
+    Measure the cold-start import time of a module.
+
+    Every run imports the module in a fresh interpreter (nothing cached in
+    sys.modules), started in this file's directory so sibling modules are
+    found, and times the import statement alone with perf_counter. An
+    untimed first run writes the bytecode caches, as a deployed install
+    would have them.
+
+    Args:
+        module: Module name
+        runs: Number of fresh interpreters
+        heavy_modules: Modules to report when the import pulls them in
+
+    Returns:
+        {"module", "runs", "median_ms", "min_ms", "max_ms", "heavy_modules_loaded"}
+    """
+    probe = ("import sys, time\n"
+             "start = time.perf_counter()\n"
+             f"import {module}\n"
+             "elapsed = (time.perf_counter() - start) * 1000\n"
+             f"print(elapsed, *[name for name in {list(heavy_modules)!r} if name in sys.modules])\n")
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    timings = []
+    loaded = set()
+    for run in range(runs + 1):
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        fields = result.stdout.split()
+        if run > 0:
+            timings.append(float(fields[0]))
+        loaded.update(fields[1:])
+    timings.sort()
+    return {"module": module, "runs": runs, "median_ms": timings[len(timings) // 2],
+            "min_ms": timings[0], "max_ms": timings[-1],
+            "heavy_modules_loaded": sorted(loaded)}
+
+
+def check_import_budget(modules: Iterable[str], target_ms: float = IMPORT_TARGET_MS,
+                        runs: int = 5) -> bool:
+    """
+    Print the cold-start import time of each module against a target.
+
+    A module fails when its median import time exceeds target_ms or when
+    importing it loads one of HEAVY_MODULES.
+
+    Args:
+        modules: Module names
+        target_ms: Import time budget per module
+        runs: Fresh interpreters per module
+
+    Returns:
+        True if every module is within budget
+    """
+    passed = True
+    print(f"{'Module':<34} {'Median (ms)':>12} {'Max (ms)':>10}  Heavy modules")
+    for module in modules:
+        timing = measure_import_time(module, runs)
+        ok = timing["median_ms"] <= target_ms and not timing["heavy_modules_loaded"]
+        passed = passed and ok
+        print(f"{module:<34} {timing['median_ms']:>12.1f} {timing['max_ms']:>10.1f}  "
+              f"{', '.join(timing['heavy_modules_loaded']) or '-'}{'' if ok else '  FAIL'}")
+    print(f"Target: {target_ms:.0f} ms, no {' / '.join(HEAVY_MODULES)}: {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Exit status: 0 if every module is within budget, else 1
+    """
+    parser = argparse.ArgumentParser(description="Cold-start import time check")
+    parser.add_argument("modules", nargs="+", help="module names to import")
+    parser.add_argument("--target-ms", type=float, default=IMPORT_TARGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    return 0 if check_import_budget(args.modules, args.target_ms, args.runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""
+WOA7001 Group Project - Min-Cost Flow Scheduler Tests
+
+    python -m pytest test_problem1_flow.py
+"""
+
+from problem1_flow import flow_schedule
+from problem1_scheduling import make_synthetic_hospital
+
+
+def test_room_id_listed_under_two_room_types_counts_once():
+    # Room 1002 is listed as a Pediatrics room and as an ICU on Monday /
+    # Tuesday mornings; the optimum (found by exhaustive search) is 3
+    patients, staff, rooms = make_synthetic_hospital(4, 2, 3, seed=353)
+    rooms[0]["room_id"] = rooms[2]["room_id"]
+
+    schedule, unscheduled = flow_schedule(patients, staff, rooms)
+
+    assert len(schedule) == 3 and len(unscheduled) == 1
+    room_slots = [(row["room_id"], row["day"], row["shift"]) for row in schedule]
+    assert len(set(room_slots)) == len(room_slots)
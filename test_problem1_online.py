@@ -0,0 +1,84 @@
+"""
+WOA7001 Group Project - Online Scheduler Tests
+
+Regression tests for OnlineScheduler's local repair and waitlist.
+
+    python -m pytest test_problem1_online.py
+"""
+
+import json
+
+import problem1_scheduling
+from problem1_online import OnlineScheduler
+
+MONDAY_MORNING = {"available_days": ["Monday"], "shift": "Morning"}
+
+
+def _patient(patient_id, specialty):
+    return {"patient_id": patient_id, "name": f"Patient {patient_id}", "required_specialty": specialty}
+
+
+def _assert_valid(scheduler):
+    staff_slots = [(row["staff_name"], row["day"], row["shift"]) for row in scheduler.get_schedule()]
+    room_slots = [(row["room_id"], row["day"], row["shift"]) for row in scheduler.get_schedule()]
+    assert len(set(staff_slots)) == len(staff_slots)
+    assert len(set(room_slots)) == len(room_slots)
+
+
+def test_repair_with_staff_name_shared_by_two_specialties():
+    # Dr X works Cardiology and (from the update on) Surgery. The Cardiology
+    # newcomer needs room 1, held by a Surgery patient, whose only ready cell
+    # is the same Monday morning: the move must not take Dr X
+    staff = [
+        {"staff_id": 1, "name": "Dr X", "specialty": "Cardiology", "available_days": ["Monday"]},
+        {"staff_id": 2, "name": "Dr X", "specialty": "Surgery", "available_days": []},
+        {"staff_id": 3, "name": "Dr Y", "specialty": "Surgery", "available_days": ["Monday"]},
+        {"staff_id": 4, "name": "Dr Z", "specialty": "Surgery", "available_days": ["Monday"]},
+    ]
+    rooms = [
+        dict(MONDAY_MORNING, room_id=1, room_type="Shared", supported_specialties=["Cardiology", "Surgery"]),
+        dict(MONDAY_MORNING, room_id=2, room_type="Surgical Room", supported_specialties=["Surgery"]),
+    ]
+    scheduler = OnlineScheduler(staff, rooms)
+    scheduler.admit(_patient("S1", "Surgery"))
+    scheduler.admit(_patient("S2", "Surgery"))
+    scheduler.cancel(next(row["patient_id"] for row in scheduler.get_schedule() if row["room_id"] == 2))
+    scheduler.add_staff_availability(2, "Monday")
+
+    changes = scheduler.admit(_patient("C1", "Cardiology"))
+
+    assert changes[-1]["patient_id"] == "C1"
+    assert changes[-1]["staff_name"] == "Dr X" and changes[-1]["room_id"] == 1
+    assert scheduler.stats["moves"] == 1
+    _assert_valid(scheduler)
+
+
+def test_readmit_after_cancelling_a_waiting_patient():
+    scheduler = OnlineScheduler([], [])
+    scheduler.admit(_patient("X", "Cardiology"))
+    scheduler.cancel("X")
+    scheduler.admit(_patient("X", "Cardiology"))
+
+    assert scheduler.get_unscheduled() == ["X"]
+    assert scheduler.stats["cancelled"] == 1
+
+
+def test_cli_reports_a_bad_event_and_continues(tmp_path, capsys):
+    hospital = tmp_path / "hospital.json"
+    hospital.write_text(json.dumps({
+        "patients": [],
+        "staff": [{"staff_id": 1, "name": "Dr A", "specialty": "Cardiology", "available_days": ["Monday"]}],
+        "rooms": [dict(MONDAY_MORNING, room_id=1, room_type="ICU")],
+    }))
+    events = tmp_path / "events.jsonl"
+    events.write_text("\n".join(json.dumps(event) for event in [
+        {"event": "cancel", "patient_id": "P9"},
+        {"event": "admit", "patient": _patient("P1", "Cardiology")},
+    ]))
+
+    assert problem1_scheduling.main(["online", str(hospital), str(events)]) == 0
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert lines[0] == {"event": "cancel", "patient_id": "P9", "error": "unknown id 'P9'"}
+    assert lines[1]["patient_id"] == "P1" and lines[1]["changes"][-1]["staff_name"] == "Dr A"
+    assert lines[2]["stats"]["admitted"] == 1
@@ -0,0 +1,20 @@
+"""
+WOA7001 Group Project - Compact Graph Tests
+
+    python -m pytest test_problem2_compact_graph.py
+"""
+
+from problem2_compact_graph import CompactLoadBalancer, CompactNetworkGraph
+from problem2_routing import NetworkGraph, NetworkNode
+
+
+def test_from_graph_lists_links_in_both_directions():
+    # A lists B and B lists C, nothing is listed back
+    graph = NetworkGraph()
+    for node_id, connected in [('A', ['B']), ('B', ['C']), ('C', [])]:
+        graph.add_node(NetworkNode(node_id, node_id, connected, 'Medium', 'Good'))
+    compact = CompactNetworkGraph.from_graph(graph)
+
+    assert compact.get_edge('B', 'A') is not None and compact.get_edge('C', 'B') is not None
+    assert CompactLoadBalancer(compact).find_static_best_path('A', 'C')[0] == ['A', 'B', 'C']
+    assert CompactLoadBalancer(compact).find_static_best_path('C', 'A')[0] == ['C', 'B', 'A']
@@ -0,0 +1,34 @@
+"""
+WOA7001 Group Project - Packet Simulation Tests
+
+PacketSimulationEngine against the per-packet loop of
+DynamicLoadBalancerComparative.simulate_dynamic_routing.
+
+    python -m pytest test_problem2_packet_simulation.py
+"""
+
+import contextlib
+import io
+
+from problem2_packet_simulation import PacketSimulationEngine
+from problem2_routing import DynamicLoadBalancerComparative, create_random_network
+
+
+def _live_traffic(load_balancer):
+    return {node: count for node, count in load_balancer.node_traffic.items() if count}
+
+
+def test_consecutive_single_flow_runs_match_the_loop():
+    # The second run starts from the traffic the first one left behind,
+    # including nodes whose traffic has decayed back to zero
+    graph = create_random_network(30, seed=1)
+    loop = DynamicLoadBalancerComparative(graph, k_paths=3)
+    engine = PacketSimulationEngine(DynamicLoadBalancerComparative(graph, k_paths=3))
+
+    for start, end, num_packets in [('000004', '000018', 28), ('000025', '000024', 3), ('000008', '000003', 16)]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = loop.simulate_dynamic_routing(start, end, num_packets=num_packets)
+        result = engine.simulate([(start, end)], num_packets=num_packets)
+
+        assert result['path_counts'][0, :len(result['paths'][0])].tolist() == expected['path_counts']
+        assert _live_traffic(engine.load_balancer) == _live_traffic(loop)
@@ -0,0 +1,26 @@
+"""
+WOA7001 Group Project - Network Routing Tests
+
+    python -m pytest test_problem2_routing.py
+"""
+
+from problem2_routing import DynamicLoadBalancerComparative, MultiFactorAStarRouter, NetworkGraph, NetworkNode
+
+
+def _one_way_network():
+    # A lists B and B lists C, nothing is listed back (as load_network may read it)
+    graph = NetworkGraph()
+    for node_id, connected in [('A', ['B']), ('B', ['C']), ('C', [])]:
+        graph.add_node(NetworkNode(node_id, node_id, connected, 'Medium', 'Good'))
+    graph.build_edges()
+    return graph
+
+
+def test_load_balancer_follows_links_listed_by_one_node():
+    graph = _one_way_network()
+    expected_path, expected_cost, _ = MultiFactorAStarRouter(graph).find_path('A', 'C')
+    path, cost, _ = DynamicLoadBalancerComparative(graph).find_static_best_path('A', 'C')
+
+    assert expected_path == ['A', 'B', 'C']
+    assert (path, cost) == (expected_path, expected_cost)
+    assert DynamicLoadBalancerComparative(graph).find_static_best_path('C', 'A')[0] == ['C', 'B', 'A']
@@ -0,0 +1,34 @@
+"""
+WOA7001 Group Project - Startup Budget Tests
+
+Cold-start imports of the scheduling and routing CLI modules must never
+load pandas / NumPy. Their import time is held to IMPORT_TARGET_MS with a
+margin for slow or busy machines; set STARTUP_BUDGET_MS to change the limit
+(0 skips the timing check).
+
+    python -m pytest test_startup.py
+"""
+
+import os
+
+import problem1_scheduling
+import problem2_routing
+from startup_check import IMPORT_TARGET_MS, measure_import_time
+
+BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 4 * IMPORT_TARGET_MS))
+
+
+def _check_modules(modules):
+    for module in modules:
+        timing = measure_import_time(module, runs=3)
+        assert timing["heavy_modules_loaded"] == [], module
+        if BUDGET_MS > 0:
+            assert timing["median_ms"] <= BUDGET_MS, timing
+
+
+def test_scheduling_modules_import_within_budget():
+    _check_modules(problem1_scheduling.LIGHT_MODULES)
+
+
+def test_routing_modules_import_within_budget():
+    _check_modules(problem2_routing.LIGHT_MODULES)